@@ -1,51 +0,0 @@
-from random import random
-from time import time
-
-from fontgeometry.beziertools import getPointOnCubic
-from fontgeometry.geometry import intersect
-
-
-def random_point():
-    return (
-        (random() - 0.5) * 16384,
-        (random() - 0.5) * 16384,
-    )
-
-
-points = [
-    (
-        random_point(),
-        random_point(),
-        random_point(),
-        random_point(),
-    )
-    for _ in range(10000)
-]
-
-print("Doing 10000 intersections ...")
-
-start = time()
-for p0, p1, p2, p3 in points:
-    _result = intersect(p0, p1, p2, p3)
-stop = time()
-print("Time:", stop - start)
-
-
-print("Doing 10000 getPointOnCubic ...")
-
-t_points = [
-    (
-        random(),
-        random_point(),
-        random_point(),
-        random_point(),
-        random_point(),
-    )
-    for _ in range(10000)
-]
-
-start = time()
-for t, p0, p1, p2, p3 in t_points:
-    result = getPointOnCubic(t, p0, p1, p2, p3)
-stop = time()
-print("Time:", stop - start)
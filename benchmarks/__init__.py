@@ -0,0 +1,2 @@
+# Benchmarks for fontgeometry. Run with:
+#   python -m benchmarks --help
@@ -0,0 +1,57 @@
+import argparse
+import sys
+
+from benchmarks import suite  # noqa: F401 (registers the benchmarks)
+from benchmarks.runner import compare, load, run, save
+
+
+def main(args: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks", description="Run the fontgeometry benchmarks."
+    )
+    parser.add_argument("-k", "--filter", help="Only run benchmarks matching the regex")
+    parser.add_argument("-r", "--repeat", type=int, default=7, help="Repetitions")
+    parser.add_argument("-w", "--warmup", type=int, default=1, help="Warm-up runs")
+    parser.add_argument(
+        "--min-time",
+        type=float,
+        default=0.05,
+        help="Minimum time of one repetition in seconds",
+    )
+    parser.add_argument("-o", "--output", help="Save the results as JSON")
+    parser.add_argument("-b", "--baseline", help="Compare against saved JSON results")
+    parser.add_argument(
+        "-t",
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="Relative slowdown that counts as a regression (default: 0.1)",
+    )
+    options = parser.parse_args(args)
+
+    def progress(name: str, stats: dict) -> None:
+        print(
+            "%-45s %12.3f ms  (± %.3f ms)"
+            % (name, stats["median"] * 1000, stats["stdev"] * 1000)
+        )
+
+    results = run(
+        options.filter, options.repeat, options.warmup, options.min_time, progress
+    )
+    if options.output:
+        save(results, options.output)
+
+    if options.baseline:
+        regressions = compare(results, load(options.baseline), options.threshold)
+        for name, before, after, change in regressions:
+            print(
+                "REGRESSION %s: %.3f ms -> %.3f ms (%+.1f %%)"
+                % (name, before * 1000, after * 1000, change * 100)
+            )
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,84 @@
+from math import cos, pi, sin
+from random import Random
+
+# Seeded input data for the benchmarks, so results are comparable between runs.
+
+SEED = 20240501
+
+
+def random_point(rnd: Random, size: float = 16384) -> tuple[float, float]:
+    return (
+        (rnd.random() - 0.5) * size,
+        (rnd.random() - 0.5) * size,
+    )
+
+
+def random_cubics(
+    num: int, seed: int = SEED, size: float = 16384
+) -> list[tuple[tuple[float, float], ...]]:
+    rnd = Random(seed)
+    return [tuple(random_point(rnd, size) for _ in range(4)) for _ in range(num)]
+
+
+def random_ts(num: int, seed: int = SEED) -> list[float]:
+    rnd = Random(seed)
+    return [rnd.random() for _ in range(num)]
+
+
+def random_floats(num: int, seed: int = SEED, size: float = 2000) -> list[float]:
+    rnd = Random(seed)
+    return [(rnd.random() - 0.5) * size for _ in range(num)]
+
+
+def contour_segments(
+    rnd: Random, cx: float, cy: float, radius: float, num_nodes: int
+) -> list[list[tuple[float, float]]]:
+    # A closed, roughly circular contour of curves and some lines. The handle length
+    # factor is the one for a quarter circle, scaled to the angle between nodes.
+    k = 0.5522847498 * 4 / num_nodes
+    nodes = []
+    for i in range(num_nodes):
+        angle = 2 * pi * i / num_nodes
+        r = radius * (0.8 + 0.4 * rnd.random())
+        nodes.append((cx + r * cos(angle), cy + r * sin(angle), angle, r))
+    segments = []
+    for i in range(num_nodes):
+        x0, y0, a0, r0 = nodes[i]
+        x3, y3, a3, r3 = nodes[(i + 1) % num_nodes]
+        if rnd.random() < 0.2:
+            segments.append([(x0, y0), (x3, y3)])
+        else:
+            segments.append(
+                [
+                    (x0, y0),
+                    (x0 - k * r0 * sin(a0), y0 + k * r0 * cos(a0)),
+                    (x3 + k * r3 * sin(a3), y3 - k * r3 * cos(a3)),
+                    (x3, y3),
+                ]
+            )
+    return segments
+
+
+def synthetic_font(
+    num_glyphs: int, seed: int = SEED
+) -> list[list[list[tuple[float, float]]]]:
+    """
+    Return the segments of a synthetic font. Each glyph has one to three contours,
+    like a CubicSegments.segments list.
+    """
+    rnd = Random(seed)
+    glyphs = []
+    for _ in range(num_glyphs):
+        segments = []
+        for _ in range(rnd.randint(1, 3)):
+            segments.extend(
+                contour_segments(
+                    rnd,
+                    rnd.uniform(100, 500),
+                    rnd.uniform(0, 700),
+                    rnd.uniform(50, 300),
+                    rnd.randint(4, 12),
+                )
+            )
+        glyphs.append(segments)
+    return glyphs
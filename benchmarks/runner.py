@@ -0,0 +1,118 @@
+import json
+import os
+import platform
+import re
+import sys
+from contextlib import redirect_stdout
+from statistics import mean, median, stdev
+from time import perf_counter
+from typing import Any, Callable
+
+# A minimal benchmark runner. Each benchmark is a setup function that returns the
+# function to be timed. The timed function is run in a loop of `number` calls, after
+# warm-up, and the loop is repeated to collect statistics. Times are reported per call.
+
+Benchmark = Callable[[], Callable[[], Any]]
+
+registry: dict[str, Benchmark] = {}
+
+
+def benchmark(name: str) -> Callable[[Benchmark], Benchmark]:
+    # Register a benchmark setup function under a name
+    def register(setup: Benchmark) -> Benchmark:
+        if name in registry:
+            raise ValueError("Duplicate benchmark name: %s" % name)
+        registry[name] = setup
+        return setup
+
+    return register
+
+
+def autorange(func: Callable[[], Any], min_time: float = 0.05) -> int:
+    # Return the number of calls needed to take at least min_time seconds
+    number = 1
+    while True:
+        start = perf_counter()
+        for _ in range(number):
+            func()
+        if perf_counter() - start >= min_time:
+            return number
+        number *= 2
+
+
+def measure(
+    func: Callable[[], Any], repeat: int = 7, warmup: int = 1, min_time: float = 0.05
+) -> dict[str, Any]:
+    number = autorange(func, min_time)
+    for _ in range(warmup):
+        for _ in range(number):
+            func()
+    times = []
+    for _ in range(repeat):
+        start = perf_counter()
+        for _ in range(number):
+            func()
+        times.append((perf_counter() - start) / number)
+    return {
+        "number": number,
+        "repeat": repeat,
+        "min": min(times),
+        "median": median(times),
+        "mean": mean(times),
+        "stdev": stdev(times) if len(times) > 1 else 0.0,
+    }
+
+
+def run(
+    pattern: str | None = None,
+    repeat: int = 7,
+    warmup: int = 1,
+    min_time: float = 0.05,
+    progress: Callable[[str, dict[str, Any]], None] | None = None,
+) -> dict[str, Any]:
+    results = {}
+    for name, setup in registry.items():
+        if pattern is not None and not re.search(pattern, name):
+            continue
+        # Discard anything the benchmarked code prints, it would distort the timings
+        with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+            stats = measure(setup(), repeat, warmup, min_time)
+        results[name] = stats
+        if progress is not None:
+            progress(name, stats)
+    return {
+        "python": sys.version,
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "benchmarks": results,
+    }
+
+
+def compare(
+    results: dict[str, Any], baseline: dict[str, Any], threshold: float = 0.1
+) -> list[tuple[str, float, float, float]]:
+    """
+    Compare the median times of the results against a baseline. Return the
+    regressions, i.e. the benchmarks that are slower than the baseline by more than the
+    threshold, as tuples of name, baseline time, current time and relative change.
+    """
+    regressions = []
+    for name, stats in results["benchmarks"].items():
+        base = baseline["benchmarks"].get(name)
+        if base is None:
+            continue
+        change = stats["median"] / base["median"] - 1
+        if change > threshold:
+            regressions.append((name, base["median"], stats["median"], change))
+    return regressions
+
+
+def load(path: str) -> dict[str, Any]:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save(results: dict[str, Any], path: str) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+        f.write("\n")
@@ -0,0 +1,616 @@
+from typing import Any, Callable
+
+from benchmarks.corpus import (
+    random_cubics,
+    random_floats,
+    random_ts,
+    synthetic_font,
+)
+from benchmarks.runner import benchmark
+from fontgeometry import beziertools, ftbeziertools, geometry, rounding
+from fontgeometry.cubics import Cubic, Line, Quadratic, SuperCubic
+from fontgeometry.extract import CubicSegments
+from fontgeometry.intersections import cubic_segments_intersections, intersect_cubics
+from fontgeometry.prepared import PreparedCubic
+from fontgeometry.winding import WindingIndex
+
+# The benchmarks. Each one processes a fixed corpus, the reported time is for the
+# whole corpus.
+
+N = 1000
+
+cubics = random_cubics(N)
+ts = random_ts(N)
+floats = random_floats(N)
+
+
+# beziertools
+
+
+@benchmark("beziertools.getPointOnCubic")
+def bench_getPointOnCubic() -> Callable[[], Any]:
+    f = beziertools.getPointOnCubic
+    data = list(zip(ts, cubics))
+
+    def run() -> None:
+        for t, (p0, p1, p2, p3) in data:
+            f(t, p0, p1, p2, p3)
+
+    return run
+
+
+@benchmark("beziertools.getPointListForCubic")
+def bench_getPointListForCubic() -> Callable[[], Any]:
+    f = beziertools.getPointListForCubic
+    steps = [i / 32 for i in range(33)]
+
+    def run() -> None:
+        for p0, p1, p2, p3 in cubics:
+            f(steps, p0, p1, p2, p3)
+
+    return run
+
+
+@benchmark("beziertools.getPointListForQuadratic")
+def bench_getPointListForQuadratic() -> Callable[[], Any]:
+    f = beziertools.getPointListForQuadratic
+    steps = [i / 32 for i in range(33)]
+
+    def run() -> None:
+        for p0, p1, p2, _p3 in cubics:
+            f(steps, p0, p1, p2)
+
+    return run
+
+
+@benchmark("beziertools.estimateCubicCurveLength")
+def bench_estimateCubicCurveLength() -> Callable[[], Any]:
+    f = beziertools.estimateCubicCurveLength
+
+    def run() -> None:
+        for p0, p1, p2, p3 in cubics:
+            f(p0, p1, p2, p3)
+
+    return run
+
+
+@benchmark("beziertools.calculateCubicCurveLength")
+def bench_calculateCubicCurveLength() -> Callable[[], Any]:
+    f = beziertools.calculateCubicCurveLength
+
+    def run() -> None:
+        for p0, p1, p2, p3 in cubics:
+            f(p0, p1, p2, p3)
+
+    return run
+
+
+@benchmark("beziertools.getExtremaForCubic")
+def bench_getExtremaForCubic() -> Callable[[], Any]:
+    f = beziertools.getExtremaForCubic
+
+    def run() -> None:
+        for p0, p1, p2, p3 in cubics:
+            f(p0, p1, p2, p3, h=True, v=True)
+
+    return run
+
+
+@benchmark("beziertools.getExtremaForQuadratic")
+def bench_getExtremaForQuadratic() -> Callable[[], Any]:
+    f = beziertools.getExtremaForQuadratic
+
+    def run() -> None:
+        for p0, p1, p2, _p3 in cubics:
+            f(p0, p1, p2, h=True, v=True)
+
+    return run
+
+
+@benchmark("beziertools.getInflectionsForCubic")
+def bench_getInflectionsForCubic() -> Callable[[], Any]:
+    f = beziertools.getInflectionsForCubic
+
+    def run() -> None:
+        for p0, p1, p2, p3 in cubics:
+            f(p0, p1, p2, p3)
+
+    return run
+
+
+@benchmark("beziertools.getBoundsForCubic")
+def bench_getBoundsForCubic() -> Callable[[], Any]:
+    f = beziertools.getBoundsForCubic
+
+    def run() -> None:
+        for p0, p1, p2, p3 in cubics:
+            f(p0, p1, p2, p3)
+
+    return run
+
+
+@benchmark("beziertools.getMomentsForCubicParameters")
+def bench_getMomentsForCubicParameters() -> Callable[[], Any]:
+    f = beziertools.getMomentsForCubicParameters
+    params = [ftbeziertools.calcCubicParameters(*c) for c in cubics]
+
+    def run() -> None:
+        for p in params:
+            f(p)
+
+    return run
+
+
+# ftbeziertools
+
+
+@benchmark("ftbeziertools.calcCubicParameters")
+def bench_calcCubicParameters() -> Callable[[], Any]:
+    f = ftbeziertools.calcCubicParameters
+
+    def run() -> None:
+        for p0, p1, p2, p3 in cubics:
+            f(p0, p1, p2, p3)
+
+    return run
+
+
+@benchmark("ftbeziertools.solveQuadratic")
+def bench_solveQuadratic() -> Callable[[], Any]:
+    f = ftbeziertools.solveQuadratic
+    data = [(p0[0], p1[0], p2[0]) for p0, p1, p2, _p3 in cubics]
+
+    def run() -> None:
+        for a, b, c in data:
+            f(a, b, c)
+
+    return run
+
+
+@benchmark("ftbeziertools.solveCubic")
+def bench_solveCubic() -> Callable[[], Any]:
+    f = ftbeziertools.solveCubic
+    data = [(p0[0], p1[0], p2[0], p3[0]) for p0, p1, p2, p3 in cubics]
+
+    def run() -> None:
+        for a, b, c, d in data:
+            f(a, b, c, d)
+
+    return run
+
+
+# geometry
+
+
+@benchmark("geometry.intersect")
+def bench_intersect() -> Callable[[], Any]:
+    f = geometry.intersect
+
+    def run() -> None:
+        for p0, p1, p2, p3 in cubics:
+            f(p0, p1, p2, p3)
+
+    return run
+
+
+@benchmark("geometry.same_direction")
+def bench_same_direction() -> Callable[[], Any]:
+    f = geometry.same_direction
+
+    def run() -> None:
+        for p0, p1, p2, p3 in cubics:
+            f(p0, p1, p2, p3, p1)
+
+    return run
+
+
+@benchmark("geometry.distance_between_points")
+def bench_distance_between_points() -> Callable[[], Any]:
+    f = geometry.distance_between_points
+
+    def run() -> None:
+        for p0, p1, _p2, _p3 in cubics:
+            f(p0, p1)
+
+    return run
+
+
+@benchmark("geometry.half_point")
+def bench_half_point() -> Callable[[], Any]:
+    f = geometry.half_point
+
+    def run() -> None:
+        for p0, p1, _p2, _p3 in cubics:
+            f(p0, p1, do_round=True)
+
+    return run
+
+
+@benchmark("geometry.triangle_area")
+def bench_triangle_area() -> Callable[[], Any]:
+    f = geometry.triangle_area
+
+    def run() -> None:
+        for p0, p1, p2, _p3 in cubics:
+            f(p0, p1, p2)
+
+    return run
+
+
+# rounding
+
+
+@benchmark("rounding.round_hup")
+def bench_round_hup() -> Callable[[], Any]:
+    f = rounding.round_hup
+
+    def run() -> None:
+        for value in floats:
+            f(value)
+
+    return run
+
+
+@benchmark("rounding.round_points")
+def bench_round_points() -> Callable[[], Any]:
+    f = rounding.round_points
+    points = [p0 for p0, _p1, _p2, _p3 in cubics]
+
+    def run() -> None:
+        f(points)
+
+    return run
+
+
+# prepared
+
+
+@benchmark("prepared.PreparedCubic.point")
+def bench_prepared_point() -> Callable[[], Any]:
+    # The same points as beziertools.getPointOnCubic, with prepared cubics
+    data = [(t, PreparedCubic(*c)) for t, c in zip(ts, cubics)]
+
+    def run() -> None:
+        for t, c in data:
+            c.point(t)
+
+    return run
+
+
+@benchmark("prepared.PreparedCubic.points")
+def bench_prepared_points() -> Callable[[], Any]:
+    # The same points as beziertools.getPointListForCubic, with prepared cubics
+    data = [PreparedCubic(*c) for c in cubics]
+    steps = [i / 32 for i in range(33)]
+
+    def run() -> None:
+        for c in data:
+            c.points(steps)
+
+    return run
+
+
+# Cubic and SuperCubic
+
+
+def make_super_cubic() -> SuperCubic:
+    # A long, smooth super cubic from the synthetic font
+    sc = SuperCubic()
+    for segment in synthetic_font(1)[0]:
+        if len(segment) == 4:
+            sc.add_cubic_from_points(*segment)
+    return sc
+
+
+@benchmark("cubics.Cubic.cubic_points")
+def bench_cubic_points() -> Callable[[], Any]:
+    # The points are calculated at the raster length, so fewer but larger cubics
+    data = random_cubics(20, size=500)
+
+    def run() -> None:
+        for p0, p1, p2, p3 in data:
+            Cubic(p0, p1, p2, p3).cubic_points
+
+    return run
+
+
+@benchmark("cubics.Cubic.cubic_points_adaptive")
+def bench_cubic_points_adaptive() -> Callable[[], Any]:
+    # The same cubics as above, flattened to a tolerance instead of the raster length
+    data = random_cubics(20, size=500)
+
+    def run() -> None:
+        for p0, p1, p2, p3 in data:
+            Cubic(p0, p1, p2, p3, flatten_tolerance=0.1).cubic_points
+
+    return run
+
+
+@benchmark("cubics.Cubic.analysis")
+def bench_cubic_analysis() -> Callable[[], Any]:
+    def run() -> None:
+        for p0, p1, p2, p3 in cubics:
+            c = Cubic(p0, p1, p2, p3)
+            c.extremum_points
+            c.inflection_points
+            c.length
+
+    return run
+
+
+@benchmark("cubics.Line.analysis")
+def bench_line_analysis() -> Callable[[], Any]:
+    # The same work as above for the lines between the end points of the cubics
+    def run() -> None:
+        for p0, _p1, _p2, p3 in cubics:
+            c = Line(p0, p3)
+            c.extremum_points
+            c.inflection_points
+            c.length
+
+    return run
+
+
+@benchmark("cubics.Quadratic.analysis")
+def bench_quadratic_analysis() -> Callable[[], Any]:
+    def run() -> None:
+        for p0, p1, _p2, p3 in cubics:
+            c = Quadratic(p0, p1, p3)
+            c.extremum_points
+            c.inflection_points
+            c.length
+
+    return run
+
+
+@benchmark("cubics.Cubic.split_at_t")
+def bench_split_at_t() -> Callable[[], Any]:
+    data = [Cubic(*c) for c in cubics]
+
+    def run() -> None:
+        for c in data:
+            c.reset_split()
+            c.split_at_t(0.25)
+            c.split_at_t(0.5)
+            c.split_at_t(1.0)
+
+    return run
+
+
+@benchmark("cubics.Cubic.split_at_ts")
+def bench_split_at_ts() -> Callable[[], Any]:
+    # The same pieces as above, in one call
+    data = [Cubic(*c) for c in cubics]
+
+    def run() -> None:
+        for c in data:
+            c.split_at_ts((0.25, 0.5))
+
+    return run
+
+
+@benchmark("cubics.Cubic.t_at_length")
+def bench_t_at_length() -> Callable[[], Any]:
+    data = [Cubic(*c) for c in random_cubics(100, size=1000)]
+    for c in data:
+        c.length_table
+
+    def run() -> None:
+        for c in data:
+            c.t_at_length(c.length_table[-1] * 0.37)
+
+    return run
+
+
+def _split_points(sc: SuperCubic, num: int) -> list[tuple[float, float]]:
+    # Points along the super cubic, in order
+    return [
+        sc.cubics[index].get_cubic_point(t)
+        for index, t in (sc.t_at_length(sc.length * i / num) for i in range(1, num))
+    ]
+
+
+@benchmark("cubics.SuperCubic.calculate_t_for_point")
+def bench_calculate_t_for_point() -> Callable[[], Any]:
+    sc = make_super_cubic()
+    points = _split_points(sc, 10)
+
+    def run() -> None:
+        for pt in points:
+            sc.reset_split()
+            sc.calculate_t_for_point(pt)
+
+    return run
+
+
+@benchmark("cubics.SuperCubic.calculate_t_for_point_lines")
+def bench_calculate_t_for_point_lines() -> Callable[[], Any]:
+    # A polygon through the on-curve points of the super cubic above
+    curves = make_super_cubic()
+    sc = SuperCubic()
+    for c in curves.cubics:
+        sc.add_line_from_points(c.pt1, c.pt4)
+    points = _split_points(sc, 10)
+
+    def run() -> None:
+        for pt in points:
+            sc.reset_split()
+            sc.calculate_t_for_point(pt)
+
+    return run
+
+
+@benchmark("cubics.SuperCubic.project_point")
+def bench_project_point() -> Callable[[], Any]:
+    sc = make_super_cubic()
+    points = _split_points(sc, 10)
+
+    def run() -> None:
+        for pt in points:
+            sc.project_point(pt)
+
+    return run
+
+
+@benchmark("cubics.SuperCubic.split_at_pt")
+def bench_split_at_pt() -> Callable[[], Any]:
+    sc = make_super_cubic()
+    points = _split_points(sc, 10)
+
+    def run() -> None:
+        sc.reset_split()
+        sc.t_cache.clear()
+        for pt in points:
+            sc.split_at_pt(pt)
+        sc.split_remainder()
+
+    return run
+
+
+@benchmark("cubics.SuperCubic.split_at_pt_cached")
+def bench_split_at_pt_cached() -> Callable[[], Any]:
+    sc = make_super_cubic()
+    points = _split_points(sc, 10)
+
+    def run() -> None:
+        sc.reset_split()
+        for pt in points:
+            sc.split_at_pt(pt)
+        sc.split_remainder()
+
+    return run
+
+
+@benchmark("cubics.SuperCubic.split_at_pt_project")
+def bench_split_at_pt_project() -> Callable[[], Any]:
+    sc = make_super_cubic()
+    points = _split_points(sc, 10)
+
+    def run() -> None:
+        sc.reset_split()
+        for pt in points:
+            sc.split_at_pt(pt, project=True)
+        sc.split_remainder()
+
+    return run
+
+
+@benchmark("cubics.SuperCubic.split_at_points")
+def bench_split_at_points() -> Callable[[], Any]:
+    sc = make_super_cubic()
+    points = _split_points(sc, 10)
+
+    def run() -> None:
+        sc.split_at_points(points)
+
+    return run
+
+
+# intersections
+
+
+@benchmark("intersections.intersect_cubics")
+def bench_intersect_cubics() -> Callable[[], Any]:
+    data = [Cubic(*c) for c in random_cubics(100)]
+    pairs = list(zip(data[::2], data[1::2]))
+
+    def run() -> None:
+        for c1, c2 in pairs:
+            intersect_cubics(c1, c2)
+
+    return run
+
+
+# winding
+
+
+@benchmark("winding.WindingIndex.winding_numbers")
+def bench_winding_numbers() -> Callable[[], Any]:
+    # A grid of points over each glyph
+    glyphs = []
+    for segments in synthetic_font(20):
+        cs = CubicSegments(layer=None)
+        cs.segments = segments
+        cs.to_supercubics()
+        index = WindingIndex.from_cubic_segments(cs)
+        xMin, yMin, xMax, yMax = cs.bounds
+        points = [
+            (xMin + (xMax - xMin) * i / 9, yMin + (yMax - yMin) * j / 9)
+            for i in range(10)
+            for j in range(10)
+        ]
+        glyphs.append((index, points))
+
+    def run() -> None:
+        for index, points in glyphs:
+            index.winding_numbers(points)
+
+    return run
+
+
+# End to end
+
+
+@benchmark("font.to_supercubics")
+def bench_font_to_supercubics() -> Callable[[], Any]:
+    font = synthetic_font(100)
+
+    def run() -> None:
+        for segments in font:
+            cs = CubicSegments(layer=None)
+            cs.segments = segments
+            cs.to_supercubics()
+
+    return run
+
+
+@benchmark("font.analysis")
+def bench_font_analysis() -> Callable[[], Any]:
+    font = synthetic_font(100)
+
+    def run() -> None:
+        for segments in font:
+            cs = CubicSegments(layer=None)
+            cs.segments = segments
+            cs.to_supercubics()
+            for sc in cs.super_cubics:
+                sc.extremum_points
+                sc.inflection_points
+
+    return run
+
+
+@benchmark("font.area")
+def bench_font_area() -> Callable[[], Any]:
+    font = []
+    for segments in synthetic_font(100):
+        cs = CubicSegments(layer=None)
+        cs.segments = segments
+        cs.to_supercubics()
+        font.append(cs)
+
+    def run() -> None:
+        for cs in font:
+            for sc in cs.super_cubics:
+                for cubic in sc.cubics:
+                    cubic.__dict__.pop("moments", None)
+                sc.__dict__.pop("moments", None)
+            cs.centroid
+
+    return run
+
+
+@benchmark("font.intersections")
+def bench_font_intersections() -> Callable[[], Any]:
+    font = []
+    for segments in synthetic_font(20):
+        cs = CubicSegments(layer=None)
+        cs.segments = segments
+        cs.to_supercubics()
+        font.append(cs)
+
+    def run() -> None:
+        for cs in font:
+            cubic_segments_intersections(cs)
+
+    return run
@@ -0,0 +1,616 @@
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from fontgeometry.ftbeziertools import epsilon
+
+if TYPE_CHECKING:
+    from numpy.typing import ArrayLike, NDArray
+
+    FloatArray = NDArray[np.float64]
+
+# Vectorized helper functions operating on many curves at once.
+# The control points of N curves are passed as an array of shape (N, 4, 2) for cubics
+# or (N, 3, 2) for quadratics, i.e. [curve][point][x or y].
+#
+# This module requires NumPy, which can be installed with the optional "numpy" extra:
+#   pip install fontgeometry[numpy]
+
+
+def _as_control_points(ctrl: "ArrayLike", num_points: int) -> "FloatArray":
+    # Convert the control points to a float array and check its shape
+    arr = np.asarray(ctrl, dtype=np.float64)
+    if arr.ndim != 3 or arr.shape[1:] != (num_points, 2):
+        raise ValueError(
+            "Expected control points of shape (N, %i, 2), got %s"
+            % (num_points, arr.shape)
+        )
+    return arr
+
+
+def _as_coefficients(*coefficients: "ArrayLike") -> "list[FloatArray]":
+    # Convert the polynomial coefficients to float arrays of the same shape (N,)
+    arrs = np.broadcast_arrays(*[np.asarray(c, dtype=np.float64) for c in coefficients])
+    if arrs[0].ndim != 1:
+        raise ValueError(
+            "Expected coefficients of shape (N,), got %s" % (arrs[0].shape,)
+        )
+    return [np.array(a) for a in arrs]
+
+
+def _padded_roots(
+    roots: "FloatArray", unit_interval: bool
+) -> "tuple[FloatArray, NDArray[np.intp]]":
+    # Sort the roots of each polynomial, missing roots are NaN and sorted last.
+    # Optionally drop the roots outside of 0 to 1.
+    if unit_interval:
+        with np.errstate(invalid="ignore"):
+            roots[(roots < 0.0) | (roots > 1.0)] = np.nan
+    roots.sort(axis=1)
+    return roots, np.count_nonzero(~np.isnan(roots), axis=1)
+
+
+def _as_ts(ts: "ArrayLike") -> "FloatArray":
+    arr = np.asarray(ts, dtype=np.float64)
+    if arr.ndim != 1:
+        raise ValueError("Expected t values of shape (M,), got %s" % (arr.shape,))
+    return arr
+
+
+def calc_cubic_parameters(
+    ctrl: "ArrayLike",
+) -> "tuple[FloatArray, FloatArray, FloatArray, FloatArray]":
+    """
+    Return the polynomial parameters a, b, c, d of N cubic curves, each as an array of
+    shape (N, 2). This is the vectorized version of
+    `fontgeometry.ftbeziertools.calcCubicParameters`.
+
+    Args:
+        ctrl (ArrayLike): The control points of shape (N, 4, 2)
+
+    Returns:
+        tuple[FloatArray, ...]: The parameters a, b, c, d
+    """
+    ctrl = _as_control_points(ctrl, 4)
+    d = ctrl[:, 0]
+    c = (ctrl[:, 1] - d) * 3.0
+    b = (ctrl[:, 2] - ctrl[:, 1]) * 3.0 - c
+    a = ctrl[:, 3] - d - c - b
+    return a, b, c, d
+
+
+def evaluate_cubics(ctrl: "ArrayLike", ts: "ArrayLike") -> "FloatArray":
+    """
+    Return the points for each of the t values on each of the cubic curves. This is the
+    vectorized version of `fontgeometry.beziertools.getPointListForCubic`.
+
+    Args:
+        ctrl (ArrayLike): The control points of shape (N, 4, 2)
+        ts (ArrayLike): The t values of shape (M,)
+
+    Returns:
+        FloatArray: The points of shape (N, M, 2)
+    """
+    a, b, c, d = calc_cubic_parameters(ctrl)
+    t = _as_ts(ts)[None, :, None]
+    t2 = t * t
+    t3 = t**3
+    return a[:, None] * t3 + b[:, None] * t2 + c[:, None] * t + d[:, None]
+
+
+def evaluate_quadratics(ctrl: "ArrayLike", ts: "ArrayLike") -> "FloatArray":
+    """
+    Return the points for each of the t values on each of the quadratic curves. This is
+    the vectorized version of `fontgeometry.beziertools.getPointListForQuadratic`.
+
+    Args:
+        ctrl (ArrayLike): The control points of shape (N, 3, 2)
+        ts (ArrayLike): The t values of shape (M,)
+
+    Returns:
+        FloatArray: The points of shape (N, M, 2)
+    """
+    ctrl = _as_control_points(ctrl, 3)
+    t = _as_ts(ts)[None, :, None]
+    t0 = (1 - t) * (1 - t)
+    t1 = 2 * (1 - t) * t
+    t2 = t * t
+    return t0 * ctrl[:, None, 0] + t1 * ctrl[:, None, 1] + t2 * ctrl[:, None, 2]
+
+
+def bounds_for_cubics(ctrl: "ArrayLike") -> "FloatArray":
+    """
+    Return the tight bounding boxes of N cubic curves. This is the vectorized version
+    of `fontgeometry.beziertools.getBoundsForCubic`.
+
+    Args:
+        ctrl (ArrayLike): The control points of shape (N, 4, 2)
+
+    Returns:
+        FloatArray: The bounding boxes as (xMin, yMin, xMax, yMax), of shape (N, 4)
+    """
+    a, b, c, d = calc_cubic_parameters(ctrl)
+    # The roots of the derivative 3at^2 + 2bt + c, separately for x and y
+    qa = 3.0 * a
+    qb = 2.0 * b
+    with np.errstate(divide="ignore", invalid="ignore"):
+        disc = qb * qb - 4.0 * qa * c
+        root = np.sqrt(np.maximum(disc, 0.0))
+        quadratic = np.abs(qa) >= 1e-12
+        t1 = np.where(quadratic, (-qb + root) / (2.0 * qa), -c / qb)
+        t2 = np.where(quadratic, (-qb - root) / (2.0 * qa), np.nan)
+        ts = np.stack((t1, t2))
+        valid = (ts > 0.0) & (ts < 1.0) & (~quadratic | (disc >= 0.0))
+    ts = np.where(valid, ts, 0.0)
+    values = ((a * ts + b) * ts + c) * ts + d
+
+    # Candidates of shape (4, N, 2): The end points and the extrema
+    ends = np.stack((d, a + b + c + d))
+    lo = np.minimum(ends.min(axis=0), np.where(valid, values, np.inf).min(axis=0))
+    hi = np.maximum(ends.max(axis=0), np.where(valid, values, -np.inf).max(axis=0))
+    return np.concatenate((lo, hi), axis=1)
+
+
+# The integrals from 0 to 1 of t^i * t^j and of t^i * t^j * t^k, for the products of
+# the coefficients of the cubic polynomials (ascending order) and their derivatives
+_PRODUCT_INTEGRALS = 1.0 / (np.arange(4)[:, None] + np.arange(3)[None, :] + 1.0)
+_TRIPLE_PRODUCT_INTEGRALS = 1.0 / (
+    np.arange(4)[:, None, None]
+    + np.arange(4)[None, :, None]
+    + np.arange(3)[None, None, :]
+    + 1.0
+)
+
+
+def moments_for_cubics(ctrl: "ArrayLike") -> "FloatArray":
+    """
+    Return the signed areas and first moments of area of N cubic curves, by Green's
+    theorem. This is the vectorized version of
+    `fontgeometry.beziertools.getMomentsForCubicParameters`. Sum the rows for the
+    segments of closed contours to get their area and centroid.
+
+    Args:
+        ctrl (ArrayLike): The control points of shape (N, 4, 2)
+
+    Returns:
+        FloatArray: The area, and the integrals of x and y over it, of shape (N, 3)
+    """
+    a, b, c, d = calc_cubic_parameters(ctrl)
+    # The coefficients of x(t) and y(t) of shape (N, 4), and of their derivatives of
+    # shape (N, 3), in ascending order
+    coeffs = np.stack((d, c, b, a), axis=1)
+    x, y = coeffs[:, :, 0], coeffs[:, :, 1]
+    derivs = np.stack((c, 2.0 * b, 3.0 * a), axis=1)
+    dx, dy = derivs[:, :, 0], derivs[:, :, 1]
+    area = 0.5 * (
+        np.einsum("ni,ij,nj->n", x, _PRODUCT_INTEGRALS, dy)
+        - np.einsum("ni,ij,nj->n", y, _PRODUCT_INTEGRALS, dx)
+    )
+    moment_x = 0.5 * np.einsum("ni,nj,ijk,nk->n", x, x, _TRIPLE_PRODUCT_INTEGRALS, dy)
+    moment_y = -0.5 * np.einsum("ni,nj,ijk,nk->n", y, y, _TRIPLE_PRODUCT_INTEGRALS, dx)
+    return np.stack((area, moment_x, moment_y), axis=1)
+
+
+def solve_linears(
+    a: "ArrayLike", b: "ArrayLike", unit_interval: bool = False
+) -> "tuple[FloatArray, NDArray[np.intp]]":
+    """
+    Solve N equations a*x*x + b*x = 0 at once. This is the vectorized version of
+    `fontgeometry.beziertools.solveLinear`, with the same roots.
+
+    Args:
+        a (ArrayLike): The coefficients a of shape (N,)
+        b (ArrayLike): The coefficients b of shape (N,)
+        unit_interval (bool, optional): Only return roots from 0 to 1. Defaults to
+            False.
+
+    Returns:
+        tuple[FloatArray, NDArray[np.intp]]: The sorted roots of shape (N, 2), padded
+            with NaN, and the number of roots of each equation of shape (N,)
+    """
+    a, b = _as_coefficients(a, b)
+    roots = np.full((len(a), 2), np.nan)
+    a_zero = np.abs(a) < epsilon
+    b_zero = np.abs(b) < epsilon
+    # If a is 0, the only root is 0
+    roots[a_zero & ~b_zero, 0] = 0.0
+    q = ~a_zero
+    roots[q, 0] = 0.0
+    roots[q, 1] = -b[q] / a[q]
+    return _padded_roots(roots, unit_interval)
+
+
+def solve_quadratics(
+    a: "ArrayLike", b: "ArrayLike", c: "ArrayLike", unit_interval: bool = False
+) -> "tuple[FloatArray, NDArray[np.intp]]":
+    """
+    Solve N quadratic equations a*x*x + b*x + c = 0 at once. This is the vectorized
+    version of `fontgeometry.ftbeziertools.solveQuadratic`, with the same roots.
+
+    Args:
+        a (ArrayLike): The coefficients a of shape (N,)
+        b (ArrayLike): The coefficients b of shape (N,)
+        c (ArrayLike): The coefficients c of shape (N,)
+        unit_interval (bool, optional): Only return roots from 0 to 1. Defaults to
+            False.
+
+    Returns:
+        tuple[FloatArray, NDArray[np.intp]]: The sorted roots of shape (N, 2), padded
+            with NaN, and the number of roots of each equation of shape (N,)
+    """
+    a, b, c = _as_coefficients(a, b, c)
+    return _padded_roots(_quadratic_roots(a, b, c), unit_interval)
+
+
+def _quadratic_roots(a: "FloatArray", b: "FloatArray", c: "FloatArray") -> "FloatArray":
+    # Return the unsorted roots of shape (N, 2), padded with NaN
+    roots = np.full((len(a), 2), np.nan)
+    a_zero = np.abs(a) < epsilon
+    # Linear equations
+    lin = a_zero & (np.abs(b) >= epsilon)
+    roots[lin, 0] = -c[lin] / b[lin]
+    # Quadratic equations with real roots
+    dd = b * b - 4.0 * a * c
+    q = ~a_zero & (dd >= 0.0)
+    rdd = np.sqrt(dd[q])
+    roots[q, 0] = (-b[q] + rdd) / 2.0 / a[q]
+    roots[q, 1] = (-b[q] - rdd) / 2.0 / a[q]
+    return roots
+
+
+def solve_cubics(
+    a: "ArrayLike",
+    b: "ArrayLike",
+    c: "ArrayLike",
+    d: "ArrayLike",
+    unit_interval: bool = False,
+) -> "tuple[FloatArray, NDArray[np.intp]]":
+    """
+    Solve N cubic equations a*x*x*x + b*x*x + c*x + d = 0 at once. This is the
+    vectorized version of `fontgeometry.ftbeziertools.solveCubic`, with the same roots.
+
+    Args:
+        a (ArrayLike): The coefficients a of shape (N,)
+        b (ArrayLike): The coefficients b of shape (N,)
+        c (ArrayLike): The coefficients c of shape (N,)
+        d (ArrayLike): The coefficients d of shape (N,)
+        unit_interval (bool, optional): Only return roots from 0 to 1. Defaults to
+            False.
+
+    Returns:
+        tuple[FloatArray, NDArray[np.intp]]: The sorted roots of shape (N, 3), padded
+            with NaN, and the number of roots of each equation of shape (N,)
+    """
+    a, b, c, d = _as_coefficients(a, b, c, d)
+    roots = np.full((len(a), 3), np.nan)
+
+    # For very small values of a, fall back to quadratic equations
+    a_zero = np.abs(a) < epsilon
+    roots[a_zero, :2] = _quadratic_roots(b[a_zero], c[a_zero], d[a_zero])
+
+    cub = ~a_zero
+    a = a[cub]
+    a1 = b[cub] / a
+    a2 = c[cub] / a
+    a3 = d[cub] / a
+    Q = (a1 * a1 - 3.0 * a2) / 9.0
+    R = (2.0 * a1 * a1 * a1 - 9.0 * a1 * a2 + 27.0 * a3) / 54.0
+    R2_Q3 = R * R - Q * Q * Q
+
+    # Three real roots
+    three = R2_Q3 < 0
+    Q3 = Q[three]
+    theta = np.arccos(R[three] / np.sqrt(Q3 * Q3 * Q3))
+    rQ2 = -2.0 * np.sqrt(Q3)
+    a1_3 = a1[three] / 3.0
+    roots3 = np.stack(
+        (
+            rQ2 * np.cos(theta / 3.0) - a1_3,
+            rQ2 * np.cos((theta + 2.0 * np.pi) / 3.0) - a1_3,
+            rQ2 * np.cos((theta + 4.0 * np.pi) / 3.0) - a1_3,
+        ),
+        axis=1,
+    )
+
+    # One real root
+    one = ~three
+    R1 = R[one]
+    x = np.cbrt(np.sqrt(R2_Q3[one]) + np.abs(R1))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        x = np.where(x == 0.0, 0.0, x + Q[one] / x)
+    x = np.where(R1 >= 0.0, -x, x) - a1[one] / 3.0
+
+    cub_roots = np.full((len(a), 3), np.nan)
+    cub_roots[three] = roots3
+    cub_roots[one, 0] = x
+    roots[cub] = cub_roots
+    return _padded_roots(roots, unit_interval)
+
+
+def extrema_for_cubics(
+    ctrl: "ArrayLike",
+    h: bool = True,
+    v: bool = False,
+    include_start_end: bool = False,
+) -> "tuple[FloatArray, NDArray[np.intp]]":
+    """
+    Return the t values of the extrema of N cubic curves. This is the vectorized
+    version of `fontgeometry.beziertools.getExtremaForCubic`.
+
+    Args:
+        ctrl (ArrayLike): The control points of shape (N, 4, 2)
+        h (bool, optional): Calculate extrema for horizontal derivative == 0. Defaults
+            to True.
+        v (bool, optional): Calculate extrema for vertical derivative == 0. Defaults
+            to False.
+        include_start_end (bool, optional): Whether to include extrema that lie at the
+            start or end point of the curve. Defaults to False.
+
+    Returns:
+        tuple[FloatArray, NDArray[np.intp]]: The sorted t values of shape (N, 4),
+            padded with NaN, and the number of extrema of each curve of shape (N,)
+    """
+    a, b, c, _d = calc_cubic_parameters(ctrl)
+    a = a * 3.0
+    b = b * 2.0
+    roots = np.full((len(a), 4), np.nan)
+    if h:
+        roots[:, :2] = _quadratic_roots(a[:, 1], b[:, 1], c[:, 1])
+    if v:
+        roots[:, 2:] = _quadratic_roots(a[:, 0], b[:, 0], c[:, 0])
+    with np.errstate(invalid="ignore"):
+        if include_start_end:
+            outside = (roots < 0.0) | (roots > 1.0)
+        else:
+            outside = (roots <= 0.0) | (roots >= 1.0)
+    roots[outside] = np.nan
+    return _padded_roots(roots, False)
+
+
+def inflections_for_cubics(
+    ctrl: "ArrayLike",
+) -> "tuple[FloatArray, NDArray[np.intp]]":
+    """
+    Return the t values of the inflections of N cubic curves. This is the vectorized
+    version of `fontgeometry.beziertools.getInflectionsForCubic`.
+
+    Args:
+        ctrl (ArrayLike): The control points of shape (N, 4, 2)
+
+    Returns:
+        tuple[FloatArray, NDArray[np.intp]]: The sorted t values of shape (N, 2),
+            padded with NaN, and the number of inflections of each curve of shape (N,)
+    """
+    ctrl = _as_control_points(ctrl, 4)
+    p1, p2, p3, p4 = ctrl[:, 0], ctrl[:, 1], ctrl[:, 2], ctrl[:, 3]
+    a = p2 - p1
+    b = p3 - p2 - a
+    c = p4 - p3 - a - b - b
+    c0 = a[:, 0] * b[:, 1] - a[:, 1] * b[:, 0]
+    c1 = a[:, 0] * c[:, 1] - a[:, 1] * c[:, 0]
+    c2 = b[:, 0] * c[:, 1] - b[:, 1] * c[:, 0]
+
+    roots = np.full((len(ctrl), 2), np.nan)
+    quadratic = np.abs(c2) > 0.00001
+    discr = c1 * c1 - 4 * c0 * c2
+    # Double roots
+    double = quadratic & (np.abs(discr) < 0.000001)
+    roots[double, 0] = -c1[double] / (2 * c2[double])
+    # Two roots
+    two = quadratic & ~double & (discr > 0)
+    sq = np.sqrt(discr[two])
+    roots[two, 0] = (-c1[two] - sq) / (2 * c2[two])
+    roots[two, 1] = (-c1[two] + sq) / (2 * c2[two])
+    # Linear
+    lin = ~quadratic & (c1 != 0.0)
+    roots[lin, 0] = -c0[lin] / c1[lin]
+
+    with np.errstate(invalid="ignore"):
+        roots[~((roots > 0.001) & (roots < 0.99))] = np.nan
+    return _padded_roots(roots, False)
+
+
+def split_cubics(
+    ctrl: "ArrayLike", ts: "ArrayLike"
+) -> "tuple[FloatArray, NDArray[np.intp]]":
+    """
+    Split N cubic curves at up to M t values each. This is the vectorized version of
+    `fontgeometry.beziertools.splitCubicAtTs`.
+
+    The t values can be the padded results of `extrema_for_cubics` or
+    `inflections_for_cubics`, or both concatenated along the last axis.
+
+    Args:
+        ctrl (ArrayLike): The control points of shape (N, 4, 2)
+        ts (ArrayLike): The t values of shape (N, M), padded with NaN, or of shape
+            (M,) for the same t values for all curves. They are sorted for each curve,
+            and values outside of 0 < t < 1 are ignored.
+
+    Returns:
+        tuple[FloatArray, NDArray[np.intp]]: The control points of the pieces of
+            shape (N, M + 1, 4, 2), padded with NaN, and the number of pieces of each
+            curve of shape (N,)
+    """
+    ctrl = _as_control_points(ctrl, 4)
+    n = len(ctrl)
+    t = np.asarray(ts, dtype=np.float64)
+    if t.ndim == 1:
+        t = np.broadcast_to(t, (n, len(t)))
+    if t.ndim != 2 or len(t) != n:
+        raise ValueError("Expected t values of shape (%i, M), got %s" % (n, t.shape))
+
+    # Sort the t values, the unused ones are moved to the end as NaN
+    t = t.copy()
+    with np.errstate(invalid="ignore"):
+        t[~((t > 0.0) & (t < 1.0))] = np.nan
+    t, counts = _padded_roots(t, False)
+
+    # The boundaries of the pieces, missing t values are replaced by 1 and give
+    # empty pieces that are removed below
+    m = t.shape[1]
+    bounds = np.empty((n, m + 2))
+    bounds[:, 0] = 0.0
+    bounds[:, 1:-1] = np.where(np.isnan(t), 1.0, t)
+    bounds[:, -1] = 1.0
+
+    # The points and derivatives at the boundaries
+    a, b, c, d = calc_cubic_parameters(ctrl)
+    u = bounds[:, :, None]
+    u2 = u * u
+    points = a[:, None] * u2 * u + b[:, None] * u2 + c[:, None] * u + d[:, None]
+    deriv = 3.0 * a[:, None] * u2 + 2.0 * b[:, None] * u + c[:, None]
+    points[:, 0] = ctrl[:, 0]
+    points[bounds == 1.0] = np.repeat(ctrl[:, 3], m + 1 - counts, axis=0)
+
+    f = np.diff(bounds, axis=1)[:, :, None] / 3.0
+    pieces = np.empty((n, m + 1, 4, 2))
+    pieces[:, :, 0] = points[:, :-1]
+    pieces[:, :, 1] = points[:, :-1] + deriv[:, :-1] * f
+    pieces[:, :, 2] = points[:, 1:] - deriv[:, 1:] * f
+    pieces[:, :, 3] = points[:, 1:]
+
+    # The last used piece ends at the end point, the following pieces are unused
+    counts = counts + 1
+    pieces[np.arange(m + 1)[None, :] >= counts[:, None]] = np.nan
+    return pieces, counts
+
+
+def _as_points(points: "ArrayLike") -> "FloatArray":
+    # Convert the points to a float array of shape (N, 2)
+    arr = np.asarray(points, dtype=np.float64)
+    if arr.ndim != 2 or arr.shape[1] != 2:
+        raise ValueError("Expected points of shape (N, 2), got %s" % (arr.shape,))
+    return arr
+
+
+def intersect_many(
+    p0s: "ArrayLike", p1s: "ArrayLike", p2s: "ArrayLike", p3s: "ArrayLike"
+) -> "tuple[FloatArray, NDArray[np.bool_]]":
+    """
+    Return the intersections of N pairs of lines, each line given by two points. This
+    is the vectorized version of `fontgeometry.geometry.intersect`, which intersects
+    the lines p0-p1 and p3-p2, with the same results.
+
+    Args:
+        p0s (ArrayLike): The first points of the first lines, of shape (N, 2)
+        p1s (ArrayLike): The second points of the first lines, of shape (N, 2)
+        p2s (ArrayLike): The second points of the second lines, of shape (N, 2)
+        p3s (ArrayLike): The first points of the second lines, of shape (N, 2)
+
+    Returns:
+        tuple[FloatArray, NDArray[np.bool_]]: The intersection points of shape (N, 2),
+            NaN for parallel lines, and the mask of shape (N,) which is True where the
+            lines intersect
+    """
+    p0 = _as_points(p0s)
+    p1 = _as_points(p1s)
+    p2 = _as_points(p2s)
+    p3 = _as_points(p3s)
+
+    # The line coefficients, see `fontgeometry.geometry.line_coefficients`
+    a1 = p0[:, 1] - p1[:, 1]
+    b1 = p1[:, 0] - p0[:, 0]
+    c1 = -(p0[:, 0] * p1[:, 1] - p1[:, 0] * p0[:, 1])
+    a2 = p3[:, 1] - p2[:, 1]
+    b2 = p2[:, 0] - p3[:, 0]
+    c2 = -(p3[:, 0] * p2[:, 1] - p2[:, 0] * p3[:, 1])
+
+    d = a1 * b2 - b1 * a2
+    mask = d != 0
+    result = np.full((len(d), 2), np.nan)
+    dm = d[mask]
+    result[mask, 0] = (c1 * b2 - b1 * c2)[mask] / dm
+    result[mask, 1] = (a1 * c2 - c1 * a2)[mask] / dm
+    return result, mask
+
+
+def _dot_products(p1: "FloatArray", p2: "FloatArray", p3: "FloatArray") -> "FloatArray":
+    # The dot products of the unit vectors p1_p2 and p1_p3, NaN if one of the vectors
+    # has zero length. See `fontgeometry.geometry.dot_product_2d`.
+    v1 = p2 - p1
+    v2 = p3 - p1
+    with np.errstate(invalid="ignore", divide="ignore"):
+        v1 = v1 / np.hypot(v1[:, 0], v1[:, 1])[:, None]
+        v2 = v2 / np.hypot(v2[:, 0], v2[:, 1])[:, None]
+    return v1[:, 0] * v2[:, 0] + v1[:, 1] * v2[:, 1]
+
+
+def same_direction_many(
+    p0s: "ArrayLike",
+    p1s: "ArrayLike",
+    p2s: "ArrayLike",
+    p3s: "ArrayLike",
+    points: "ArrayLike",
+) -> "NDArray[np.bool_]":
+    """
+    Check if the lines p0-p1 and p0-i, as well as p3-p2 and p3-i, point in the same
+    direction +- 90 degrees, for N sets of points. This is the vectorized version of
+    `fontgeometry.geometry.same_direction`.
+
+    Args:
+        p0s (ArrayLike): The points p0, of shape (N, 2)
+        p1s (ArrayLike): The points p1, of shape (N, 2)
+        p2s (ArrayLike): The points p2, of shape (N, 2)
+        p3s (ArrayLike): The points p3, of shape (N, 2)
+        points (ArrayLike): The points i, e.g. the results of `intersect_many`, of
+            shape (N, 2)
+
+    Returns:
+        NDArray[np.bool_]: The results of shape (N,). They are False where one of the
+            lines has zero length or i is NaN, where `same_direction` would raise an
+            exception.
+    """
+    p0 = _as_points(p0s)
+    p3 = _as_points(p3s)
+    i = _as_points(points)
+    dp0 = _dot_products(p0, _as_points(p1s), i)
+    dp3 = _dot_products(p3, _as_points(p2s), i)
+    return (dp0 >= 0) & (dp3 >= 0)
+
+
+def handle_intersections(
+    ctrl: "ArrayLike",
+) -> "tuple[FloatArray, NDArray[np.bool_]]":
+    """
+    Return the intersections of the handles of N cubic curves, i.e. of the lines
+    p0-p1 and p3-p2, for the analysis of the handle tension. An intersection is only
+    valid if both handles point towards it.
+
+    Args:
+        ctrl (ArrayLike): The control points of shape (N, 4, 2)
+
+    Returns:
+        tuple[FloatArray, NDArray[np.bool_]]: The intersection points of shape
+            (N, 2), NaN for parallel handles, and the mask of shape (N,) which is True
+            where the intersection is valid
+    """
+    ctrl = _as_control_points(ctrl, 4)
+    p0, p1, p2, p3 = ctrl[:, 0], ctrl[:, 1], ctrl[:, 2], ctrl[:, 3]
+    points, mask = intersect_many(p0, p1, p2, p3)
+    return points, mask & same_direction_many(p0, p1, p2, p3, points)
+
+
+def round_points(points: "ArrayLike") -> "NDArray[np.int64]":
+    """
+    Round all coordinates half up. This is the vectorized version of
+    `fontgeometry.rounding.round_points`, with the same results for coordinates
+    smaller than 2 ** 52.
+
+    Args:
+        points (ArrayLike): The coordinates, e.g. points of shape (N, 2)
+
+    Returns:
+        NDArray[np.int64]: The rounded coordinates in the same shape
+
+    Raises:
+        OverflowError: If a coordinate doesn't fit into a 64 bit integer
+    """
+    arr = np.asarray(points, dtype=np.float64)
+    # Round the absolute values, the fractional part is calculated exactly
+    a = np.abs(arr)
+    if a.size and a.max() >= 2.0**63:
+        # The conversion to int64 would wrap around silently
+        raise OverflowError("Coordinates must be smaller than 2 ** 63")
+    i = np.floor(a)
+    i += a - i >= 0.5
+    return np.copysign(i, arr).astype(np.int64)
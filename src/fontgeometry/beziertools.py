@@ -1,5 +1,5 @@
-from math import sqrt
-from typing import TYPE_CHECKING
+from math import hypot, log, sqrt
+from typing import TYPE_CHECKING, Iterable
 
 from fontgeometry.ftbeziertools import (
     calcCubicParameters,
@@ -10,7 +10,7 @@ from fontgeometry.ftbeziertools import (
 from fontgeometry.geometry import distance_between_points, half_point
 
 if TYPE_CHECKING:
-    from fontgeometry.typing import PointTuple
+    from fontgeometry.typing import BoundsTuple, PointTuple
 
 # Adapted from robofab.pens.filterPen
 
@@ -39,6 +39,120 @@ def estimateCubicCurveLength(
     return length
 
 
+# Gauss-Legendre abscissae and weights for 5 points, mapped from [-1, 1] to [0, 1]
+
+_gl_abscissae = (
+    0.04691007703066800,
+    0.23076534494715845,
+    0.5,
+    0.76923465505284155,
+    0.95308992296933200,
+)
+_gl_weights = (
+    0.11846344252809454,
+    0.23931433524968324,
+    0.28444444444444444,
+    0.23931433524968324,
+    0.11846344252809454,
+)
+
+
+def _integrateCubicSpeed(
+    ax: float,
+    ay: float,
+    bx: float,
+    by: float,
+    cx: float,
+    cy: float,
+    t0: float,
+    t1: float,
+) -> float:
+    # Integrate the speed |B'(t)| from t0 to t1 with 5-point Gauss-Legendre
+    # quadrature. The parameters must already be scaled to the derivative, i.e.
+    # B'(t) = a * t^2 + b * t + c.
+    dt = t1 - t0
+    length = 0.0
+    for x, w in zip(_gl_abscissae, _gl_weights):
+        t = t0 + x * dt
+        length += w * hypot((ax * t + bx) * t + cx, (ay * t + by) * t + cy)
+    return length * dt
+
+
+def getArcLengthForCubicParameters(
+    params: "tuple[PointTuple, PointTuple, PointTuple, PointTuple]",
+    t0: float = 0.0,
+    t1: float = 1.0,
+    tolerance: float = 0.001,
+    max_depth: int = 16,
+) -> float:
+    """
+    Return the arc length of the cubic curve defined by its polynomial parameters
+    between t0 and t1, using adaptive Gauss-Legendre quadrature. An interval is
+    subdivided until the results of the interval and its two halves differ by less
+    than the tolerance.
+
+    Args:
+        params (tuple[PointTuple, PointTuple, PointTuple, PointTuple]): The parameters
+            of the cubic as returned by `calcCubicParameters`
+        t0 (float, optional): The start t value. Defaults to 0.0.
+        t1 (float, optional): The end t value. Defaults to 1.0.
+        tolerance (float, optional): The maximum error of the result in units.
+            Defaults to 0.001.
+        max_depth (int, optional): The maximum subdivision depth. Defaults to 16.
+
+    Returns:
+        float: The arc length
+    """
+    (ax, ay), (bx, by), (cx, cy), _d = params
+    # Parameters of the derivative
+    ax *= 3.0
+    ay *= 3.0
+    bx *= 2.0
+    by *= 2.0
+
+    def integrate(t0: float, t1: float, whole: float, tol: float, depth: int) -> float:
+        tm = (t0 + t1) * 0.5
+        left = _integrateCubicSpeed(ax, ay, bx, by, cx, cy, t0, tm)
+        right = _integrateCubicSpeed(ax, ay, bx, by, cx, cy, tm, t1)
+        if depth >= max_depth or abs(left + right - whole) <= tol:
+            return left + right
+        tol *= 0.5
+        depth += 1
+        return integrate(t0, tm, left, tol, depth) + integrate(
+            tm, t1, right, tol, depth
+        )
+
+    whole = _integrateCubicSpeed(ax, ay, bx, by, cx, cy, t0, t1)
+    return integrate(t0, t1, whole, tolerance, 0)
+
+
+def calculateCubicCurveLength(
+    pt1: "PointTuple",
+    pt2: "PointTuple",
+    pt3: "PointTuple",
+    pt4: "PointTuple",
+    tolerance: float = 0.001,
+) -> float:
+    """
+    Calculate the length of this curve by adaptive Gauss-Legendre quadrature. Unlike
+    `estimateCubicCurveLength`, the result is accurate to the given tolerance.
+
+    Args:
+        pt1 (PointTuple): The first point of the cubic
+        pt2 (PointTuple): The second point of the cubic, a control point
+        pt3 (PointTuple): The third point of the cubic, a control point
+        pt4 (PointTuple): The fourth point of the cubic
+        tolerance (float, optional): The maximum error of the result in units.
+            Defaults to 0.001.
+
+    Returns:
+        float: The curve length
+    """
+    return getArcLengthForCubicParameters(
+        calcCubicParameters(pt1, pt2, pt3, pt4), tolerance=tolerance
+    )
+
+
 def getPointOnCubic(
     t: float, pt1: "PointTuple", pt2: "PointTuple", pt3: "PointTuple", pt4: "PointTuple"
 ) -> "PointTuple":
@@ -98,6 +212,175 @@ def getPointListForCubic(
     return path
 
 
+def splitCubicAtTs(
+    pt1: "PointTuple",
+    pt2: "PointTuple",
+    pt3: "PointTuple",
+    pt4: "PointTuple",
+    ts: "Iterable[float]",
+) -> "list[tuple[PointTuple, PointTuple, PointTuple, PointTuple]]":
+    """
+    Split the cubic curve defined by pt1, pt2, pt3, pt4 at several t values in one
+    pass. The point and the derivative are calculated once for each t value and shared
+    by the pieces on both sides of it, so adjacent pieces have identical end and start
+    points.
+
+    Args:
+        pt1 (PointTuple): The first point of the cubic
+        pt2 (PointTuple): The second point of the cubic, a control point
+        pt3 (PointTuple): The third point of the cubic, a control point
+        pt4 (PointTuple): The fourth point of the cubic
+        ts (Iterable[float]): The sorted t values. Values outside of 0 < t < 1 are
+            ignored.
+
+    Raises:
+        ValueError: If the t values are not sorted
+
+    Returns:
+        list[tuple[PointTuple, PointTuple, PointTuple, PointTuple]]: The pieces, one
+            more than the number of t values used
+    """
+    (x0, y0), (x1, y1) = pt1, pt2
+    cx = (x1 - x0) * 3
+    cy = (y1 - y0) * 3
+    bx = (pt3[0] - x1) * 3 - cx
+    by = (pt3[1] - y1) * 3 - cy
+    ax = pt4[0] - x0 - cx - bx
+    ay = pt4[1] - y0 - cy - by
+
+    pieces: "list[tuple[PointTuple, PointTuple, PointTuple, PointTuple]]" = []
+    # The start of the current piece, its point, and the derivative at that point
+    t0 = 0.0
+    p0 = pt1
+    dx0 = cx
+    dy0 = cy
+    for t in ts:
+        if t < t0:
+            raise ValueError("The t values must be sorted")
+        if t <= 0.0 or t >= 1.0:
+            continue
+
+        t2 = t * t
+        p = (ax * t2 * t + bx * t2 + cx * t + x0, ay * t2 * t + by * t2 + cy * t + y0)
+        dx = 3 * ax * t2 + 2 * bx * t + cx
+        dy = 3 * ay * t2 + 2 * by * t + cy
+        # The control points are one third of the derivatives, scaled to the piece
+        f = (t - t0) / 3
+        pieces.append(
+            (
+                p0,
+                (p0[0] + dx0 * f, p0[1] + dy0 * f),
+                (p[0] - dx * f, p[1] - dy * f),
+                p,
+            )
+        )
+        t0 = t
+        p0 = p
+        dx0 = dx
+        dy0 = dy
+
+    if not pieces:
+        return [(pt1, pt2, pt3, pt4)]
+
+    # The last piece, up to the end point
+    f = (1.0 - t0) / 3
+    dx = 3 * ax + 2 * bx + cx
+    dy = 3 * ay + 2 * by + cy
+    pieces.append(
+        (
+            p0,
+            (p0[0] + dx0 * f, p0[1] + dy0 * f),
+            (pt4[0] - dx * f, pt4[1] - dy * f),
+            pt4,
+        )
+    )
+    return pieces
+
+
+def _segmentDistanceSquared(
+    px: float, py: float, x1: float, y1: float, dx: float, dy: float, len2: float
+) -> float:
+    # Return the squared distance of point p to the segment from (x1, y1) to
+    # (x1 + dx, y1 + dy), len2 is the squared length of the segment
+    ex = px - x1
+    ey = py - y1
+    if len2 > 0:
+        u = (ex * dx + ey * dy) / len2
+        if u > 1.0:
+            u = 1.0
+        elif u < 0.0:
+            u = 0.0
+        ex -= u * dx
+        ey -= u * dy
+    return ex * ex + ey * ey
+
+
+def getFlattenedPointsForCubic(
+    pt1: "PointTuple",
+    pt2: "PointTuple",
+    pt3: "PointTuple",
+    pt4: "PointTuple",
+    tolerance: float = 0.1,
+    max_depth: int = 16,
+) -> "tuple[list[float], list[PointTuple]]":
+    """
+    Return a polyline that approximates the cubic curve defined by pt1, pt2, pt3, pt4
+    within the tolerance, and the t value of each vertex. The curve is split in half
+    until the control points of each piece are within the tolerance of its chord, so
+    flat parts of the curve get few vertices and tight curves get many.
+
+    Args:
+        pt1 (PointTuple): The first point of the cubic
+        pt2 (PointTuple): The second point of the cubic, a control point
+        pt3 (PointTuple): The third point of the cubic, a control point
+        pt4 (PointTuple): The fourth point of the cubic
+        tolerance (float, optional): The maximum distance between the curve and the
+            polyline. Defaults to 0.1.
+        max_depth (int, optional): The maximum number of subdivisions, limiting the
+            number of vertices to 2 ** max_depth + 1. Defaults to 16.
+
+    Returns:
+        tuple[list[float], list[PointTuple]]: The t values and the points of the
+            vertices, including the start and end point
+    """
+    tol2 = tolerance * tolerance
+    ts = [0.0]
+    points = [pt1]
+    # The pieces that are still to be processed, the next one is last
+    stack = [(0.0, 1.0, pt1[0], pt1[1], pt2[0], pt2[1], pt3[0], pt3[1], pt4, 0)]
+    while stack:
+        t0, t1, x1, y1, x2, y2, x3, y3, end, depth = stack.pop()
+        x4, y4 = end
+        dx = x4 - x1
+        dy = y4 - y1
+        len2 = dx * dx + dy * dy
+        if depth >= max_depth or (
+            _segmentDistanceSquared(x2, y2, x1, y1, dx, dy, len2) <= tol2
+            and _segmentDistanceSquared(x3, y3, x1, y1, dx, dy, len2) <= tol2
+        ):
+            ts.append(t1)
+            points.append(end)
+            continue
+
+        # Split in half (de Casteljau)
+        x12 = (x1 + x2) * 0.5
+        y12 = (y1 + y2) * 0.5
+        x23 = (x2 + x3) * 0.5
+        y23 = (y2 + y3) * 0.5
+        x34 = (x3 + x4) * 0.5
+        y34 = (y3 + y4) * 0.5
+        x123 = (x12 + x23) * 0.5
+        y123 = (y12 + y23) * 0.5
+        x234 = (x23 + x34) * 0.5
+        y234 = (y23 + y34) * 0.5
+        mid = ((x123 + x234) * 0.5, (y123 + y234) * 0.5)
+        tm = (t0 + t1) * 0.5
+        depth += 1
+        stack.append((tm, t1, mid[0], mid[1], x234, y234, x34, y34, end, depth))
+        stack.append((t0, tm, x1, y1, x12, y12, x123, y123, mid, depth))
+    return ts, points
+
+
 def getExtremaForCubic(
     pt1: "PointTuple",
     pt2: "PointTuple",
@@ -184,6 +467,105 @@ def getExtremumPointsForCubic(
     )
 
 
+def getBoundsForCubic(
+    pt1: "PointTuple", pt2: "PointTuple", pt3: "PointTuple", pt4: "PointTuple"
+) -> "BoundsTuple":
+    """
+    Return the tight bounding box of the cubic curve defined by pt1, pt2, pt3, pt4.
+
+    Args:
+        pt1 (PointTuple): The first point of the cubic
+        pt2 (PointTuple): The second point of the cubic, a control point
+        pt3 (PointTuple): The third point of the cubic, a control point
+        pt4 (PointTuple): The fourth point of the cubic
+
+    Returns:
+        BoundsTuple: The bounding box as (xMin, yMin, xMax, yMax)
+    """
+    xs = [pt1[0], pt4[0]]
+    ys = [pt1[1], pt4[1]]
+    if not (
+        min(xs) <= pt2[0] <= max(xs)
+        and min(xs) <= pt3[0] <= max(xs)
+        and min(ys) <= pt2[1] <= max(ys)
+        and min(ys) <= pt3[1] <= max(ys)
+    ):
+        # The control points are outside of the box of the end points, there may be
+        # extrema
+        for x, y in getExtremumPointsForCubic(pt1, pt2, pt3, pt4, h=True, v=True):
+            xs.append(x)
+            ys.append(y)
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+def _integrateSquareTimesDerivative(
+    ap: float, bp: float, cp: float, dp: float, aq: float, bq: float, cq: float
+) -> float:
+    # Return the integral from 0 to 1 of p(t)^2 * q'(t) for two cubic polynomials p and
+    # q given by their parameters, i.e. p(t) = ap*t^3 + bp*t^2 + cp*t + dp
+    return (
+        dp * dp * (cq + bq + aq)
+        + 2.0 * dp * cp * (cq / 2.0 + 2.0 * bq / 3.0 + 0.75 * aq)
+        + (cp * cp + 2.0 * dp * bp) * (cq / 3.0 + bq / 2.0 + 0.6 * aq)
+        + 2.0 * (dp * ap + cp * bp) * (cq / 4.0 + 0.4 * bq + aq / 2.0)
+        + (bp * bp + 2.0 * cp * ap) * (cq / 5.0 + bq / 3.0 + 3.0 * aq / 7.0)
+        + 2.0 * bp * ap * (cq / 6.0 + 2.0 * bq / 7.0 + 0.375 * aq)
+        + ap * ap * (cq / 7.0 + bq / 4.0 + aq / 3.0)
+    )
+
+
+def getAreaForCubicParameters(
+    params: "tuple[PointTuple, PointTuple, PointTuple, PointTuple]",
+) -> float:
+    """
+    Return the signed area between the cubic curve defined by its polynomial
+    parameters and the origin, by Green's theorem: 1/2 * integral of (x dy - y dx).
+    The sum over the segments of a closed contour is the area of the contour. It is
+    positive for counter-clockwise contours.
+
+    Args:
+        params (tuple[PointTuple, PointTuple, PointTuple, PointTuple]): The parameters
+            of the cubic as returned by `calcCubicParameters`
+
+    Returns:
+        float: The signed area
+    """
+    (ax, ay), (bx, by), (cx, cy), (dx, dy) = params
+    return 0.5 * (
+        dx * (ay + by + cy)
+        - dy * (ax + bx + cx)
+        + (cx * by - cy * bx) / 3.0
+        + (cx * ay - cy * ax) / 2.0
+        + (bx * ay - by * ax) / 5.0
+    )
+
+
+def getMomentsForCubicParameters(
+    params: "tuple[PointTuple, PointTuple, PointTuple, PointTuple]",
+) -> tuple[float, float, float]:
+    """
+    Return the signed area and the first moments of area between the cubic curve
+    defined by its polynomial parameters and the origin, by Green's theorem. The sums
+    over the segments of a closed contour are the area of the contour and the
+    integrals of x and y over it, so the centroid is (moment_x / area, moment_y /
+    area).
+
+    Args:
+        params (tuple[PointTuple, PointTuple, PointTuple, PointTuple]): The parameters
+            of the cubic as returned by `calcCubicParameters`
+
+    Returns:
+        tuple[float, float, float]: The signed area, the moment of x (1/2 * integral
+            of x^2 dy) and the moment of y (-1/2 * integral of y^2 dx)
+    """
+    (ax, ay), (bx, by), (cx, cy), (dx, dy) = params
+    return (
+        getAreaForCubicParameters(params),
+        0.5 * _integrateSquareTimesDerivative(ax, bx, cx, dx, ay, by, cy),
+        -0.5 * _integrateSquareTimesDerivative(ay, by, cy, dy, ax, bx, cx),
+    )
+
+
 def getInflectionsForCubic(
     pt1: "PointTuple", pt2: "PointTuple", pt3: "PointTuple", pt4: "PointTuple"
 ) -> list[float]:
@@ -341,6 +723,90 @@ def getExtremumPointsForQuadratic(
     )
 
 
+def getBoundsForQuadratic(
+    pt1: "PointTuple", pt2: "PointTuple", pt3: "PointTuple"
+) -> "BoundsTuple":
+    """
+    Return the tight bounding box of the quadratic curve defined by pt1, pt2, pt3.
+
+    Args:
+        pt1 (PointTuple): The first point of the curve
+        pt2 (PointTuple): The second point of the curve, an offcurve point
+        pt3 (PointTuple): The third point of the curve
+
+    Returns:
+        BoundsTuple: The bounding box as (xMin, yMin, xMax, yMax)
+    """
+    xs = [pt1[0], pt3[0]]
+    ys = [pt1[1], pt3[1]]
+    if not (min(xs) <= pt2[0] <= max(xs) and min(ys) <= pt2[1] <= max(ys)):
+        # The offcurve point is outside of the box of the end points, there may be
+        # extrema
+        for x, y in getExtremumPointsForQuadratic(pt1, pt2, pt3, h=True, v=True):
+            xs.append(x)
+            ys.append(y)
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+def _integrateQuadraticSpeed(a: float, b: float, c: float, s: float) -> float:
+    # The antiderivative of sqrt(s * s + k) for k = (a * c - b * b) / a^2, with the
+    # logarithm rewritten for negative s to avoid cancellation
+    k = max(0.0, (a * c - b * b) / (a * a))
+    if k == 0.0:
+        return 0.5 * s * abs(s)
+    r = sqrt(s * s + k)
+    if s < 0.0:
+        return 0.5 * (s * r + k * log(k / (r - s)))
+    return 0.5 * (s * r + k * log(s + r))
+
+
+def getArcLengthForQuadratic(
+    pt1: "PointTuple",
+    pt2: "PointTuple",
+    pt3: "PointTuple",
+    t0: float = 0.0,
+    t1: float = 1.0,
+) -> float:
+    """
+    Return the arc length of the quadratic curve defined by pt1, pt2, pt3 between t0
+    and t1. Unlike for cubics, the length is calculated in closed form.
+
+    Args:
+        pt1 (PointTuple): The first point of the curve
+        pt2 (PointTuple): The second point of the curve, an offcurve point
+        pt3 (PointTuple): The third point of the curve
+        t0 (float, optional): The start t value. Defaults to 0.0.
+        t1 (float, optional): The end t value. Defaults to 1.0.
+
+    Returns:
+        float: The arc length
+    """
+    # The derivative is B'(t) = 2 * (A * t + B)
+    (x1, y1), (x2, y2), (x3, y3) = pt1, pt2, pt3
+    ax = x1 - 2.0 * x2 + x3
+    ay = y1 - 2.0 * y2 + y3
+    bx = x2 - x1
+    by = y2 - y1
+    a = ax * ax + ay * ay
+    b = ax * bx + ay * by
+    c = bx * bx + by * by
+    if a <= 1e-10 * c:
+        # Almost a line with evenly spaced points, the closed form loses precision
+        return _integrateCubicSpeed(
+            0.0, 0.0, 2.0 * ax, 2.0 * ay, 2.0 * bx, 2.0 * by, t0, t1
+        )
+
+    offset = b / a
+    return (
+        2.0
+        * sqrt(a)
+        * (
+            _integrateQuadraticSpeed(a, b, c, t1 + offset)
+            - _integrateQuadraticSpeed(a, b, c, t0 + offset)
+        )
+    )
+
+
 def solveLinear(a: float, b: float) -> list[float]:
     if abs(a) < epsilon:
         if abs(b) < epsilon:
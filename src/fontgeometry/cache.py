@@ -0,0 +1,461 @@
+import mmap
+import os
+import struct
+import threading
+from collections import OrderedDict
+from hashlib import blake2b
+from math import floor
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Hashable,
+    Iterator,
+    NamedTuple,
+    Sequence,
+)
+
+if TYPE_CHECKING:
+    from fontgeometry.typing import PointTuple
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class PointCache:
+    """
+    A bounded cache that maps points to values. The points are quantized to a grid, so
+    points in the same grid cell share an entry. When the cache is full, the least
+    recently used entry is evicted. The cache can be used by several threads.
+    """
+
+    def __init__(self, maxsize: int = 4096, grid: float | None = 0.01) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        if grid is not None and grid <= 0:
+            raise ValueError("grid must be positive")
+
+        # The maximum number of entries
+        self.maxsize = maxsize
+
+        # The size of the grid cells. If None, only identical points share an entry.
+        self.grid = grid
+
+        # The number of lookups that found or didn't find an entry
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict[tuple[float, float], Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, pt: "PointTuple") -> bool:
+        return self.key(pt) in self._data
+
+    def __repr__(self) -> str:
+        return "<PointCache len=%i, maxsize=%i, grid=%s>" % (
+            len(self._data),
+            self.maxsize,
+            self.grid,
+        )
+
+    def key(self, pt: "PointTuple") -> tuple[float, float]:
+        # Return the grid cell of the point
+        if self.grid is None:
+            return pt[0], pt[1]
+        return floor(pt[0] / self.grid), floor(pt[1] / self.grid)
+
+    def get(self, pt: "PointTuple", default: Any = None) -> Any:
+        """
+        Return the value for the point, and mark it as recently used.
+
+        Args:
+            pt (PointTuple): The point
+            default (Any, optional): The value to return if the point is not in the
+                cache. Defaults to None.
+
+        Returns:
+            Any: The value
+        """
+        key = self.key(pt)
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+
+            self._data.move_to_end(key)
+            self.hits += 1
+        return value
+
+    def put(self, pt: "PointTuple", value: Any) -> None:
+        """
+        Store the value for the point, evicting the least recently used entry if the
+        cache is full.
+
+        Args:
+            pt (PointTuple): The point
+            value (Any): The value
+        """
+        key = self.key(pt)
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        # Remove all entries and reset the counters
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> CacheInfo:
+        """
+        Return the cache statistics.
+
+        Returns:
+            CacheInfo: The number of hits and misses, the maximum and current size
+        """
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._data))
+
+
+# A process-wide cache for the analysis results of cubics, keyed by the control points.
+# Identical cubics, e.g. in components or compatible masters, share their results.
+#
+# A lookup takes a lock and builds a key tuple of the ten coordinates, and with a store
+# also hashes the repr of the key. That is more expensive than calculating parameters,
+# bounds or moments, so only the kinds of results below that need root solving or
+# numerical integration are cached.
+
+# The kinds of results that don't change when the cubic is moved
+_INVARIANT_KINDS = {"extrema", "inflections", "length", "length_table"}
+
+# The kinds of results that are returned as lists
+_LIST_KINDS = {"extrema", "inflections", "length_table"}
+
+# The kinds of results that are written to the store, with at most MAX_STORED_VALUES
+# values each
+_STORED_KINDS = {"extrema", "inflections", "length"}
+
+MAX_STORED_VALUES = 5
+
+# Marks a missing result, None is a valid result
+_MISSING = object()
+
+
+class MappedStore:
+    """
+    A fixed-size hash table of analysis results in a memory-mapped file, so the results
+    are kept between runs. Each record holds a key digest and up to
+    `MAX_STORED_VALUES` floats. When the probed slots for a key are full, the first one
+    is overwritten.
+
+    The store is not safe for concurrent writers, e.g. several worker processes.
+    """
+
+    _HEADER = struct.Struct("<8sQ")
+    _RECORD = struct.Struct("<16sI4x%id" % MAX_STORED_VALUES)
+    _MAGIC = b"FGSTORE1"
+    _EMPTY = bytes(16)
+
+    # The number of slots that are probed for a key
+    MAX_PROBES = 8
+
+    def __init__(self, path: str | os.PathLike, capacity: int = 65536) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+
+        size = self._HEADER.size + capacity * self._RECORD.size
+        exists = os.path.exists(path) and os.path.getsize(path) > 0
+        self._file = open(path, "r+b" if exists else "w+b")
+        try:
+            if exists:
+                header = self._file.read(self._HEADER.size)
+                if len(header) < self._HEADER.size:
+                    raise ValueError("Not an analysis store: %s" % path)
+
+                magic, file_capacity = self._HEADER.unpack(header)
+                if magic != self._MAGIC or os.path.getsize(path) != (
+                    self._HEADER.size + file_capacity * self._RECORD.size
+                ):
+                    raise ValueError("Not an analysis store: %s" % path)
+
+                capacity = file_capacity
+            else:
+                self._file.write(self._HEADER.pack(self._MAGIC, capacity))
+                self._file.truncate(size)
+                self._file.flush()
+            self._map = mmap.mmap(self._file.fileno(), 0)
+        except Exception:
+            self._file.close()
+            raise
+
+        # The number of records. For existing files, the capacity of the file is used.
+        self.capacity = capacity
+
+    def __enter__(self) -> "MappedStore":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def _slots(self, digest: bytes) -> Iterator[int]:
+        # Return the offsets of the slots to probe for the digest
+        home = int.from_bytes(digest[:8], "little") % self.capacity
+        for i in range(min(self.MAX_PROBES, self.capacity)):
+            slot = (home + i) % self.capacity
+            yield self._HEADER.size + slot * self._RECORD.size
+
+    def get(self, digest: bytes) -> tuple[float, ...] | None:
+        """
+        Return the values stored for the digest.
+
+        Args:
+            digest (bytes): The 16 byte key digest
+
+        Returns:
+            tuple[float, ...] | None: The values, or None if the digest is not stored
+        """
+        for offset in self._slots(digest):
+            record = self._RECORD.unpack_from(self._map, offset)
+            if record[0] == digest:
+                return record[2 : 2 + record[1]]
+            if record[0] == self._EMPTY:
+                break
+        return None
+
+    def put(self, digest: bytes, values: Sequence[float]) -> None:
+        """
+        Store the values for the digest.
+
+        Args:
+            digest (bytes): The 16 byte key digest
+            values (Sequence[float]): The values
+
+        Raises:
+            ValueError: If there are more than `MAX_STORED_VALUES` values
+        """
+        num_values = len(values)
+        if num_values > MAX_STORED_VALUES:
+            raise ValueError("Too many values: %i" % num_values)
+
+        padded = tuple(values) + (0.0,) * (MAX_STORED_VALUES - num_values)
+        first = None
+        for offset in self._slots(digest):
+            if first is None:
+                first = offset
+            stored = self._map[offset : offset + 16]
+            if stored == digest or stored == self._EMPTY:
+                break
+        else:
+            # All probed slots are used, replace the first one
+            offset = first
+        self._RECORD.pack_into(self._map, offset, digest, num_values, *padded)
+
+    def flush(self) -> None:
+        self._map.flush()
+
+    def close(self) -> None:
+        if not self._map.closed:
+            self._map.flush()
+            self._map.close()
+        self._file.close()
+
+
+def _num_values(kind: str, value: Any) -> int:
+    # Return the number of floats in a cached result
+    return len(value) if kind in _LIST_KINDS else 1
+
+
+class AnalysisCache:
+    """
+    A bounded cache of the analysis results of cubics, like extrema, inflections and
+    lengths, keyed by their control points. When the cache holds more than `maxsize`
+    results or more than `maxvalues` floats in total, the least recently used results
+    are evicted. A length table counts as `LENGTH_TABLE_STEPS + 1` floats. Results that
+    are missing from the cache are looked up in the optional store, so they can be
+    shared between runs.
+
+    The cache can be used by several threads. Results are computed outside of the lock,
+    so two threads may compute the same result at the same time.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 65536,
+        normalize: bool = False,
+        store: MappedStore | None = None,
+        maxvalues: int = 262144,
+    ) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        if maxvalues < 1:
+            raise ValueError("maxvalues must be at least 1")
+
+        # The maximum number of cached results
+        self.maxsize = maxsize
+
+        # The maximum number of floats in the cached results
+        self.maxvalues = maxvalues
+
+        # Share the results that don't depend on the position between cubics that only
+        # differ by a translation. The results are calculated for the first cubic, so
+        # they may differ from the results for the other cubics in the last bits.
+        self.normalize = normalize
+
+        # The optional persistent store
+        self.store = store
+
+        self.hits = 0
+        self.misses = 0
+        self.store_hits = 0
+        self._data: OrderedDict[tuple, Any] = OrderedDict()
+        self._num_values = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        return "<AnalysisCache len=%i, maxsize=%i>" % (len(self._data), self.maxsize)
+
+    def _key(
+        self,
+        kind: str,
+        points: "Sequence[PointTuple]",
+        extra: Hashable,
+    ) -> tuple:
+        (x1, y1), (x2, y2), (x3, y3), (x4, y4) = points
+        if self.normalize and kind in _INVARIANT_KINDS:
+            return (
+                kind,
+                extra,
+                x2 - x1,
+                y2 - y1,
+                x3 - x1,
+                y3 - y1,
+                x4 - x1,
+                y4 - y1,
+            )
+        return kind, extra, x1, y1, x2, y2, x3, y3, x4, y4
+
+    def lookup(
+        self,
+        kind: str,
+        points: "Sequence[PointTuple]",
+        compute: Callable[[], Any],
+        extra: Hashable = None,
+    ) -> Any:
+        """
+        Return the cached result for the cubic, or compute and cache it.
+
+        Args:
+            kind (str): The kind of result, e.g. "extrema"
+            points (Sequence[PointTuple]): The four points of the cubic
+            compute (Callable[[], Any]): The function that computes the result
+            extra (Hashable, optional): Other parameters the result depends on, e.g.
+                the length tolerance. Defaults to None.
+
+        Returns:
+            Any: The result. Lists are copied, so they can be modified by the caller.
+        """
+        key = self._key(kind, points, extra)
+        data = self._data
+        with self._lock:
+            value = data.get(key, _MISSING)
+            if value is _MISSING:
+                self.misses += 1
+            else:
+                data.move_to_end(key)
+                self.hits += 1
+        if value is _MISSING:
+            value = self._load_or_compute(kind, key, compute)
+            with self._lock:
+                previous = data.get(key, _MISSING)
+                if previous is not _MISSING:
+                    # Another thread computed the same result
+                    self._num_values -= _num_values(kind, previous)
+                data[key] = value
+                self._num_values += _num_values(kind, value)
+                while len(data) > 1 and (
+                    len(data) > self.maxsize or self._num_values > self.maxvalues
+                ):
+                    old_key, old_value = data.popitem(last=False)
+                    self._num_values -= _num_values(old_key[0], old_value)
+        if kind in _LIST_KINDS:
+            return list(value)
+        return value
+
+    def _load_or_compute(
+        self, kind: str, key: tuple, compute: Callable[[], Any]
+    ) -> Any:
+        store = self.store
+        if store is None or kind not in _STORED_KINDS:
+            value = compute()
+            return tuple(value) if kind in _LIST_KINDS else value
+
+        digest = blake2b(repr(key).encode(), digest_size=16).digest()
+        with self._lock:
+            values = store.get(digest)
+            if values is not None:
+                self.store_hits += 1
+        if values is not None:
+            return values[0] if kind == "length" else values
+
+        value = compute()
+        if kind == "length":
+            with self._lock:
+                store.put(digest, (value,))
+            return value
+        value = tuple(value)
+        if len(value) <= MAX_STORED_VALUES:
+            with self._lock:
+                store.put(digest, value)
+        return value
+
+    def clear(self) -> None:
+        # Remove all cached results and reset the counters. The store is not changed.
+        with self._lock:
+            self._data.clear()
+            self._num_values = 0
+            self.hits = 0
+            self.misses = 0
+            self.store_hits = 0
+
+
+_analysis_cache: AnalysisCache | None = None
+
+
+def get_analysis_cache() -> AnalysisCache | None:
+    """
+    Return the process-wide analysis cache.
+
+    Returns:
+        AnalysisCache | None: The cache, or None if caching is disabled
+    """
+    return _analysis_cache
+
+
+def set_analysis_cache(cache: AnalysisCache | None) -> AnalysisCache | None:
+    """
+    Set the process-wide analysis cache that is used by all cubics. Caching is
+    disabled by default.
+
+    Args:
+        cache (AnalysisCache | None): The cache, or None to disable caching
+
+    Returns:
+        AnalysisCache | None: The previous cache
+    """
+    global _analysis_cache
+    previous = _analysis_cache
+    _analysis_cache = cache
+    return previous
@@ -0,0 +1,380 @@
+from array import array
+from bisect import bisect_left
+from math import hypot
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Sequence
+
+from fontgeometry.cubics import BaseCubic
+
+if TYPE_CHECKING:
+    from fontgeometry.prepared import PreparedCubic
+    from fontgeometry.typing import BoundsTuple, PointTuple
+
+# Flags for the cached values of each cubic
+_HAS_PARAMS = 1
+_HAS_LENGTH = 2
+_HAS_BOUNDS = 4
+
+
+class CubicArray:
+    """
+    A compact container for many cubics. The control points and the cached parameters
+    and lengths of all cubics are stored in flat arrays of floats, instead of one
+    Python object per cubic. Indexing the container returns a lightweight `CubicView`
+    that implements the `Cubic` API on top of the arrays.
+    """
+
+    def __init__(
+        self,
+        cubics: "Iterable[Sequence[PointTuple]]" = (),
+        raster_length: float = 0.25,
+        length_tolerance: float | None = None,
+        flatten_tolerance: float | None = None,
+    ) -> None:
+        # The settings shared by all cubics, see `Cubic`
+        self.raster_length = raster_length
+        self.length_tolerance = length_tolerance
+        self.flatten_tolerance = flatten_tolerance
+
+        # The control points, 8 floats per cubic: x1, y1, x2, y2, x3, y3, x4, y4
+        self.coords = array("d")
+
+        # The cached parameters (8 floats per cubic), lengths and bounds (4 floats per
+        # cubic)
+        self._params = array("d")
+        self._lengths = array("d")
+        self._bounds = array("d")
+        self._flags = bytearray()
+
+        # The current split position of each cubic, see `Cubic.split_at_t`
+        self._split_ts = array("d")
+
+        # The cached polylines of all cubics: The t values and the point coordinates
+        # (x, y) one after another, and the index of the first point and the number of
+        # points for each cubic. The index is -1 until the polyline is calculated.
+        self._polyline_ts = array("d")
+        self._polyline_coords = array("d")
+        self._polyline_spans = array("q")
+
+        # Cached values of variable size, by cubic index
+        self._extrema: dict[int, list[float]] = {}
+        self._inflections: dict[int, list[float]] = {}
+        self._length_tables: dict[int, list[float]] = {}
+
+        for pt1, pt2, pt3, pt4 in cubics:
+            self.append(pt1, pt2, pt3, pt4)
+
+    def __len__(self) -> int:
+        return len(self._flags)
+
+    def __repr__(self) -> str:
+        return "<CubicArray len=%i>" % len(self)
+
+    def __getitem__(self, index: int) -> "CubicView":
+        n = len(self)
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError("CubicArray index out of range")
+        return CubicView(self, index)
+
+    def __iter__(self) -> "Iterator[CubicView]":
+        for index in range(len(self)):
+            yield CubicView(self, index)
+
+    @classmethod
+    def from_cubics(
+        cls,
+        cubics: "Iterable[BaseCubic]",
+        raster_length: float = 0.25,
+        length_tolerance: float | None = None,
+        flatten_tolerance: float | None = None,
+    ) -> "CubicArray":
+        """
+        Build a cubic array from cubic objects.
+
+        Args:
+            cubics (Iterable[BaseCubic]): The cubics, e.g. from `SuperCubic.cubics`
+            raster_length (float, optional): The raster length. Defaults to 0.25.
+            length_tolerance (float | None, optional): The maximum error of the
+                calculated curve lengths, or None to estimate them. Defaults to None.
+            flatten_tolerance (float | None, optional): The maximum distance between
+                the curves and their points, or None to use evenly spaced points.
+                Defaults to None.
+
+        Returns:
+            CubicArray: The cubic array
+        """
+        return cls(
+            ((c.pt1, c.pt2, c.pt3, c.pt4) for c in cubics),
+            raster_length,
+            length_tolerance,
+            flatten_tolerance,
+        )
+
+    def append(
+        self,
+        pt1: "PointTuple",
+        pt2: "PointTuple",
+        pt3: "PointTuple",
+        pt4: "PointTuple",
+    ) -> None:
+        """
+        Add a cubic by specifying four points.
+
+        Args:
+            pt1 (PointTuple): The first point
+            pt2 (PointTuple): The second point
+            pt3 (PointTuple): The third point
+            pt4 (PointTuple): The fourth point
+        """
+        self.coords.extend(
+            (pt1[0], pt1[1], pt2[0], pt2[1], pt3[0], pt3[1], pt4[0], pt4[1])
+        )
+        self._params.extend((0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0))
+        self._lengths.append(0.0)
+        self._bounds.extend((0.0, 0.0, 0.0, 0.0))
+        self._flags.append(0)
+        self._split_ts.append(0.0)
+        self._polyline_spans.extend((-1, 0))
+
+    def to_numpy(self) -> Any:
+        """
+        Return a copy of the control points as a NumPy array of shape (N, 4, 2), e.g.
+        for the functions in `fontgeometry.batch`.
+
+        Returns:
+            numpy.ndarray: The control points
+        """
+        import numpy as np
+
+        return np.array(self.coords, dtype=np.float64).reshape(-1, 4, 2)
+
+    def get_point(self, index: int, point_index: int) -> "PointTuple":
+        # Return one of the four points of a cubic
+        i = index * 8 + point_index * 2
+        coords = self.coords
+        return coords[i], coords[i + 1]
+
+    def get_params(
+        self, index: int
+    ) -> "tuple[PointTuple, PointTuple, PointTuple, PointTuple]":
+        # Return the cached parameters of a cubic, calculate them if needed
+        i = index * 8
+        p = self._params
+        if not self._flags[index] & _HAS_PARAMS:
+            view = CubicView(self, index)
+            (ax, ay), (bx, by), (cx, cy), (dx, dy) = view.calculate_params()
+            p[i : i + 8] = array("d", (ax, ay, bx, by, cx, cy, dx, dy))
+            self._flags[index] |= _HAS_PARAMS
+        return (
+            (p[i], p[i + 1]),
+            (p[i + 2], p[i + 3]),
+            (p[i + 4], p[i + 5]),
+            (p[i + 6], p[i + 7]),
+        )
+
+    def get_bounds(self, index: int) -> "BoundsTuple":
+        # Return the cached bounds of a cubic, calculate them if needed
+        i = index * 4
+        b = self._bounds
+        if not self._flags[index] & _HAS_BOUNDS:
+            view = CubicView(self, index)
+            b[i : i + 4] = array("d", view.calculate_bounds())
+            self._flags[index] |= _HAS_BOUNDS
+        return b[i], b[i + 1], b[i + 2], b[i + 3]
+
+    def get_length(self, index: int) -> float:
+        # Return the cached length of a cubic, calculate it if needed
+        if not self._flags[index] & _HAS_LENGTH:
+            view = CubicView(self, index)
+            self._lengths[index] = view._analyze(
+                "length", view.calculate_length, self.length_tolerance
+            )
+            self._flags[index] |= _HAS_LENGTH
+        return self._lengths[index]
+
+    def get_polyline_span(self, index: int) -> tuple[int, int]:
+        # Return the index of the first point of the cached polyline of a cubic in
+        # _polyline_ts, and the number of points. Calculate the polyline if needed.
+        spans = self._polyline_spans
+        start = spans[index * 2]
+        if start < 0:
+            ts, points = CubicView(self, index).calculate_polyline()
+            start = len(self._polyline_ts)
+            self._polyline_ts.extend(ts)
+            coords = self._polyline_coords
+            for x, y in points:
+                coords.append(x)
+                coords.append(y)
+            spans[index * 2] = start
+            spans[index * 2 + 1] = len(ts)
+        return start, spans[index * 2 + 1]
+
+
+class CubicView(BaseCubic):
+    """
+    A cubic stored in a `CubicArray`. It has the same API as `Cubic`, but keeps its
+    points and cached values in the array.
+    """
+
+    __slots__ = ("_array", "_index")
+
+    def __init__(self, cubic_array: CubicArray, index: int) -> None:
+        self._array = cubic_array
+        self._index = index
+
+    @property
+    def _t(self) -> float:
+        # The current split point is stored in the array, so it is shared by all views
+        # of the cubic
+        return self._array._split_ts[self._index]
+
+    @_t.setter
+    def _t(self, t: float) -> None:
+        self._array._split_ts[self._index] = t
+
+    def __repr__(self) -> str:
+        return "<CubicView pt1=%s, pt4=%s>" % (self.pt1, self.pt4)
+
+    @property
+    def index(self) -> int:
+        return self._index
+
+    @property
+    def pt1(self) -> "PointTuple":
+        return self._array.get_point(self._index, 0)
+
+    @property
+    def pt2(self) -> "PointTuple":
+        return self._array.get_point(self._index, 1)
+
+    @property
+    def pt3(self) -> "PointTuple":
+        return self._array.get_point(self._index, 2)
+
+    @property
+    def pt4(self) -> "PointTuple":
+        return self._array.get_point(self._index, 3)
+
+    @property
+    def raster_length(self) -> float:
+        return self._array.raster_length
+
+    @property
+    def length_tolerance(self) -> float | None:
+        return self._array.length_tolerance
+
+    @property
+    def flatten_tolerance(self) -> float | None:
+        return self._array.flatten_tolerance
+
+    @property
+    def bounds(self) -> "BoundsTuple":
+        return self._array.get_bounds(self._index)
+
+    @property
+    def extrema(self) -> list[float]:
+        cache = self._array._extrema
+        extrema = cache.get(self._index)
+        if extrema is None:
+            extrema = cache[self._index] = self._analyze(
+                "extrema", self.calculate_extrema
+            )
+        return extrema
+
+    @property
+    def extremum_points(self) -> "list[PointTuple]":
+        return self.calculate_extremum_points()
+
+    @property
+    def inflections(self) -> list[float]:
+        cache = self._array._inflections
+        inflections = cache.get(self._index)
+        if inflections is None:
+            inflections = cache[self._index] = self._analyze(
+                "inflections", self.calculate_inflections
+            )
+        return inflections
+
+    @property
+    def inflection_points(self) -> "list[PointTuple]":
+        return self.calculate_inflection_points()
+
+    @property
+    def length(self) -> float:
+        return self._array.get_length(self._index)
+
+    @property
+    def length_table(self) -> list[float]:
+        cache = self._array._length_tables
+        table = cache.get(self._index)
+        if table is None:
+            table = cache[self._index] = self._analyze(
+                "length_table", self.calculate_length_table, self.length_tolerance
+            )
+        return table
+
+    @property
+    def params(self) -> "tuple[PointTuple, PointTuple, PointTuple, PointTuple]":
+        return self._array.get_params(self._index)
+
+    @property
+    def moments(self) -> tuple[float, float, float]:
+        return self.calculate_moments()
+
+    @property
+    def prepared(self) -> "PreparedCubic":
+        return self.calculate_prepared()
+
+    @property
+    def raster_steps(self) -> int:
+        return self.calculate_raster_steps()
+
+    # The polyline is stored in the flat arrays of the cubic array. The lists are
+    # built on each access, the searches read the arrays directly.
+
+    @property
+    def polyline(self) -> "tuple[list[float], list[PointTuple]]":
+        return self.cubic_ts, self.cubic_points
+
+    @property
+    def cubic_points(self) -> "list[PointTuple]":
+        start, num_points = self._array.get_polyline_span(self._index)
+        coords = self._array._polyline_coords[start * 2 : (start + num_points) * 2]
+        return list(zip(coords[::2], coords[1::2]))
+
+    @property
+    def cubic_ts(self) -> list[float]:
+        start, num_points = self._array.get_polyline_span(self._index)
+        return self._array._polyline_ts[start : start + num_points].tolist()
+
+    @property
+    def num_cubic_points(self) -> int:
+        return self._array.get_polyline_span(self._index)[1] - 1
+
+    def find_step(self, pt: "PointTuple", start: int = 0) -> int | None:
+        # As BaseCubic.find_step, without building the list of points
+        first, num_points = self._array.get_polyline_span(self._index)
+        coords = self._array._polyline_coords
+        xs = coords[(first + start) * 2 : (first + num_points) * 2 : 2]
+        ys = coords[(first + start) * 2 + 1 : (first + num_points) * 2 : 2]
+        x, y = pt
+        prev_dist: float | None = None
+        step = start
+        for px, py in zip(xs, ys):
+            dist = hypot(y - py, x - px)
+            if prev_dist is not None and dist > prev_dist:
+                return step
+            prev_dist = dist
+            step += 1
+        return None
+
+    def step_t(self, step: int) -> float:
+        start, _ = self._array.get_polyline_span(self._index)
+        return self._array._polyline_ts[start + step]
+
+    def t_step(self, t: float) -> int:
+        start, num_points = self._array.get_polyline_span(self._index)
+        return (
+            bisect_left(self._array._polyline_ts, t, start, start + num_points) - start
+        )
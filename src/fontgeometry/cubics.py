@@ -1,23 +1,424 @@
+import logging
+from bisect import bisect_left, bisect_right
 from functools import cached_property
-from math import hypot
-from typing import TYPE_CHECKING, Sequence
+from math import ceil, floor, hypot
+from time import perf_counter
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Hashable,
+    Iterable,
+    NamedTuple,
+    Sequence,
+)
 
 from fontgeometry.beziertools import (
     estimateCubicCurveLength,
+    getArcLengthForCubicParameters,
+    getArcLengthForQuadratic,
+    getBoundsForCubic,
+    getBoundsForQuadratic,
     getExtremaForCubic,
+    getExtremaForQuadratic,
+    getFlattenedPointsForCubic,
     getInflectionsForCubic,
+    getMomentsForCubicParameters,
+    getPointListForQuadratic,
     getPointOnCubic,
+    splitCubicAtTs,
+)
+from fontgeometry.cache import PointCache, get_analysis_cache
+from fontgeometry.ftbeziertools import (
+    calcCubicParameters,
+    calcQuadraticParameters,
+    solveCubic,
+)
+from fontgeometry.geometry import union_bounds
+from fontgeometry.instrument import get_stats, timed
+from fontgeometry.prepared import PreparedCubic
+from fontgeometry.projection import (
+    project_point_on_cubic_parameters,
+    project_point_on_cubics,
+    project_points_on_cubics,
 )
-from fontgeometry.ftbeziertools import calcCubicParameters, solveCubic
 from fontgeometry.rounding import round_hup
 
 if TYPE_CHECKING:
-    from fontgeometry.typing import PointTuple
+    from fontgeometry.typing import BoundsTuple, PointTuple
+
+# The split functions of SuperCubic log their progress at the DEBUG level
+logger = logging.getLogger(__name__)
+
+# The number of intervals in the arc length table of a cubic
+LENGTH_TABLE_STEPS = 16
+
+# The default maximum error of lengths when converting between t and arc length
+LENGTH_TOLERANCE = 0.001
+
+# The default size and grid of the cache of t values for points in SuperCubic. By
+# default, only identical points share a cache entry.
+T_CACHE_SIZE = 4096
+T_CACHE_GRID: float | None = None
+
+
+class SplitCursor(NamedTuple):
+    # The immutable search and split position in a SuperCubic, for the methods that
+    # take a cursor instead of storing the position in the super cubic, e.g.
+    # `SuperCubic.split_at_pt_from`
+
+    # The cubic index and the step in its cubic_points where the search continues
+    index: int = 0
+    step: int = 0
+
+    # The cubic index and t of the previous split
+    split_index: int = 0
+    split_t: float = 0.0
+
+
+class BaseCubic:
+    # The calculations shared by Cubic and the array-backed CubicView. Subclasses
+    # provide the points pt1 to pt4, raster_length, length_tolerance,
+    # flatten_tolerance, the split position _t, and the cached properties used here,
+    # e.g. params and prepared.
+
+    __slots__ = ()
+
+    def _analyze(
+        self, kind: str, compute: "Callable[[], Any]", extra: "Hashable" = None
+    ) -> "Any":
+        # Return the result of compute, from the process-wide analysis cache if it is
+        # enabled. Only used for the results that are more expensive to calculate than
+        # to look up, see fontgeometry.cache.
+        cache = get_analysis_cache()
+        if cache is None:
+            return compute()
+        return cache.lookup(
+            kind, (self.pt1, self.pt2, self.pt3, self.pt4), compute, extra
+        )
+
+    def calculate_cubic_points(self) -> "list[PointTuple]":
+        # Return a list of point coordinates for the cubic curve
+        return self.calculate_polyline()[1]
+
+    def calculate_polyline(self) -> "tuple[list[float], list[PointTuple]]":
+        # Return the t values and the points of the polyline for the cubic curve. If
+        # flatten_tolerance is None, the points are evenly spaced according to the
+        # current raster_steps value, else the curve is flattened adaptively.
+        # Instrumented inline instead of with the timed decorator, see
+        # fontgeometry.instrument.
+        stats = get_stats()
+        start = perf_counter() if stats is not None else 0.0
+        if self.flatten_tolerance is not None:
+            polyline = getFlattenedPointsForCubic(
+                self.pt1, self.pt2, self.pt3, self.pt4, self.flatten_tolerance
+            )
+        elif self.raster_steps < 2 or (self.pt1 == self.pt2) and (self.pt3 == self.pt4):
+            polyline = [0.0, 1.0], [self.pt1, self.pt4]
+        else:
+            num_steps = self.raster_steps
+            step = 1 / num_steps
+            t_list = self.prepared.points([t * step for t in range(0, num_steps + 1)])
+            polyline = [t / num_steps for t in range(0, num_steps + 1)], t_list
+        if stats is not None:
+            stats.add_call("BaseCubic.calculate_polyline", perf_counter() - start)
+        return polyline
+
+    def calculate_bounds(self) -> "BoundsTuple":
+        return getBoundsForCubic(self.pt1, self.pt2, self.pt3, self.pt4)
+
+    def calculate_extrema(self) -> list[float]:
+        return getExtremaForCubic(
+            self.pt1,
+            self.pt2,
+            self.pt3,
+            self.pt4,
+            h=True,
+            v=False,
+            include_start_end=True,
+        )
+
+    def calculate_extremum_points(self) -> "list[PointTuple]":
+        return [self.get_cubic_point(t) for t in self.extrema]
+
+    def calculate_length(self) -> float:
+        # The length is the last entry of the length table, so that it agrees with
+        # length_at_t and t_at_length
+        return self.length_table[-1]
+
+    def calculate_length_table(self) -> list[float]:
+        step = 1 / LENGTH_TABLE_STEPS
+        table = [0.0]
+        length = 0.0
+        for i in range(LENGTH_TABLE_STEPS):
+            length += self._arc_length(i * step, (i + 1) * step)
+            table.append(length)
+        return table
+
+    def _arc_length(self, t0: float, t1: float) -> float:
+        # Return the arc length from t0 to t1, for the length table and the conversion
+        # between t and arc length
+        return getArcLengthForCubicParameters(
+            self.params, t0, t1, self._length_table_tolerance
+        )
+
+    @property
+    def _length_table_tolerance(self) -> float:
+        # The tolerance for each interval of the arc length table
+        tolerance = self.length_tolerance
+        if tolerance is None:
+            tolerance = LENGTH_TOLERANCE
+        return tolerance / LENGTH_TABLE_STEPS
+
+    def calculate_inflections(self) -> list[float]:
+        # TODO: Inflections "between" segments
+        return getInflectionsForCubic(self.pt1, self.pt2, self.pt3, self.pt4)
+
+    def calculate_inflection_points(self) -> "list[PointTuple]":
+        return [self.get_cubic_point(t) for t in self.inflections]
+
+    def calculate_params(
+        self,
+    ) -> "tuple[PointTuple, PointTuple, PointTuple, PointTuple]":
+        return calcCubicParameters(self.pt1, self.pt2, self.pt3, self.pt4)
+
+    def calculate_moments(self) -> tuple[float, float, float]:
+        return getMomentsForCubicParameters(self.params)
+
+    def calculate_prepared(self) -> PreparedCubic:
+        return PreparedCubic(self.pt1, self.pt2, self.pt3, self.pt4, self.params)
+
+    def calculate_raster_steps(self) -> int:
+        return round_hup(self._raster_length() / self.raster_length)
+
+    def _raster_length(self) -> float:
+        # The length from which the number of raster steps is calculated. Without a
+        # length_tolerance, the faster estimate is precise enough.
+        if self.length_tolerance is None:
+            return estimateCubicCurveLength(self.pt1, self.pt2, self.pt3, self.pt4)
+        return self.length
+
+    def get_cubic_point(self, t: float) -> "PointTuple":
+        # The extremum and inflection points are calculated here, so keep the exact
+        # results of getPointOnCubic. Use prepared.point for fast evaluation.
+        return getPointOnCubic(t, self.pt1, self.pt2, self.pt3, self.pt4)
+
+    def get_cubic_curvature(self, t: float) -> float:
+        """
+        Return the signed curvature of the cubic at t, see `PreparedCubic.curvature`.
+
+        Args:
+            t (float): The t value
+
+        Returns:
+            float: The curvature
+        """
+        return self.prepared.curvature(t)
+
+    def get_cubic_speed(self, t: float) -> float:
+        """
+        Return the length of the first derivative of the cubic at t, i.e. the rate of
+        change of the arc length.
+
+        Args:
+            t (float): The t value
+
+        Returns:
+            float: The speed
+        """
+        return self.prepared.speed(t)
+
+    def length_at_t(self, t: float) -> float:
+        """
+        Return the arc length from the start of the cubic to t.
+
+        Args:
+            t (float): The t value, 0.0 to 1.0
+
+        Returns:
+            float: The arc length
+        """
+        if t <= 0.0:
+            return 0.0
+        if t >= 1.0:
+            return self.length
+        table = self.length_table
+        i = int(t * LENGTH_TABLE_STEPS)
+        return table[i] + self._arc_length(i / LENGTH_TABLE_STEPS, t)
+
+    def t_at_length(self, length: float) -> float:
+        """
+        Return the t value at which the arc length from the start of the cubic equals
+        the given length. The interval is found by binary search in the length table,
+        then refined by Newton iterations.
 
-DEBUG_SPLIT = False
+        Args:
+            length (float): The arc length. Lengths outside of the curve are clamped.
 
+        Returns:
+            float: The t value, 0.0 to 1.0
+        """
+        if length <= 0.0:
+            return 0.0
+        if length >= self.length:
+            return 1.0
+        table = self.length_table
+
+        i = min(bisect_right(table, length) - 1, LENGTH_TABLE_STEPS - 1)
+        # Bracket of the solution
+        t0 = i / LENGTH_TABLE_STEPS
+        t1 = (i + 1) / LENGTH_TABLE_STEPS
+        s0 = table[i]
+        s1 = table[i + 1]
+        # Initial guess by linear interpolation inside the interval
+        t = t0 + (t1 - t0) * (length - s0) / (s1 - s0)
+        tolerance = self._length_table_tolerance
+        for _ in range(16):
+            s = s0 + self._arc_length(t0, t)
+            diff = s - length
+            if abs(diff) <= tolerance:
+                break
+            # Narrow the bracket
+            if diff > 0:
+                t1 = t
+            else:
+                t0 = t
+                s0 = s
+            speed = self.get_cubic_speed(t)
+            t_new = t - diff / speed if speed > 0 else t
+            if not t0 < t_new < t1:
+                # Newton step left the bracket, bisect instead
+                t_new = (t0 + t1) * 0.5
+            t = t_new
+        return t
+
+    def project_point(self, pt: "PointTuple") -> tuple[float, float]:
+        """
+        Return the t value of the point on the cubic that is closest to pt, and the
+        distance between both points.
+
+        Args:
+            pt (PointTuple): The point to project onto the cubic
+
+        Returns:
+            tuple[float, float]: The t value, 0.0 to 1.0, and the distance
+        """
+        return project_point_on_cubic_parameters(self.params, pt)
+
+    def find_step(self, pt: "PointTuple", start: int = 0) -> int | None:
+        """
+        Walk the points of the cubic from the step start, and return the first step at
+        which the distance to pt increases, i.e. the step after the closest point.
+
+        Args:
+            pt (PointTuple): The point
+            start (int, optional): The step at which the walk starts. Defaults to 0.
+
+        Returns:
+            int | None: The step, or None if the distance decreases until the end
+        """
+        x, y = pt
+        points = self.cubic_points
+        prev_dist: float | None = None
+        for step in range(start, len(points)):
+            px, py = points[step]
+            dist = hypot(y - py, x - px)  # Point distance
+            if prev_dist is not None and dist > prev_dist:
+                return step
+            prev_dist = dist
+        return None
+
+    def step_t(self, step: int) -> float:
+        # Return the t value of the point at step in cubic_points
+        return self.cubic_ts[step]
+
+    def t_step(self, t: float) -> int:
+        # Return the first step in cubic_points whose t value is not less than t
+        return bisect_left(self.cubic_ts, t)
+
+    def reset_split(self) -> None:
+        self._t = 0.0
+
+    def split_at_ts(
+        self, ts: "Iterable[float]"
+    ) -> "list[tuple[PointTuple, PointTuple, PointTuple, PointTuple]]":
+        """
+        Split the cubic at several t values in one pass. Unlike `split_at_t`, this
+        doesn't depend on or change the current split position.
+
+        Args:
+            ts (Iterable[float]): The sorted t values, e.g. the extrema and inflections.
+                Values outside of 0 < t < 1 are ignored.
+
+        Returns:
+            list[tuple[PointTuple, PointTuple, PointTuple, PointTuple]]: The pieces
+        """
+        return splitCubicAtTs(self.pt1, self.pt2, self.pt3, self.pt4, ts)
 
-class Cubic:
+    def split_at_t(
+        self, t: float
+    ) -> "tuple[PointTuple, PointTuple, PointTuple, PointTuple]":
+        # Return the piece from the current split position to t, and move the split
+        # position to t. Instrumented inline, see calculate_polyline.
+        stats = get_stats()
+        if stats is None:
+            segment = self.split_between(self._t, t)
+        else:
+            start = perf_counter()
+            segment = self.split_between(self._t, t)
+            stats.add_call("BaseCubic.split_at_t", perf_counter() - start)
+        self._t = t
+        return segment
+
+    def split_between(
+        self, t0: float, t1: float
+    ) -> "tuple[PointTuple, PointTuple, PointTuple, PointTuple]":
+        """
+        Return the piece of the cubic from t0 to t1. Unlike `split_at_t`, this doesn't
+        depend on or change the current split position.
+
+        Args:
+            t0 (float): The start of the piece
+            t1 (float): The end of the piece
+
+        Returns:
+            tuple[PointTuple, PointTuple, PointTuple, PointTuple]: The piece
+        """
+        # From https://stackoverflow.com/questions/878862/drawing-part-of-a-bézier-curve
+        # -by-reusing-a-basic-bézier-curve-function
+
+        u0 = 1.0 - t0
+        u1 = 1.0 - t1
+
+        x1, y1 = self.pt1
+        bx1, by1 = self.pt2
+        bx2, by2 = self.pt3
+        x2, y2 = self.pt4
+
+        qxa = x1 * u0 * u0 + bx1 * 2 * t0 * u0 + bx2 * t0 * t0
+        qxb = x1 * u1 * u1 + bx1 * 2 * t1 * u1 + bx2 * t1 * t1
+        qxc = bx1 * u0 * u0 + bx2 * 2 * t0 * u0 + x2 * t0 * t0
+        qxd = bx1 * u1 * u1 + bx2 * 2 * t1 * u1 + x2 * t1 * t1
+
+        qya = y1 * u0 * u0 + by1 * 2 * t0 * u0 + by2 * t0 * t0
+        qyb = y1 * u1 * u1 + by1 * 2 * t1 * u1 + by2 * t1 * t1
+        qyc = by1 * u0 * u0 + by2 * 2 * t0 * u0 + y2 * t0 * t0
+        qyd = by1 * u1 * u1 + by2 * 2 * t1 * u1 + y2 * t1 * t1
+
+        xa = qxa * u0 + qxc * t0
+        xb = qxa * u1 + qxc * t1
+        xc = qxb * u0 + qxd * t0
+        xd = qxb * u1 + qxd * t1
+
+        ya = qya * u0 + qyc * t0
+        yb = qya * u1 + qyc * t1
+        yc = qyb * u0 + qyd * t0
+        yd = qyb * u1 + qyd * t1
+
+        return ((xa, ya), (xb, yb), (xc, yc), (xd, yd))
+
+
+class Cubic(BaseCubic):
     def __init__(
         self,
         pt1: "PointTuple",
@@ -25,6 +426,8 @@ class Cubic:
         pt3: "PointTuple",
         pt4: "PointTuple",
         raster_length: float = 0.25,
+        length_tolerance: float | None = None,
+        flatten_tolerance: float | None = None,
     ) -> None:
         self.pt1 = pt1
         self.pt2 = pt2
@@ -34,9 +437,18 @@ class Cubic:
         # The estimated length of each distance if the cubic is converted to points
         self.raster_length = raster_length
 
-        # The list of points on the cubic, with estimated raster_length distance
-        self._cubic_points: "list[PointTuple] | None" = None
-        self._num_cubic_points: int | None = None
+        # The maximum error of the curve length. If None, the length is estimated
+        # from a polyline, else it is calculated by Gauss-Legendre quadrature.
+        self.length_tolerance = length_tolerance
+
+        # The maximum distance between the curve and the list of points on the cubic.
+        # If None, the points have raster_length distance, else the curve is flattened
+        # adaptively, with few points on flat parts of the curve.
+        self.flatten_tolerance = flatten_tolerance
+
+        # The t values and the list of points on the cubic. They are stored together,
+        # so threads never see the values of different calculations.
+        self._polyline: "tuple[list[float], list[PointTuple]] | None" = None
 
         # The current split point (will be moved along the curve when splitting)
         self._t = 0.0
@@ -44,9 +456,19 @@ class Cubic:
     def __repr__(self) -> str:
         return "<Cubic pt1=%s, pt4=%s>" % (self.pt1, self.pt4)
 
+    @cached_property
+    def bounds(self) -> "BoundsTuple":
+        """
+        The tight bounding box of the curve, including the extrema in both directions.
+
+        Returns:
+            BoundsTuple: The bounding box as (xMin, yMin, xMax, yMax)
+        """
+        return self.calculate_bounds()
+
     @cached_property
     def extrema(self) -> list[float]:
-        return self.calculate_extrema()
+        return self._analyze("extrema", self.calculate_extrema)
 
     @cached_property
     def extremum_points(self) -> "list[PointTuple]":
@@ -54,7 +476,7 @@ class Cubic:
 
     @cached_property
     def inflections(self) -> list[float]:
-        return self.calculate_inflections()
+        return self._analyze("inflections", self.calculate_inflections)
 
     @cached_property
     def inflection_points(self) -> "list[PointTuple]":
@@ -63,16 +485,53 @@ class Cubic:
     @cached_property
     def length(self) -> float:
         """
-        The calculated estimated curve length.
+        The curve length, accurate to the length_tolerance of the cubic, or to
+        LENGTH_TOLERANCE if it is None. It is the last entry of `length_table`, so it
+        agrees with `length_at_t`, `t_at_length` and `SuperCubic.length`.
 
         Returns:
             float: The curve length
         """
-        return estimateCubicCurveLength(self.pt1, self.pt2, self.pt3, self.pt4)
+        return self._analyze("length", self.calculate_length, self.length_tolerance)
+
+    @cached_property
+    def length_table(self) -> list[float]:
+        """
+        The cumulative arc lengths at LENGTH_TABLE_STEPS + 1 evenly spaced t values
+        from 0 to 1. The last entry is the total curve length.
+
+        Returns:
+            list[float]: The arc lengths
+        """
+        return self._analyze(
+            "length_table", self.calculate_length_table, self.length_tolerance
+        )
 
     @cached_property
     def params(self) -> "tuple[PointTuple, PointTuple, PointTuple, PointTuple]":
-        return calcCubicParameters(self.pt1, self.pt2, self.pt3, self.pt4)
+        return self.calculate_params()
+
+    @cached_property
+    def moments(self) -> tuple[float, float, float]:
+        """
+        The signed area between the curve and the origin, and its first moments of
+        area, by Green's theorem. Summed over the segments of a closed contour, they
+        give the area and centroid of the contour, see `SuperCubic.moments`.
+
+        Returns:
+            tuple[float, float, float]: The area, and the integrals of x and y over it
+        """
+        return self.calculate_moments()
+
+    @cached_property
+    def prepared(self) -> PreparedCubic:
+        """
+        The cubic with precomputed polynomial parameters, for fast evaluation.
+
+        Returns:
+            PreparedCubic: The prepared cubic
+        """
+        return self.calculate_prepared()
 
     @cached_property
     def raster_steps(self) -> int:
@@ -82,130 +541,287 @@ class Cubic:
         Returns:
             int: The number of steps
         """
-        return round_hup(self.length / self.raster_length)
+        return self.calculate_raster_steps()
+
+    @property
+    def polyline(self) -> "tuple[list[float], list[PointTuple]]":
+        # Calculate or return the cached list of t to point mappings.
+        polyline = self._polyline
+        if polyline is None:
+            polyline = self._polyline = self.calculate_polyline()
+        return polyline
 
     @property
     def cubic_points(self) -> "list[PointTuple]":
         """
-        The list of points on the cubic, with estimated raster_length distance
+        The list of points on the cubic, with estimated raster_length distance, or
+        within flatten_tolerance of the curve.
 
         Returns:
-            list[PointTuple]: _description_
+            list[PointTuple]: The points
         """
-        # Calculate or return the cached list of t to point mappings.
-        if self._cubic_points is None:
-            self._cubic_points = self.calculate_cubic_points()
-            self._num_cubic_points = len(self._cubic_points) - 1
-        return self._cubic_points
+        return self.polyline[1]
+
+    @property
+    def cubic_ts(self) -> list[float]:
+        """
+        The t values of the points in cubic_points.
+
+        Returns:
+            list[float]: The t values
+        """
+        return self.polyline[0]
 
     @property
     def num_cubic_points(self) -> int:
-        if self._num_cubic_points is None:
-            self._cubic_points = self.calculate_cubic_points()
-            self._num_cubic_points = len(self._cubic_points) - 1
-        return self._num_cubic_points
+        return len(self.polyline[1]) - 1
 
-    def calculate_cubic_points(self) -> "list[PointTuple]":
-        # Return a list of point coordinates for the cubic curve according to the
-        # current raster_steps value
-        # st = time()
-        t_list = []
-        if self.raster_steps < 2 or (self.pt1 == self.pt2) and (self.pt3 == self.pt4):
-            t_list = [self.pt1, self.pt4]
-        else:
-            step = 1 / self.raster_steps
-            t_list = [
-                self.get_cubic_point(t * step) for t in range(0, self.raster_steps + 1)
-            ]
 
-        # et = time()
-        # print("calculate_cubic_points: %0.3f ms" % ((et-st)*1000))
-        return t_list
+class Line(Cubic):
+    """
+    A straight line with the same interface as a cubic. The attributes pt1 to pt4 are
+    the control points of the equivalent flat cubic, with the same t values, so the
+    line can be used wherever a cubic is expected. Length, extrema, bounds, the search
+    of t values, projection and splitting are calculated directly from the end points.
+    """
 
-    def calculate_extrema(self) -> list[float]:
-        return getExtremaForCubic(
-            self.pt1,
-            self.pt2,
-            self.pt3,
-            self.pt4,
-            h=True,
-            v=False,
-            include_start_end=True,
+    def __init__(
+        self,
+        pt1: "PointTuple",
+        pt2: "PointTuple",
+        raster_length: float = 0.25,
+        length_tolerance: float | None = None,
+        flatten_tolerance: float | None = None,
+    ) -> None:
+        x1, y1 = pt1
+        x2, y2 = pt2
+        super().__init__(
+            pt1,
+            (x1 + 0.3333333333333333 * (x2 - x1), y1 + 0.3333333333333333 * (y2 - y1)),
+            (x1 + 0.6666666666666667 * (x2 - x1), y1 + 0.6666666666666667 * (y2 - y1)),
+            pt2,
+            raster_length,
+            length_tolerance,
+            flatten_tolerance,
         )
 
-    def calculate_extremum_points(self) -> "list[PointTuple]":
-        return [self.get_cubic_point(t) for t in self.extrema]
+        # The start and end point
+        self.points = (pt1, pt2)
+
+    def __repr__(self) -> str:
+        return "<Line pt1=%s, pt4=%s>" % (self.pt1, self.pt4)
+
+    def _analyze(
+        self, kind: str, compute: "Callable[[], Any]", extra: "Hashable" = None
+    ) -> "Any":
+        # The results are cheaper to calculate than to look up, and must not be mixed
+        # up with the results of the equivalent cubic
+        return compute()
+
+    def calculate_polyline(self) -> "tuple[list[float], list[PointTuple]]":
+        # The points are evenly spaced, or just the end points if the line is
+        # flattened
+        num_steps = self.num_cubic_points
+        ts = [step / num_steps for step in range(num_steps + 1)]
+        return ts, [self.get_cubic_point(t) for t in ts]
+
+    def calculate_bounds(self) -> "BoundsTuple":
+        (x1, y1), (x2, y2) = self.points
+        return min(x1, x2), min(y1, y2), max(x1, x2), max(y1, y2)
+
+    def calculate_extrema(self) -> list[float]:
+        return []
 
     def calculate_inflections(self) -> list[float]:
-        # TODO: Inflections "between" segments
-        return getInflectionsForCubic(self.pt1, self.pt2, self.pt3, self.pt4)
+        return []
+
+    def calculate_length(self) -> float:
+        (x1, y1), (x2, y2) = self.points
+        return hypot(x2 - x1, y2 - y1)
+
+    def calculate_moments(self) -> tuple[float, float, float]:
+        (x1, y1), (x2, y2) = self.points
+        dx = x2 - x1
+        dy = y2 - y1
+        return (
+            0.5 * (x1 * y2 - x2 * y1),
+            0.5 * dy * (x1 * x1 + x1 * dx + dx * dx / 3.0),
+            -0.5 * dx * (y1 * y1 + y1 * dy + dy * dy / 3.0),
+        )
 
-    def calculate_inflection_points(self) -> "list[PointTuple]":
-        return [self.get_cubic_point(t) for t in self.inflections]
+    def _arc_length(self, t0: float, t1: float) -> float:
+        return (t1 - t0) * self.length
+
+    def _raster_length(self) -> float:
+        return self.length
 
     def get_cubic_point(self, t: float) -> "PointTuple":
-        return getPointOnCubic(t, self.pt1, self.pt2, self.pt3, self.pt4)
+        if t == 0:
+            return self.pt1
+        if t == 1:
+            return self.pt4
+        (x1, y1), (x2, y2) = self.points
+        return x1 + (x2 - x1) * t, y1 + (y2 - y1) * t
+
+    def t_at_length(self, length: float) -> float:
+        if length <= 0.0:
+            return 0.0
+        total = self.length
+        if length >= total:
+            return 1.0
+        return length / total
+
+    def project_point(self, pt: "PointTuple") -> tuple[float, float]:
+        t = self._project(pt)
+        t = min(1.0, max(0.0, t))
+        x, y = self.get_cubic_point(t)
+        return t, hypot(pt[0] - x, pt[1] - y)
+
+    def _project(self, pt: "PointTuple") -> float:
+        # Return the unclamped t value of the projection of pt onto the line
+        (x1, y1), (x2, y2) = self.points
+        dx = x2 - x1
+        dy = y2 - y1
+        d2 = dx * dx + dy * dy
+        if d2 == 0:
+            return 0.0
+        return ((pt[0] - x1) * dx + (pt[1] - y1) * dy) / d2
+
+    def find_step(self, pt: "PointTuple", start: int = 0) -> int | None:
+        # The squared distance to pt is a parabola in t, so the distance increases
+        # after the first step past the midpoint between the steps around the closest
+        # point. This gives the same step as walking the points.
+        if self.pt1 == self.pt4:
+            return None
+        num_steps = self.num_cubic_points
+        step = max(start + 1, floor(self._project(pt) * num_steps + 0.5) + 1)
+        if step > num_steps:
+            return None
+        return step
+
+    def step_t(self, step: int) -> float:
+        return step / self.num_cubic_points
+
+    def t_step(self, t: float) -> int:
+        num_steps = self.num_cubic_points
+        step = ceil(t * num_steps)
+        if step > 0 and (step - 1) / num_steps >= t:
+            step -= 1
+        return max(0, min(step, num_steps))
+
+    def split_between(
+        self, t0: float, t1: float
+    ) -> "tuple[PointTuple, PointTuple, PointTuple, PointTuple]":
+        x1, y1 = self.get_cubic_point(t0)
+        x2, y2 = self.get_cubic_point(t1)
+        return (
+            (x1, y1),
+            (x1 + 0.3333333333333333 * (x2 - x1), y1 + 0.3333333333333333 * (y2 - y1)),
+            (x1 + 0.6666666666666667 * (x2 - x1), y1 + 0.6666666666666667 * (y2 - y1)),
+            (x2, y2),
+        )
 
-    def reset_split(self) -> None:
-        self._t = 0.0
+    @property
+    def num_cubic_points(self) -> int:
+        # The number of steps is known without calculating the points
+        if self.flatten_tolerance is not None or self.raster_steps < 2:
+            return 1
+        return self.raster_steps
 
-    def split_at_t(
-        self, t: float
-    ) -> "tuple[PointTuple, PointTuple, PointTuple, PointTuple]":
 
-        # From https://stackoverflow.com/questions/878862/drawing-part-of-a-bézier-curve
-        # -by-reusing-a-basic-bézier-curve-function
+class Quadratic(Cubic):
+    """
+    A quadratic curve, e.g. from a TrueType outline, with the same interface as a
+    cubic. The attributes pt1 to pt4 are the control points of the equivalent cubic,
+    with the same t values, so the quadratic can be used wherever a cubic is expected.
+    Length, extrema, bounds and points are calculated from the quadratic.
+    """
 
-        # st = time()
+    def __init__(
+        self,
+        pt1: "PointTuple",
+        pt2: "PointTuple",
+        pt3: "PointTuple",
+        raster_length: float = 0.25,
+        length_tolerance: float | None = None,
+        flatten_tolerance: float | None = None,
+    ) -> None:
+        (x1, y1), (qx, qy), (x3, y3) = pt1, pt2, pt3
+        super().__init__(
+            pt1,
+            (x1 + (qx - x1) * 2 / 3, y1 + (qy - y1) * 2 / 3),
+            (x3 + (qx - x3) * 2 / 3, y3 + (qy - y3) * 2 / 3),
+            pt3,
+            raster_length,
+            length_tolerance,
+            flatten_tolerance,
+        )
 
-        t0 = self._t
-        t1 = t
+        # The start point, the off-curve point and the end point
+        self.points = (pt1, pt2, pt3)
 
-        u0 = 1.0 - t0
-        u1 = 1.0 - t1
+    def __repr__(self) -> str:
+        return "<Quadratic pt1=%s, pt4=%s>" % (self.pt1, self.pt4)
 
-        x1, y1 = self.pt1
-        bx1, by1 = self.pt2
-        bx2, by2 = self.pt3
-        x2, y2 = self.pt4
+    def _analyze(
+        self, kind: str, compute: "Callable[[], Any]", extra: "Hashable" = None
+    ) -> "Any":
+        # The results must not be mixed up with the results of the equivalent cubic
+        return compute()
 
-        qxa = x1 * u0 * u0 + bx1 * 2 * t0 * u0 + bx2 * t0 * t0
-        qxb = x1 * u1 * u1 + bx1 * 2 * t1 * u1 + bx2 * t1 * t1
-        qxc = bx1 * u0 * u0 + bx2 * 2 * t0 * u0 + x2 * t0 * t0
-        qxd = bx1 * u1 * u1 + bx2 * 2 * t1 * u1 + x2 * t1 * t1
+    def calculate_polyline(self) -> "tuple[list[float], list[PointTuple]]":
+        if self.flatten_tolerance is not None or self.raster_steps < 2:
+            return super().calculate_polyline()
 
-        qya = y1 * u0 * u0 + by1 * 2 * t0 * u0 + by2 * t0 * t0
-        qyb = y1 * u1 * u1 + by1 * 2 * t1 * u1 + by2 * t1 * t1
-        qyc = by1 * u0 * u0 + by2 * 2 * t0 * u0 + y2 * t0 * t0
-        qyd = by1 * u1 * u1 + by2 * 2 * t1 * u1 + y2 * t1 * t1
+        num_steps = self.raster_steps
+        ts = [step / num_steps for step in range(num_steps + 1)]
+        return ts, getPointListForQuadratic(ts, *self.points)
 
-        xa = qxa * u0 + qxc * t0
-        xb = qxa * u1 + qxc * t1
-        xc = qxb * u0 + qxd * t0
-        xd = qxb * u1 + qxd * t1
+    def calculate_bounds(self) -> "BoundsTuple":
+        return getBoundsForQuadratic(*self.points)
 
-        ya = qya * u0 + qyc * t0
-        yb = qya * u1 + qyc * t1
-        yc = qyb * u0 + qyd * t0
-        yd = qyb * u1 + qyd * t1
+    def calculate_extrema(self) -> list[float]:
+        # The inner extrema, and the end points if the curve is horizontal there, as
+        # for cubics
+        (_ax, ay), (_bx, by), _c = calcQuadraticParameters(*self.points)
+        extrema = getExtremaForQuadratic(*self.points, h=True, v=False)
+        if ay != 0:
+            if by == 0:
+                extrema.insert(0, 0.0)
+            elif 2.0 * ay + by == 0:
+                extrema.append(1.0)
+        return extrema
 
-        self._t = t
+    def calculate_inflections(self) -> list[float]:
+        return []
 
-        # et = time()
-        # print("split_at_t: %0.3f ms" % ((et-st)*1000))
+    def calculate_length(self) -> float:
+        return getArcLengthForQuadratic(*self.points)
 
-        return ((xa, ya), (xb, yb), (xc, yc), (xd, yd))
+    def _arc_length(self, t0: float, t1: float) -> float:
+        return getArcLengthForQuadratic(*self.points, t0, t1)
+
+    def _raster_length(self) -> float:
+        return self.length
+
+    def get_cubic_point(self, t: float) -> "PointTuple":
+        return getPointListForQuadratic([t], *self.points)[0]
 
 
 class SuperCubic:
-    # Collection of multiple Cubic segments
+    # Collection of multiple Cubic, Line and Quadratic segments
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        t_cache_size: int = T_CACHE_SIZE,
+        t_cache_grid: float | None = T_CACHE_GRID,
+    ) -> None:
         self.cubics: list[Cubic] = []
         self._split_index = 0
 
-        # The cached map of t to point
-        self._t_points: "dict[PointTuple, tuple[int, float]]" = {}
+        # The cached map of points to cubic index and t, and the search position from
+        # which they were found, see `PointCache`
+        self.t_cache = PointCache(t_cache_size, t_cache_grid)
 
         # Keep track of current t for faster searching
         self._t_step = 0
@@ -213,6 +829,17 @@ class SuperCubic:
     def __repr__(self) -> str:
         return "<SuperCubic len=%i>" % len(self.cubics)
 
+    @cached_property
+    def bounds(self) -> "BoundsTuple | None":
+        """
+        The tight bounding box of all sub-cubics.
+
+        Returns:
+            BoundsTuple | None: The bounding box as (xMin, yMin, xMax, yMax), or None
+                if the super cubic is empty
+        """
+        return union_bounds(cubic.bounds for cubic in self.cubics)
+
     @cached_property
     def inflection_points(self) -> "list[PointTuple]":
         """
@@ -243,6 +870,123 @@ class SuperCubic:
                 extremum_points.extend(cubic.extremum_points)
         return extremum_points
 
+    @cached_property
+    def length_offsets(self) -> list[float]:
+        """
+        The prefix sums of the sub-cubic lengths, i.e. the arc length from the start of
+        the super cubic to the start of each sub-cubic. The last entry is the total
+        length.
+
+        Returns:
+            list[float]: The arc lengths
+        """
+        offsets = [0.0]
+        length = 0.0
+        for cubic in self.cubics:
+            length += cubic.length
+            offsets.append(length)
+        return offsets
+
+    @property
+    def length(self) -> float:
+        """
+        The total arc length of the super cubic.
+
+        Returns:
+            float: The length
+        """
+        return self.length_offsets[-1]
+
+    @cached_property
+    def moments(self) -> tuple[float, float, float]:
+        """
+        The sums of the moments of the sub-cubics, see `Cubic.moments`. If the super
+        cubic is a closed contour, these are its signed area and the integrals of x
+        and y over it.
+
+        Returns:
+            tuple[float, float, float]: The area, and the integrals of x and y
+        """
+        area = moment_x = moment_y = 0.0
+        for cubic in self.cubics:
+            a, mx, my = cubic.moments
+            area += a
+            moment_x += mx
+            moment_y += my
+        return area, moment_x, moment_y
+
+    @property
+    def area(self) -> float:
+        """
+        The signed area of the closed super cubic. It is positive if the contour is
+        counter-clockwise.
+
+        Returns:
+            float: The area
+        """
+        return self.moments[0]
+
+    @property
+    def centroid(self) -> "PointTuple | None":
+        """
+        The centroid of the area of the closed super cubic.
+
+        Returns:
+            PointTuple | None: The centroid, or None if the area is 0
+        """
+        area, moment_x, moment_y = self.moments
+        if area == 0:
+            return None
+        return moment_x / area, moment_y / area
+
+    @property
+    def direction(self) -> int:
+        """
+        The direction of the closed super cubic.
+
+        Returns:
+            int: 1 if it is counter-clockwise, -1 if it is clockwise, 0 if the area is
+                0
+        """
+        area = self.moments[0]
+        if area > 0:
+            return 1
+        if area < 0:
+            return -1
+        return 0
+
+    def length_at_t(self, index: int, t: float) -> float:
+        """
+        Return the arc length from the start of the super cubic to t in the sub-cubic
+        at index.
+
+        Args:
+            index (int): The index of the sub-cubic
+            t (float): The t value inside the sub-cubic, 0.0 to 1.0
+
+        Returns:
+            float: The arc length
+        """
+        return self.length_offsets[index] + self.cubics[index].length_at_t(t)
+
+    def t_at_length(self, length: float) -> tuple[int, float]:
+        """
+        Return the index of the sub-cubic and the t value inside it at which the arc
+        length from the start of the super cubic equals the given length.
+
+        Args:
+            length (float): The arc length. Lengths outside of the curve are clamped.
+
+        Returns:
+            tuple[int, float]: The cubics index and t
+        """
+        if not self.cubics:
+            raise ValueError("The super cubic is empty")
+        offsets = self.length_offsets
+        index = bisect_right(offsets, length) - 1
+        index = max(0, min(index, len(self.cubics) - 1))
+        return index, self.cubics[index].t_at_length(length - offsets[index])
+
     def add_cubic_from_points(
         self,
         pt1: "PointTuple",
@@ -250,6 +994,8 @@ class SuperCubic:
         pt3: "PointTuple",
         pt4: "PointTuple",
         raster_length: float = 0.25,
+        length_tolerance: float | None = None,
+        flatten_tolerance: float | None = None,
     ) -> None:
         """
         Add a cubic by specifying four points.
@@ -260,48 +1006,134 @@ class SuperCubic:
             pt3 (PointTuple): The third point
             pt4 (PointTuple): The fourth point
             raster_length (float, optional): The raster length. Defaults to 0.25.
+            length_tolerance (float | None, optional): The maximum error of the
+                calculated curve length, or None to estimate it. Defaults to None.
+            flatten_tolerance (float | None, optional): The maximum distance between
+                the curve and its points for the search of t values, or None to use
+                evenly spaced points. Defaults to None.
+        """
+        self.add_segment(
+            Cubic(
+                pt1, pt2, pt3, pt4, raster_length, length_tolerance, flatten_tolerance
+            )
+        )
+
+    def add_line_from_points(
+        self,
+        pt1: "PointTuple",
+        pt2: "PointTuple",
+        raster_length: float = 0.25,
+        length_tolerance: float | None = None,
+        flatten_tolerance: float | None = None,
+    ) -> None:
+        """
+        Add a line by specifying its start and end point, see `Line`.
+
+        Args:
+            pt1 (PointTuple): The start point
+            pt2 (PointTuple): The end point
+            raster_length (float, optional): The raster length. Defaults to 0.25.
+            length_tolerance (float | None, optional): Lines have an exact length,
+                but the tolerance is kept on the line like the other settings, so it
+                is passed on when the segments of the super cubic are copied, e.g. by
+                `fontgeometry.pipeline.pack_super_cubics`. Defaults to None.
+            flatten_tolerance (float | None, optional): If not None, the line is not
+                rasterized for the search of t values. Defaults to None.
         """
-        cubic = Cubic(pt1, pt2, pt3, pt4, raster_length)
-        self.cubics.append(cubic)
+        self.add_segment(
+            Line(pt1, pt2, raster_length, length_tolerance, flatten_tolerance)
+        )
+
+    def add_quadratic_from_points(
+        self,
+        pt1: "PointTuple",
+        pt2: "PointTuple",
+        pt3: "PointTuple",
+        raster_length: float = 0.25,
+        length_tolerance: float | None = None,
+        flatten_tolerance: float | None = None,
+    ) -> None:
+        """
+        Add a quadratic curve by specifying three points, see `Quadratic`.
+
+        Args:
+            pt1 (PointTuple): The first point
+            pt2 (PointTuple): The second point, an off-curve point
+            pt3 (PointTuple): The third point
+            raster_length (float, optional): The raster length. Defaults to 0.25.
+            length_tolerance (float | None, optional): Quadratics have an exact
+                length, but the tolerance is kept on the quadratic like the other
+                settings, see `add_line_from_points`. Defaults to None.
+            flatten_tolerance (float | None, optional): The maximum distance between
+                the curve and its points for the search of t values, or None to use
+                evenly spaced points. Defaults to None.
+        """
+        self.add_segment(
+            Quadratic(pt1, pt2, pt3, raster_length, length_tolerance, flatten_tolerance)
+        )
+
+    def add_segment(self, segment: Cubic) -> None:
+        """
+        Add a cubic, line or quadratic segment.
+
+        Args:
+            segment (Cubic): The segment
+        """
+        self.cubics.append(segment)
+        # The cached t values, bounds, lengths and moments may have changed
+        self.t_cache.clear()
+        self.__dict__.pop("bounds", None)
+        self.__dict__.pop("length_offsets", None)
+        self.__dict__.pop("moments", None)
 
     def add_cubic_from_point_tuple(
-        self, point_tuple: "Sequence[PointTuple]", raster_length: float = 0.25
+        self,
+        point_tuple: "Sequence[PointTuple]",
+        raster_length: float = 0.25,
+        length_tolerance: float | None = None,
+        flatten_tolerance: float | None = None,
     ) -> None:
         """
-        Add a cubic by specifying a sequence of points. If the sequence has two points,
-        it is assumed that it is a line, and is converted to a flat curve before adding
-        it.
+        Add a segment by specifying a sequence of points. Two points are added as a
+        `Line`, three points as a `Quadratic`, and four points as a `Cubic`.
 
         Args:
             point_tuple (Sequence[PointTuple]): The points
             raster_length (float, optional): The raster length. Defaults to 0.25.
+            length_tolerance (float | None, optional): The maximum error of the
+                calculated curve length, or None to estimate it. Defaults to None.
+            flatten_tolerance (float | None, optional): The maximum distance between
+                the curve and its points, or None to use evenly spaced points.
+                Defaults to None.
 
         Raises:
             ValueError: If the sequence has an unhandled number of points
         """
         num_points = len(point_tuple)
         if num_points == 4:
-            pt1, pt2, pt3, pt4 = point_tuple
+            self.add_cubic_from_points(
+                *point_tuple, raster_length, length_tolerance, flatten_tolerance
+            )
         elif num_points == 2:
-            print("WARNING: Not a curve:", point_tuple)
-            # Add a flat curve
-            pt1, pt4 = point_tuple
-            pt2 = (
-                pt1[0] + 0.3333333333333333 * (pt4[0] - pt1[0]),
-                pt1[1] + 0.3333333333333333 * (pt4[1] - pt1[1]),
+            stats = get_stats()
+            if stats is not None:
+                stats.count("SuperCubic.add_cubic_from_point_tuple.lines")
+            self.add_line_from_points(
+                *point_tuple, raster_length, length_tolerance, flatten_tolerance
             )
-            pt3 = (
-                pt1[0] + 0.6666666666666667 * (pt4[0] - pt1[0]),
-                pt1[1] + 0.6666666666666667 * (pt4[1] - pt1[1]),
+        elif num_points == 3:
+            self.add_quadratic_from_points(
+                *point_tuple, raster_length, length_tolerance, flatten_tolerance
             )
         else:
             raise ValueError
-        self.add_cubic_from_points(pt1, pt2, pt3, pt4, raster_length)
 
     def t_for_point(self, pt: "PointTuple") -> tuple[int, float] | None:
         """
         Return the index of the sub-cubics, and the t value inside it for the given
-        point.
+        point. The results are cached. A cached result is only used if the current
+        split position lies between the position the cached search started from and
+        its result, and the search continues after it.
 
         Args:
             pt (PointTuple): The point for which to find t
@@ -309,14 +1141,65 @@ class SuperCubic:
         Returns:
             tuple[int, float] | None: The cubics index and t
         """
-        # TODO: Cache previous pt so the search can start there?
-        return self._t_points.get(pt, self.calculate_t_for_point(pt))
+        index_t, self._split_index, self._t_step = self._lookup_t(
+            pt, self._split_index, self._t_step
+        )
+        return index_t
+
+    def t_for_point_from(
+        self, pt: "PointTuple", cursor: "SplitCursor | None" = None
+    ) -> "tuple[tuple[int, float] | None, SplitCursor]":
+        """
+        Return the index of the sub-cubics and the t value inside it for the given
+        point, searching from the cursor position. Like `t_for_point`, but the search
+        position is passed in and returned instead of being stored in the super cubic,
+        so several threads can search the same super cubic.
+
+        Args:
+            pt (PointTuple): The point for which to find t
+            cursor (SplitCursor | None, optional): The search position, or None to
+                search from the start. Defaults to None.
+
+        Returns:
+            tuple[tuple[int, float] | None, SplitCursor]: The cubics index and t, and
+                the new cursor
+        """
+        if cursor is None:
+            cursor = SplitCursor()
+        index_t, index, step = self._lookup_t(pt, cursor.index, cursor.step)
+        return index_t, cursor._replace(index=index, step=step)
+
+    def _lookup_t(
+        self, pt: "PointTuple", index: int, step: int
+    ) -> tuple[tuple[int, float] | None, int, int]:
+        # Return the cached or calculated cubics index and t for the point, and the new
+        # search position
+        stats = get_stats()
+        cached = self.t_cache.get(pt)
+        if cached is not None:
+            found_index, t, start_index, start_step = cached
+            found_step = self.cubics[found_index].t_step(t)
+            # The search from the current position gives the same result if the
+            # position lies between the start of the cached search and its result
+            if (start_index, start_step) <= (index, step) <= (found_index, found_step):
+                # Move the search position as calculate_t_for_point would
+                if stats is not None:
+                    stats.count("SuperCubic.t_cache.hits")
+                return (found_index, t), found_index, found_step
+
+        if stats is not None:
+            stats.count("SuperCubic.t_cache.misses")
+        start_index, start_step = index, step
+        index_t, index, step = self._search_t(pt, index, step)
+        if index_t is not None:
+            self.t_cache.put(pt, (*index_t, start_index, start_step))
+        return index_t, index, step
 
     def calculate_t_for_point(self, pt: "PointTuple") -> tuple[int, float] | None:
         """
         Calculate the t value for the closest distance of point pt to a series of cubic
-        Beziers
-
+        Beziers. If instrumentation is enabled, the number of points that were searched
+        is counted.
 
         Args:
             pt (PointTuple): The point for which to find t
@@ -324,12 +1207,23 @@ class SuperCubic:
         Returns:
             tuple[int, float] | None: The t value, 0.0 to 1.0
         """
+        index_t, self._split_index, self._t_step = self._search_t(
+            pt, self._split_index, self._t_step
+        )
+        return index_t
+
+    @timed("SuperCubic.calculate_t_for_point")
+    def _search_t(
+        self, pt: "PointTuple", split_index: int, t_step: int
+    ) -> tuple[tuple[int, float] | None, int, int]:
+        # Search the t value from the position split_index, t_step. Return the cubics
+        # index and t, and the new position.
         x, y = pt
 
         # Check special case: Is the point close to the first or last points of any of
         # the cubics?
 
-        for index in range(self._split_index, len(self.cubics)):
+        for index in range(split_index, len(self.cubics)):
             cubic = self.cubics[index]
             pt1x = round_hup(cubic.pt1[0])
             pt1y = round_hup(cubic.pt1[1])
@@ -337,70 +1231,90 @@ class SuperCubic:
             pt4y = round_hup(cubic.pt4[1])
 
             if pt1x - 1 <= x <= pt1x + 1 and pt1y - 1 <= y <= pt1y + 1:
-                self._split_index = index
-                self._t_step = 0
-                # tx, ty = getPointOnCubic(
-                #     0, cubic.pt1, cubic.pt2, cubic.pt3, cubic.pt4
-                # )
-                # print(
-                #     "                "
-                #     "Fast Found t = 0 -> (%0.3f, %0.3f)" % (tx, ty)
-                # )
-                return (index, 0.0)
+                self._count_search("end_points")
+                return (index, 0.0), index, 0
             elif pt4x - 1 <= x <= pt4x + 1 and pt4y - 1 <= y <= pt4y + 1:
-                self._split_index = index
-                self._t_step = cubic.num_cubic_points
-                # tx, ty = getPointOnCubic(
-                #     1, cubic.pt1, cubic.pt2, cubic.pt3, cubic.pt4
-                # )
-                # print(
-                #     "                "
-                #     "Fast Found t = 1 -> (%0.3f, %0.3f)" % (tx, ty)
-                # )
-                return (index, 1.0)
+                self._count_search("end_points")
+                return (index, 1.0), index, cubic.num_cubic_points
 
         # Take the long road
 
-        prev_dist: float | None = None
-        for index in range(self._split_index, len(self.cubics)):
+        # The number of searched points in the previous cubics
+        searched = 0
+        for index in range(split_index, len(self.cubics)):
             cubic = self.cubics[index]
-            self._split_index = index
-            for step in range(self._t_step, cubic.num_cubic_points + 1):
-                p = cubic.cubic_points[step]
-                px, py = p
-                dist = hypot(y - py, x - px)  # Point distance
-                if prev_dist is not None and dist > prev_dist:
-                    if prev_dist is not None:
-                        index_step = (
-                            index,
-                            step / cubic.num_cubic_points,
-                        )
-                        self._t_points[pt] = index_step
-                        # print(
-                        #     "                "
-                        #     f"Searching for t in cubic {self._split_index} "
-                        #     f"from step {self._t_step} to {step} of "
-                        #     f"{cubic.num_cubic_points} ..."
-                        # )
-                        # tx, ty = getPointOnCubic(
-                        #     step / cubic.num_cubic_points,
-                        #     cubic.pt1,
-                        #     cubic.pt2,
-                        #     cubic.pt3,
-                        #     cubic.pt4,
-                        # )
-                        # print(
-                        #     "                "
-                        #     "Found t = %0.3f -> (%0.3f, %0.3f)" % (
-                        #         step / cubic.num_cubic_points, tx, ty
-                        #     )
-                        # )
-                        self._t_step = step
-                        return index_step
-                prev_dist = dist
-            self.reset_t()
-            prev_dist = None
-        return None
+            split_index = index
+            start = t_step
+            step = cubic.find_step(pt, start)
+            if step is not None:
+                index_step = (index, cubic.step_t(step))
+                logger.debug(
+                    "Found t = %0.3f in cubic %i after %i steps",
+                    index_step[1],
+                    index,
+                    step - start,
+                )
+                self._count_search("found", searched + step - start + 1)
+                return index_step, index, step
+            searched += cubic.num_cubic_points + 1 - start
+            t_step = 0
+        self._count_search("not_found", searched)
+        return None, split_index, t_step
+
+    def _count_search(self, result: str, steps: int = 0) -> None:
+        # Count the result and the number of searched points of calculate_t_for_point
+        stats = get_stats()
+        if stats is not None:
+            stats.count("SuperCubic.calculate_t_for_point." + result)
+            stats.count("SuperCubic.calculate_t_for_point.steps", steps)
+
+    def project_point(
+        self, pt: "PointTuple", start_index: int = 0, start_t: float = 0.0
+    ) -> tuple[int, float] | None:
+        """
+        Return the index of the sub-cubic and the t value inside it for the point on
+        the super cubic that is closest to pt. Unlike `calculate_t_for_point`, this
+        finds the true closest point, and t is not limited to the raster steps.
+
+        Args:
+            pt (PointTuple): The point to project onto the super cubic
+            start_index (int, optional): Only consider the sub-cubics from this index
+                on. Defaults to 0.
+            start_t (float, optional): Only consider the points from this t value on
+                in the sub-cubic at start_index. Defaults to 0.0.
+
+        Returns:
+            tuple[int, float] | None: The cubics index and t
+        """
+        result = project_point_on_cubics(self.cubics, pt, start_index, start_t=start_t)
+        if result is None:
+            return None
+
+        index, t, _distance = result
+        return index, t
+
+    def _project_from(
+        self, pt: "PointTuple", index: int, t: float
+    ) -> tuple[int, float] | None:
+        # Project the point onto the super cubic, not before the split position t in
+        # the sub-cubic at index. If the closest point after the split position is the
+        # split position itself, but the point is closer to the sub-cubic before it,
+        # by more than the raster length, the point lies before the split position and
+        # is rejected. On a loop, a point at a self intersection is also on the curve
+        # after the split position.
+        result = project_point_on_cubics(self.cubics, pt, index, start_t=t)
+        if result is None:
+            return None
+
+        found_index, found_t, distance = result
+        if (found_index, found_t) == (index, t) and t > 0.0:
+            cubic = self.cubics[index]
+            closest_t, closest_distance = cubic.project_point(pt)
+            if closest_t < t and distance - closest_distance > cubic.raster_length:
+                raise ValueError(
+                    "The point %s lies before the split position %s" % (pt, (index, t))
+                )
+        return found_index, found_t
 
     def reset_split(self) -> None:
         for c in self.cubics:
@@ -411,30 +1325,56 @@ class SuperCubic:
     def reset_t(self) -> None:
         self._t_step = 0
 
+    @timed("SuperCubic.split_at_pt")
     def split_at_pt(
-        self, pt: "PointTuple"
+        self, pt: "PointTuple", project: bool = False
     ) -> "tuple[PointTuple, PointTuple, PointTuple, PointTuple]":
-        if DEBUG_SPLIT:
-            print("SuperCubic.split_at_pt", pt, "->")
-        index_t = self.t_for_point(pt)
+        """
+        Split the super cubic at the point, continuing from the previous split.
+
+        Args:
+            pt (PointTuple): The point at which to split
+            project (bool, optional): Find t by projecting the point onto the super
+                cubic instead of searching the raster points. Defaults to False.
+
+        Raises:
+            ValueError: If no t value could be found for the point, or if the
+                projected point lies before the previous split
+
+        Returns:
+            tuple[PointTuple, PointTuple, PointTuple, PointTuple]: The split segment
+        """
+        logger.debug("SuperCubic.split_at_pt %s ->", pt)
+        if project:
+            index = self._split_index
+            index_t = None
+            if index < len(self.cubics):
+                index_t = self._project_from(pt, index, self.cubics[index]._t)
+            if index_t is not None:
+                # Continue a later raster search at the step of t
+                self._split_index = index_t[0]
+                self._t_step = self.cubics[index_t[0]].t_step(index_t[1])
+        else:
+            index_t = self.t_for_point(pt)
         if index_t is None:
             raise ValueError
 
         index, t = index_t
-        # FIXME: This only splits inside one cubic segment?
-        if DEBUG_SPLIT:
-            print(
-                "    Splitting cubic %i from %0.4f to %0.4f ..."
-                % (index, self.cubics[index]._t, t)
-            )
+        # FIXME: This only splits inside one cubic segment? See split_at_points.
+        logger.debug(
+            "    Splitting cubic %i from %0.4f to %0.4f ...",
+            index,
+            self.cubics[index]._t,
+            t,
+        )
         # self._split_index = index
         return self.cubics[index].split_at_t(t)
 
+    @timed("SuperCubic.split_at_pt_fast")
     def split_at_pt_fast(
         self, pt: "PointTuple"
     ) -> "tuple[PointTuple, PointTuple, PointTuple, PointTuple]":
-        if DEBUG_SPLIT:
-            print("SuperCubic.split_at_pt_fast", pt, "->")
+        logger.debug("SuperCubic.split_at_pt_fast %s ->", pt)
         index = 0
         x, y = pt
         a, b, c, d = self.cubics[0].params
@@ -442,23 +1382,22 @@ class SuperCubic:
         solutions_v = solveCubic(a[0], b[0], c[0], d[0] - x)
         solutions_h = [t for t in solutions_h if 0 <= t < 1]
         solutions_v = [t for t in solutions_v if 0 <= t < 1]
-        if DEBUG_SPLIT:
-            print(solutions_h, solutions_v)
+        logger.debug("    Solutions for h and v: %s %s", solutions_h, solutions_v)
+        stats = get_stats()
         if len(solutions_h) == 1 and solutions_v:
             # Take the average of both values
             t = (solutions_v[0] + solutions_h[0]) * 0.5
+            if stats is not None:
+                stats.count("SuperCubic.split_at_pt_fast.fast_path")
         else:
-            print(
-                "    Different number of solutions for h and v:",
-                solutions_h,
-                solutions_v,
-            )
+            if stats is not None:
+                stats.count("SuperCubic.split_at_pt_fast.fallback")
             index_t = self.t_for_point(pt)
             if index_t is None:
                 raise ValueError
 
             index, t = index_t
-            print("        Choosing via thorough method:", t)
+            logger.debug("        Choosing via thorough method: %s", t)
         self._split_index = index
         return self.cubics[index].split_at_t(t)
 
@@ -466,3 +1405,120 @@ class SuperCubic:
         self,
     ) -> "tuple[PointTuple, PointTuple, PointTuple, PointTuple]":
         return self.cubics[self._split_index].split_at_t(1.0)
+
+    def split_at_pt_from(
+        self,
+        pt: "PointTuple",
+        cursor: SplitCursor | None = None,
+        project: bool = False,
+    ) -> "tuple[tuple[PointTuple, PointTuple, PointTuple, PointTuple], SplitCursor]":
+        """
+        Split the super cubic at the point, continuing from the cursor. Like
+        `split_at_pt`, but the position is passed in and returned instead of being
+        stored in the super cubic and its cubics, so several threads can split the
+        same super cubic.
+
+        Args:
+            pt (PointTuple): The point at which to split
+            cursor (SplitCursor | None, optional): The position after the previous
+                split, or None to start at the beginning. Defaults to None.
+            project (bool, optional): Find t by projecting the point onto the super
+                cubic instead of searching the raster points. Defaults to False.
+
+        Raises:
+            ValueError: If no t value could be found for the point, or if the
+                projected point lies before the previous split
+
+        Returns:
+            tuple[tuple[PointTuple, PointTuple, PointTuple, PointTuple], SplitCursor]:
+                The split segment, and the new cursor
+        """
+        if cursor is None:
+            cursor = SplitCursor()
+        if project:
+            index_t = None
+            if cursor.split_index < len(self.cubics):
+                index_t = self._project_from(pt, cursor.split_index, cursor.split_t)
+            if index_t is not None:
+                # Continue a later raster search at the step of t
+                index, t = index_t
+                cursor = cursor._replace(index=index, step=self.cubics[index].t_step(t))
+        else:
+            index_t, cursor = self.t_for_point_from(pt, cursor)
+        if index_t is None:
+            raise ValueError
+
+        index, t = index_t
+        t0 = cursor.split_t if index == cursor.split_index else 0.0
+        segment = self.cubics[index].split_between(t0, t)
+        return segment, cursor._replace(split_index=index, split_t=t)
+
+    def split_remainder_from(
+        self, cursor: SplitCursor
+    ) -> "tuple[PointTuple, PointTuple, PointTuple, PointTuple]":
+        """
+        Return the rest of the cubic after the last split, see `split_at_pt_from`.
+
+        Args:
+            cursor (SplitCursor): The position after the last split
+
+        Returns:
+            tuple[PointTuple, PointTuple, PointTuple, PointTuple]: The segment
+        """
+        t0 = cursor.split_t if cursor.index == cursor.split_index else 0.0
+        return self.cubics[cursor.index].split_between(t0, 1.0)
+
+    def split_at_points(
+        self, points: "Iterable[PointTuple]", tolerance: float = 1.0
+    ) -> "list[list[tuple[PointTuple, PointTuple, PointTuple, PointTuple]]]":
+        """
+        Split the whole super cubic at several points in one pass. The points are
+        projected onto the super cubic in order, see `project_points_on_cubics`, and
+        each cubic is split once at all of its t values. Unlike `split_at_pt`, this
+        doesn't depend on or change the current split position, and the pieces may
+        span several cubics.
+
+        Args:
+            points (Iterable[PointTuple]): The points, in the order of the cubics
+            tolerance (float, optional): The distance at which a point is considered
+                to be on the super cubic. Defaults to 1.0.
+
+        Returns:
+            list[list[tuple[PointTuple, PointTuple, PointTuple, PointTuple]]]: The
+                pieces from the start to the first point, between the points, and from
+                the last point to the end, each as a list of cubics. Points at the same
+                position give empty pieces.
+        """
+        positions = project_points_on_cubics(self.cubics, points, tolerance)
+        pieces: "list[list[tuple[PointTuple, PointTuple, PointTuple, PointTuple]]]" = [
+            []
+        ]
+        i = 0
+        num_positions = len(positions)
+        for index, cubic in enumerate(self.cubics):
+            # The t values in this cubic, a split at 0 or 1 is at the joint
+            start_splits = 0
+            end_splits = 0
+            ts: list[float] = []
+            while i < num_positions and positions[i][0] == index:
+                t = positions[i][1]
+                if t <= 0.0:
+                    start_splits += 1
+                elif t >= 1.0:
+                    end_splits += 1
+                else:
+                    ts.append(t)
+                i += 1
+
+            for _ in range(start_splits):
+                pieces.append([])
+            inner = sorted(set(ts))
+            parts = cubic.split_at_ts(inner)
+            pieces[-1].append(parts[0])
+            for t, part in zip(inner, parts[1:]):
+                for _ in range(ts.count(t)):
+                    pieces.append([])
+                pieces[-1].append(part)
+            for _ in range(end_splits):
+                pieces.append([])
+        return pieces
@@ -1,9 +1,10 @@
 from typing import TYPE_CHECKING, Any
 
 from fontgeometry.cubics import SuperCubic
+from fontgeometry.geometry import union_bounds
 
 if TYPE_CHECKING:
-    from fontgeometry.typing import PointTuple
+    from fontgeometry.typing import BoundsTuple, PointTuple
 
 
 class CubicSegments:
@@ -11,6 +12,61 @@ class CubicSegments:
         self.layer = layer
         self.segments: "list[list[PointTuple]]" = []
 
+    @property
+    def bounds(self) -> "BoundsTuple | None":
+        """
+        The tight bounding box of all super cubics, e.g. for the glyph metrics.
+
+        Returns:
+            BoundsTuple | None: The bounding box as (xMin, yMin, xMax, yMax), or None
+                if there are no super cubics
+        """
+        return union_bounds(
+            sc.bounds for sc in getattr(self, "super_cubics", ()) if sc.cubics
+        )
+
+    @property
+    def moments(self) -> tuple[float, float, float]:
+        """
+        The sums of the moments of all super cubics, see `SuperCubic.moments`. The
+        lines of the glyph must be included, so the contours are closed.
+
+        Returns:
+            tuple[float, float, float]: The signed area, and the integrals of x and y
+                over it
+        """
+        area = moment_x = moment_y = 0.0
+        for sc in getattr(self, "super_cubics", ()):
+            a, mx, my = sc.moments
+            area += a
+            moment_x += mx
+            moment_y += my
+        return area, moment_x, moment_y
+
+    @property
+    def area(self) -> float:
+        """
+        The signed area of the glyph. Counter-clockwise contours add to it, clockwise
+        contours subtract from it.
+
+        Returns:
+            float: The area
+        """
+        return self.moments[0]
+
+    @property
+    def centroid(self) -> "PointTuple | None":
+        """
+        The centroid of the area of the glyph.
+
+        Returns:
+            PointTuple | None: The centroid, or None if the area is 0
+        """
+        area, moment_x, moment_y = self.moments
+        if area == 0:
+            return None
+        return moment_x / area, moment_y / area
+
     def extract_segments(self) -> None:
         # Extract the segments from the layer.
         # TODO: Should this only extract cubic curves?
@@ -25,7 +81,7 @@ class CubicSegments:
                 # The super cubic is empty, we can just add the current segment
                 sc.add_cubic_from_point_tuple(segment)
             else:
-                if sc.cubics[-1].pt3 == segment[0]:
+                if sc.cubics[-1].pt4 == segment[0]:
                     # The current cubic is a continuation of the previous cubic
                     sc.add_cubic_from_point_tuple(segment)
                 else:
@@ -35,3 +91,177 @@ class CubicSegments:
         if sc.cubics:
             # Add the last super cubic
             self.super_cubics.append(sc)
+
+
+class SuperCubicPen:
+    """
+    A pen that adds the drawn segments directly to super cubics, in one pass. Each
+    contour becomes one super cubic, unless lines are excluded, in which case the
+    lines split the contour into several super cubics. Lines are added as `Line`
+    segments. Quadratic curves are converted to cubics, or added as `Quadratic`
+    segments if convert_quadratics is False. Components are ignored.
+    """
+
+    def __init__(
+        self,
+        super_cubics: list[SuperCubic],
+        include_lines: bool = True,
+        raster_length: float = 0.25,
+        flatten_tolerance: float | None = None,
+        convert_quadratics: bool = True,
+    ) -> None:
+        # The list to which the super cubics are added
+        self.super_cubics = super_cubics
+        self.include_lines = include_lines
+        self.raster_length = raster_length
+        self.flatten_tolerance = flatten_tolerance
+        self.convert_quadratics = convert_quadratics
+
+        self._start_point: "PointTuple | None" = None
+        self._current_point: "PointTuple | None" = None
+        self._current: SuperCubic | None = None
+
+        # The super cubics of the current contour
+        self._contour: list[SuperCubic] = []
+
+    def _add(self, point_tuple: "tuple[PointTuple, ...]") -> None:
+        if self._current is None:
+            self._current = SuperCubic()
+            self._contour.append(self._current)
+        self._current.add_cubic_from_point_tuple(
+            point_tuple, self.raster_length, flatten_tolerance=self.flatten_tolerance
+        )
+        self._current_point = point_tuple[-1]
+
+    def moveTo(self, pt: "PointTuple") -> None:
+        if self._contour:
+            # The previous contour was not ended
+            self.endPath()
+        self._start_point = pt
+        self._current_point = pt
+
+    def lineTo(self, pt: "PointTuple") -> None:
+        if self._current_point is None:
+            raise ValueError("lineTo without moveTo")
+
+        if self.include_lines:
+            self._add((self._current_point, pt))
+        else:
+            # The line interrupts the super cubic
+            self._current = None
+            self._current_point = pt
+
+    def curveTo(self, *points: "PointTuple") -> None:
+        if self._current_point is None:
+            raise ValueError("curveTo without moveTo")
+
+        if len(points) != 3:
+            raise ValueError("Only curves with two off-curve points are supported")
+
+        self._add((self._current_point, *points))
+
+    def qCurveTo(self, *points: "PointTuple | None") -> None:
+        offcurves = list(points[:-1])
+        end_point = points[-1]
+        if end_point is None:
+            # A contour without on-curve points, the start point is implied between
+            # the last and the first off-curve point
+            (x0, y0), (x1, y1) = offcurves[-1], offcurves[0]
+            end_point = (0.5 * (x0 + x1), 0.5 * (y0 + y1))
+            self.moveTo(end_point)
+        if self._current_point is None:
+            raise ValueError("qCurveTo without moveTo")
+
+        if not offcurves:
+            self.lineTo(end_point)
+            return
+
+        for i, (qx, qy) in enumerate(offcurves):
+            if i + 1 < len(offcurves):
+                # Implied on-curve point between two off-curve points
+                nx, ny = offcurves[i + 1]
+                pt = (0.5 * (qx + nx), 0.5 * (qy + ny))
+            else:
+                pt = end_point
+            if not self.convert_quadratics:
+                self._add((self._current_point, (qx, qy), pt))
+                continue
+
+            # Convert the quadratic to a cubic
+            x0, y0 = self._current_point
+            self._add(
+                (
+                    (x0, y0),
+                    (x0 + (qx - x0) * 2 / 3, y0 + (qy - y0) * 2 / 3),
+                    (pt[0] + (qx - pt[0]) * 2 / 3, pt[1] + (qy - pt[1]) * 2 / 3),
+                    pt,
+                )
+            )
+
+    def closePath(self) -> None:
+        start = self._start_point
+        if start is not None and self._current_point != start:
+            # Implied closing line
+            self.lineTo(start)
+        contour = self._contour
+        if (
+            len(contour) > 1
+            and contour[0].cubics[0].pt1 == start
+            and contour[-1].cubics[-1].pt4 == start
+        ):
+            # The first and the last super cubic of the contour meet at the start
+            # point, join them
+            last = contour.pop()
+            for cubic in contour[0].cubics:
+                # Through add_segment, so the cached values of last are cleared
+                last.add_segment(cubic)
+            contour[0] = last
+        self.endPath()
+
+    def endPath(self) -> None:
+        self.super_cubics.extend(self._contour)
+        self._contour = []
+        self._current = None
+        self._start_point = None
+        self._current_point = None
+
+    def addComponent(self, glyphName: str, transformation: Any) -> None:
+        # Components are not decomposed
+        pass
+
+
+class PenCubicSegments(CubicSegments):
+    """
+    Extract the super cubics from any object that can draw itself to a pen, e.g. a
+    fontTools or defcon glyph, using a `SuperCubicPen`. The segments are not stored
+    separately, the super cubics are built directly by extract_segments.
+    """
+
+    def __init__(
+        self,
+        layer: Any,
+        include_lines: bool = True,
+        raster_length: float = 0.25,
+        flatten_tolerance: float | None = None,
+        convert_quadratics: bool = True,
+    ) -> None:
+        super().__init__(layer)
+        self.include_lines = include_lines
+        self.raster_length = raster_length
+        self.flatten_tolerance = flatten_tolerance
+        self.convert_quadratics = convert_quadratics
+
+    def extract_segments(self) -> None:
+        self.super_cubics: list[SuperCubic] = []
+        self.layer.draw(
+            SuperCubicPen(
+                self.super_cubics,
+                self.include_lines,
+                self.raster_length,
+                self.flatten_tolerance,
+                self.convert_quadratics,
+            )
+        )
+
+    def to_supercubics(self) -> None:
+        self.extract_segments()
@@ -1,10 +1,10 @@
 from math import atan2, hypot, pi, sin
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterable
 
 from fontgeometry.rounding import round_hup
 
 if TYPE_CHECKING:
-    from fontgeometry.typing import PointTuple
+    from fontgeometry.typing import BoundsTuple, PointTuple
 
 
 # Helper functions for geometry, tuple-based API with pt = (x, y)
@@ -202,3 +202,17 @@ def intersect(
     L1 = line_coefficients(p0, p1)
     L2 = line_coefficients(p3, p2)
     return intersect_coeffs(L1, L2)
+
+
+def union_bounds(bounds: "Iterable[BoundsTuple]") -> "BoundsTuple | None":
+    # Return the bounding box that contains all bounding boxes, or None if there are
+    # none.
+    b = list(bounds)
+    if not b:
+        return None
+    return (
+        min(r[0] for r in b),
+        min(r[1] for r in b),
+        max(r[2] for r in b),
+        max(r[3] for r in b),
+    )
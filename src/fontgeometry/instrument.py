@@ -0,0 +1,249 @@
+import atexit
+import json
+import os
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+from functools import wraps
+from time import perf_counter
+from typing import Any, Callable, Iterator, TypeVar
+
+from fontgeometry.cache import get_analysis_cache
+
+# Instrumentation of the hot paths: call counts and cumulative times of functions,
+# and event counters, e.g. the number of search steps or cache hits.
+#
+# It is disabled by default. Then the `timed` decorator still costs an extra Python call
+# with argument repacking per call, so it is only used for functions that take much
+# longer than that, e.g. the point searches. The hottest functions, like
+# `BaseCubic.split_at_t`, check `get_stats()` inline instead, which costs one function
+# call. The statistics can be collected from several threads.
+# Enable it for the whole process with the environment variable
+#   FONTGEOMETRY_INSTRUMENT=1
+# and optionally write the statistics as JSON when the process exits with
+#   FONTGEOMETRY_INSTRUMENT_FILE=/path/to/stats.json
+# or for a block of code with the `instrumented` context manager.
+
+ENV_ENABLE = "FONTGEOMETRY_INSTRUMENT"
+ENV_FILE = "FONTGEOMETRY_INSTRUMENT_FILE"
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class Stats:
+    """
+    The collected statistics: The number of calls and the cumulative time per
+    function, and counters for other events.
+    """
+
+    def __init__(self) -> None:
+        # The number of calls and the cumulative time in seconds, by function name
+        self.calls: defaultdict[str, int] = defaultdict(int)
+        self.times: defaultdict[str, float] = defaultdict(float)
+
+        # Event counters, by name
+        self.counters: defaultdict[str, int] = defaultdict(int)
+
+        # Updates from several threads must not get lost
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return "<Stats functions=%i, counters=%i>" % (
+            len(self.calls),
+            len(self.counters),
+        )
+
+    def add_call(self, name: str, seconds: float) -> None:
+        with self._lock:
+            self.calls[name] += 1
+            self.times[name] += seconds
+
+    def count(self, name: str, n: int = 1) -> None:
+        with self._lock:
+            self.counters[name] += n
+
+    def ratio(self, name: str, other: str) -> float | None:
+        """
+        Return the share of the counter name in the sum of the counters name and
+        other, e.g. the hit rate of a cache.
+
+        Args:
+            name (str): The name of the counter, e.g. "cache.hits"
+            other (str): The name of the other counter, e.g. "cache.misses"
+
+        Returns:
+            float | None: The ratio, or None if both counters are zero
+        """
+        a = self.counters.get(name, 0)
+        total = a + self.counters.get(other, 0)
+        if total == 0:
+            return None
+        return a / total
+
+    def clear(self) -> None:
+        with self._lock:
+            self.calls.clear()
+            self.times.clear()
+            self.counters.clear()
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Return the statistics as a dict that can be serialized as JSON. It includes
+        the counters of the process-wide analysis cache, if it is enabled.
+
+        Returns:
+            dict[str, Any]: The statistics
+        """
+        with self._lock:
+            result: dict[str, Any] = {
+                "functions": {
+                    name: {"calls": self.calls[name], "time": self.times[name]}
+                    for name in sorted(self.calls)
+                },
+                "counters": dict(sorted(self.counters.items())),
+                "ratios": {
+                    "SuperCubic.t_cache.hit_rate": self.ratio(
+                        "SuperCubic.t_cache.hits", "SuperCubic.t_cache.misses"
+                    ),
+                    "SuperCubic.split_at_pt_fast.fast_path_rate": self.ratio(
+                        "SuperCubic.split_at_pt_fast.fast_path",
+                        "SuperCubic.split_at_pt_fast.fallback",
+                    ),
+                },
+            }
+        cache = get_analysis_cache()
+        if cache is not None:
+            lookups = cache.hits + cache.misses
+            result["analysis_cache"] = {
+                "hits": cache.hits,
+                "misses": cache.misses,
+                "store_hits": cache.store_hits,
+                "hit_rate": cache.hits / lookups if lookups else None,
+            }
+        return result
+
+    def to_json(self, **kwargs: Any) -> str:
+        """
+        Return the statistics as JSON, see `to_dict`.
+
+        Args:
+            **kwargs: Passed to `json.dumps`, e.g. indent
+
+        Returns:
+            str: The JSON string
+        """
+        return json.dumps(self.to_dict(), **kwargs)
+
+
+# The active statistics, or None if instrumentation is disabled
+_stats: Stats | None = None
+
+
+def get_stats() -> Stats | None:
+    """
+    Return the active statistics. Hot loops can call this once and skip the counting
+    if it returns None.
+
+    Returns:
+        Stats | None: The statistics, or None if instrumentation is disabled
+    """
+    return _stats
+
+
+def enable(stats: Stats | None = None) -> Stats:
+    """
+    Enable instrumentation.
+
+    Args:
+        stats (Stats | None, optional): The object that collects the statistics. If
+            None, a new one is created. Defaults to None.
+
+    Returns:
+        Stats: The statistics
+    """
+    global _stats
+    if stats is None:
+        stats = Stats()
+    _stats = stats
+    return stats
+
+
+def disable() -> None:
+    global _stats
+    _stats = None
+
+
+def count(name: str, n: int = 1) -> None:
+    # Increase the counter if instrumentation is enabled
+    stats = _stats
+    if stats is not None:
+        stats.count(name, n)
+
+
+def timed(name: str) -> Callable[[F], F]:
+    """
+    A decorator that records the number of calls and the cumulative time of the
+    decorated function when instrumentation is enabled. The wrapper adds the cost of
+    a Python call even when it is disabled, so don't use it for very fast functions.
+
+    Args:
+        name (str): The name under which the calls are recorded
+
+    Returns:
+        Callable[[F], F]: The decorator
+    """
+
+    def decorator(func: F) -> F:
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            stats = _stats
+            if stats is None:
+                return func(*args, **kwargs)
+            start = perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                stats.add_call(name, perf_counter() - start)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+@contextmanager
+def instrumented(
+    callback: Callable[[Stats], Any] | None = None,
+) -> Iterator[Stats]:
+    """
+    A context manager that enables instrumentation for the code inside it, and
+    restores the previous state afterwards.
+
+    Args:
+        callback (Callable[[Stats], Any] | None, optional): A function that is called
+            with the statistics when the block is left, e.g. to log or export them.
+            Defaults to None.
+
+    Yields:
+        Stats: The statistics of the block
+    """
+    global _stats
+    previous = _stats
+    stats = Stats()
+    _stats = stats
+    try:
+        yield stats
+    finally:
+        _stats = previous
+        if callback is not None:
+            callback(stats)
+
+
+def _write_stats(path: str, stats: Stats) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(stats.to_json(indent=2))
+
+
+if os.environ.get(ENV_ENABLE, "") not in ("", "0"):
+    _stats = Stats()
+    if os.environ.get(ENV_FILE):
+        atexit.register(_write_stats, os.environ[ENV_FILE], _stats)
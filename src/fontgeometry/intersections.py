@@ -0,0 +1,521 @@
+from typing import TYPE_CHECKING, Any, Hashable, Sequence
+
+from fontgeometry.beziertools import getExtremaForCubic, getPointOnCubic
+from fontgeometry.ftbeziertools import calcCubicParameters, solveCubic
+
+if TYPE_CHECKING:
+    from fontgeometry.cubics import BaseCubic, SuperCubic
+    from fontgeometry.extract import CubicSegments
+    from fontgeometry.typing import BoundsTuple, PointTuple
+
+# Intersections of cubics with cubics and lines. Cubic pairs are intersected by
+# recursive subdivision: Pairs of pieces whose control point boxes don't overlap are
+# rejected, the others are split in half until the pieces are within the tolerance of
+# their chords, and then the chords are intersected. Chords that lie within the
+# tolerance of each other belong to overlapping pieces, which have no isolated
+# intersections, so only the points where the cubics cross or end are reported for them.
+# Cubics and lines are intersected analytically, by moving the line onto the x axis and
+# solving for the roots of the cubic's y coordinate.
+
+# The control points of a cubic as a flat tuple: x1, y1, x2, y2, x3, y3, x4, y4
+FlatCubic = tuple[float, float, float, float, float, float, float, float]
+
+# An intersection between two cubics of a collection, as key and t of both cubics
+KeyIntersection = tuple[tuple[Any, float], tuple[Any, float]]
+
+# The tolerance of t values at the ends of the cubics
+_EPS = 1e-9
+
+
+def _flat(cubic: "BaseCubic") -> FlatCubic:
+    (x1, y1), (x2, y2), (x3, y3), (x4, y4) = cubic.pt1, cubic.pt2, cubic.pt3, cubic.pt4
+    return x1, y1, x2, y2, x3, y3, x4, y4
+
+
+def _split_half(c: FlatCubic) -> tuple[FlatCubic, FlatCubic]:
+    # Split a cubic at t = 0.5 (de Casteljau)
+    x1, y1, x2, y2, x3, y3, x4, y4 = c
+    x12 = (x1 + x2) * 0.5
+    y12 = (y1 + y2) * 0.5
+    x23 = (x2 + x3) * 0.5
+    y23 = (y2 + y3) * 0.5
+    x34 = (x3 + x4) * 0.5
+    y34 = (y3 + y4) * 0.5
+    x123 = (x12 + x23) * 0.5
+    y123 = (y12 + y23) * 0.5
+    x234 = (x23 + x34) * 0.5
+    y234 = (y23 + y34) * 0.5
+    xm = (x123 + x234) * 0.5
+    ym = (y123 + y234) * 0.5
+    return (
+        (x1, y1, x12, y12, x123, y123, xm, ym),
+        (xm, ym, x234, y234, x34, y34, x4, y4),
+    )
+
+
+def _sub_cubic(c: FlatCubic, t0: float, t1: float) -> FlatCubic:
+    # Return the piece of a cubic between t0 and t1
+    (ax, ay), (bx, by), (cx, cy), (dx, dy) = calcCubicParameters(
+        (c[0], c[1]), (c[2], c[3]), (c[4], c[5]), (c[6], c[7])
+    )
+    # Reparametrize t = t0 + (t1 - t0) * u, and convert back to control points
+    s = t1 - t0
+    a2x = ax * s * s * s
+    a2y = ay * s * s * s
+    b2x = (3 * ax * t0 + bx) * s * s
+    b2y = (3 * ay * t0 + by) * s * s
+    c2x = ((3 * ax * t0 + 2 * bx) * t0 + cx) * s
+    c2y = ((3 * ay * t0 + 2 * by) * t0 + cy) * s
+    d2x = ((ax * t0 + bx) * t0 + cx) * t0 + dx
+    d2y = ((ay * t0 + by) * t0 + cy) * t0 + dy
+    x2 = d2x + c2x / 3
+    y2 = d2y + c2y / 3
+    x3 = x2 + (c2x + b2x) / 3
+    y3 = y2 + (c2y + b2y) / 3
+    return (
+        d2x,
+        d2y,
+        x2,
+        y2,
+        x3,
+        y3,
+        a2x + b2x + c2x + d2x,
+        a2y + b2y + c2y + d2y,
+    )
+
+
+def _is_flat(c: FlatCubic, tolerance: float) -> bool:
+    # Return whether the cubic is within the tolerance of its chord, parametrized
+    # linearly. A straight cubic with evenly spaced control points is the chord, so
+    # measure the distance of the control points to the points at 1/3 and 2/3 of the
+    # chord.
+    x1, y1, x2, y2, x3, y3, x4, y4 = c
+    ex = x2 - (2 * x1 + x4) / 3
+    ey = y2 - (2 * y1 + y4) / 3
+    fx = x3 - (x1 + 2 * x4) / 3
+    fy = y3 - (y1 + 2 * y4) / 3
+    tol2 = tolerance * tolerance
+    return ex * ex + ey * ey <= tol2 and fx * fx + fy * fy <= tol2
+
+
+def _is_overlap(a: FlatCubic, b: FlatCubic, tolerance: float) -> bool:
+    # Return whether the chords of two flat pieces overlap, i.e. the end points of each
+    # chord are within the tolerance of the line through the other chord, and they
+    # share more than the tolerance of their length. Chords that only meet at their
+    # ends, or that cross each other, don't overlap.
+    for c, d in ((b, a), (a, b)):
+        dx = c[6] - c[0]
+        dy = c[7] - c[1]
+        length = (dx * dx + dy * dy) ** 0.5
+        if length == 0:
+            return False
+        # The distances of the end points of d from the line through c
+        e0 = ((d[0] - c[0]) * dy - (d[1] - c[1]) * dx) / length
+        e1 = ((d[6] - c[0]) * dy - (d[7] - c[1]) * dx) / length
+        if abs(e0) > tolerance or abs(e1) > tolerance:
+            return False
+        if e0 * e1 < 0 and min(abs(e0), abs(e1)) > _EPS:
+            return False
+    # The positions of the end points of b along the chord of a
+    s0 = ((b[0] - a[0]) * dx + (b[1] - a[1]) * dy) / length
+    s1 = ((b[6] - a[0]) * dx + (b[7] - a[1]) * dy) / length
+    return min(max(s0, s1), length) - max(min(s0, s1), 0.0) > tolerance
+
+
+def _crosses(
+    c1: FlatCubic, c2: FlatCubic, t1: float, t2: float, h1: float, h2: float
+) -> bool:
+    # Return whether the second cubic crosses the first one at t1 and t2, i.e. its
+    # points at t2 - h2 and t2 + h2 lie on different sides of the chord of the first
+    # cubic from t1 - h1 to t1 + h1
+    p1 = (c1[0], c1[1]), (c1[2], c1[3]), (c1[4], c1[5]), (c1[6], c1[7])
+    p2 = (c2[0], c2[1]), (c2[2], c2[3]), (c2[4], c2[5]), (c2[6], c2[7])
+    x1, y1 = getPointOnCubic(max(t1 - h1, 0.0), *p1)
+    x2, y2 = getPointOnCubic(min(t1 + h1, 1.0), *p1)
+    dx = x2 - x1
+    dy = y2 - y1
+    length = (dx * dx + dy * dy) ** 0.5
+    if length == 0:
+        return False
+    x, y = getPointOnCubic(max(t2 - h2, 0.0), *p2)
+    e0 = ((x - x1) * dy - (y - y1) * dx) / length
+    x, y = getPointOnCubic(min(t2 + h2, 1.0), *p2)
+    e1 = ((x - x1) * dy - (y - y1) * dx) / length
+    return e0 * e1 < 0 and min(abs(e0), abs(e1)) > _EPS
+
+
+def _shared_ends(
+    a: FlatCubic, a0: float, a1: float, b: FlatCubic, b0: float, b1: float
+) -> list[tuple[float, float]]:
+    # Return the t values of the end points of the cubics that are shared by two pieces
+    return [
+        (ta, tb)
+        for ta, pa in ((a0, a[:2]), (a1, a[6:]))
+        for tb, pb in ((b0, b[:2]), (b1, b[6:]))
+        if pa == pb and ta in (0.0, 1.0) and tb in (0.0, 1.0)
+    ]
+
+
+def _intersect_flat(
+    c1: FlatCubic, c2: FlatCubic, tolerance: float
+) -> list[tuple[float, float]]:
+    # Return the t values of the intersections of two cubics
+    found: list[tuple[float, float]] = []
+    # The intersections at the ends of both chords, and the corners of the t ranges of
+    # overlapping pieces with the size of the ranges. Overlapping pieces also meet the
+    # neighbours of each other at their ends, these intersections are only kept if the
+    # cubics cross there.
+    found_at_ends: list[tuple[float, float]] = []
+    overlap_corners: dict[tuple[float, float], tuple[float, float]] = {}
+    pairs = [
+        (c1, 0.0, 1.0, _is_flat(c1, tolerance), c2, 0.0, 1.0, _is_flat(c2, tolerance))
+    ]
+    while pairs:
+        next_pairs = []
+        for a, a0, a1, a_flat, b, b0, b1, b_flat in pairs:
+            axs = a[0::2]
+            ays = a[1::2]
+            bxs = b[0::2]
+            bys = b[1::2]
+            if (
+                min(axs) > max(bxs)
+                or min(bxs) > max(axs)
+                or min(ays) > max(bys)
+                or min(bys) > max(ays)
+            ):
+                continue
+
+            if a_flat and b_flat:
+                # Intersect the chords
+                dax = a[6] - a[0]
+                day = a[7] - a[1]
+                dbx = b[6] - b[0]
+                dby = b[7] - b[1]
+                det = dax * dby - day * dbx
+                if det == 0 or _is_overlap(a, b, tolerance):
+                    # Parallel or overlapping, but the cubics may still touch at their
+                    # end points
+                    for corner in ((a0, b0), (a0, b1), (a1, b0), (a1, b1)):
+                        overlap_corners[corner] = (a1 - a0, b1 - b0)
+                    found.extend(_shared_ends(a, a0, a1, b, b0, b1))
+                    continue
+
+                rx = b[0] - a[0]
+                ry = b[1] - a[1]
+                u = (rx * dby - ry * dbx) / det
+                v = (rx * day - ry * dax) / det
+                if -_EPS <= u <= 1 + _EPS and -_EPS <= v <= 1 + _EPS:
+                    u = 0.0 if u <= _EPS else 1.0 if u >= 1 - _EPS else u
+                    v = 0.0 if v <= _EPS else 1.0 if v >= 1 - _EPS else v
+                    t = (a0 + (a1 - a0) * u, b0 + (b1 - b0) * v)
+                    if u in (0.0, 1.0) and v in (0.0, 1.0):
+                        found_at_ends.append(t)
+                    else:
+                        found.append(t)
+                continue
+
+            if a_flat:
+                a_pieces: tuple = ((a, a0, a1, True),)
+            else:
+                am = (a0 + a1) * 0.5
+                a_l, a_r = _split_half(a)
+                a_pieces = (
+                    (a_l, a0, am, _is_flat(a_l, tolerance)),
+                    (a_r, am, a1, _is_flat(a_r, tolerance)),
+                )
+            if b_flat:
+                b_pieces: tuple = ((b, b0, b1, True),)
+            else:
+                bm = (b0 + b1) * 0.5
+                b_l, b_r = _split_half(b)
+                b_pieces = (
+                    (b_l, b0, bm, _is_flat(b_l, tolerance)),
+                    (b_r, bm, b1, _is_flat(b_r, tolerance)),
+                )
+            for pa in a_pieces:
+                for pb in b_pieces:
+                    next_pairs.append(pa + pb)
+
+        pairs = next_pairs
+
+    for t1, t2 in found_at_ends:
+        size = overlap_corners.get((t1, t2))
+        if size is None or _crosses(c1, c2, t1, t2, *size):
+            found.append((t1, t2))
+
+    # Intersections at the ends of the chords are found twice
+    result: list[tuple[float, float]] = []
+    for t1, t2 in sorted(found):
+        if result and t1 - result[-1][0] <= _EPS and abs(t2 - result[-1][1]) <= _EPS:
+            continue
+        result.append((t1, t2))
+    return result
+
+
+def _is_joint(c1: FlatCubic, c2: FlatCubic, t1: float, t2: float) -> bool:
+    # Return whether the intersection is only an end point shared by both cubics
+    if t1 >= 1 - _EPS and t2 <= _EPS and c1[6:] == c2[:2]:
+        return True
+    return t1 <= _EPS and t2 >= 1 - _EPS and c1[:2] == c2[6:]
+
+
+def intersect_cubics(
+    cubic1: "BaseCubic", cubic2: "BaseCubic", tolerance: float = 0.001
+) -> list[tuple[float, float]]:
+    """
+    Return the intersections of two cubics as pairs of t values on both cubics.
+
+    Args:
+        cubic1 (BaseCubic): The first cubic
+        cubic2 (BaseCubic): The second cubic
+        tolerance (float, optional): The maximum distance between the intersection
+            points on both cubics and the true intersection. Defaults to 0.001.
+
+    Returns:
+        list[tuple[float, float]]: The t values on the first and second cubic, sorted
+            by the t values on the first cubic
+    """
+    if not _bounds_overlap(cubic1.bounds, cubic2.bounds):
+        return []
+
+    return _intersect_flat(_flat(cubic1), _flat(cubic2), tolerance)
+
+
+def intersect_cubic_line(
+    cubic: "BaseCubic",
+    pt1: "PointTuple",
+    pt2: "PointTuple",
+    segment: bool = True,
+) -> list[tuple[float, float]]:
+    """
+    Return the intersections of a cubic and a line through two points as pairs of t
+    values on the cubic and on the line, where the line goes from pt1 at t = 0 to pt2
+    at t = 1.
+
+    Args:
+        cubic (BaseCubic): The cubic
+        pt1 (PointTuple): The first point of the line
+        pt2 (PointTuple): The second point of the line
+        segment (bool, optional): Only return intersections between pt1 and pt2. If
+            False, the line is infinite. Defaults to True.
+
+    Returns:
+        list[tuple[float, float]]: The t values on the cubic and on the line, sorted by
+            the t values on the cubic. Empty if the points of the line are equal, or
+            if the cubic lies on the line.
+    """
+    ux = pt2[0] - pt1[0]
+    uy = pt2[1] - pt1[1]
+    length = (ux * ux + uy * uy) ** 0.5
+    if length == 0:
+        return []
+
+    # Move and rotate the cubic, so that the line is on the x axis
+    (ax, ay), (bx, by), (cx, cy), (dx, dy) = cubic.params
+    dx -= pt1[0]
+    dy -= pt1[1]
+    ux /= length
+    uy /= length
+    a = ay * ux - ax * uy
+    b = by * ux - bx * uy
+    c = cy * ux - cx * uy
+    d = dy * ux - dx * uy
+    if max(abs(a), abs(b), abs(c)) < 1e-9:
+        # The cubic is a straight line parallel to the line, or on it
+        return []
+
+    eps = 1e-9
+    result: list[tuple[float, float]] = []
+    for t in sorted(solveCubic(a, b, c, d)):
+        if not -eps <= t <= 1 + eps:
+            continue
+
+        t = min(max(t, 0.0), 1.0)
+        if result and t - result[-1][0] < eps:
+            # Double root
+            continue
+
+        x = ((ax * t + bx) * t + cx) * t + dx
+        y = ((ay * t + by) * t + cy) * t + dy
+        u = (x * ux + y * uy) / length
+        if segment:
+            if not -eps <= u <= 1 + eps:
+                continue
+
+            u = min(max(u, 0.0), 1.0)
+        result.append((t, u))
+    return result
+
+
+def _bounds_overlap(b1: "BoundsTuple", b2: "BoundsTuple") -> bool:
+    return b1[0] <= b2[2] and b2[0] <= b1[2] and b1[1] <= b2[3] and b2[1] <= b1[3]
+
+
+def _self_intersections_flat(
+    c: FlatCubic, tolerance: float
+) -> list[tuple[float, float]]:
+    # Return the pairs of t values where a cubic intersects itself. Pieces between the
+    # extrema are monotonic in x and y and can't intersect themselves, so intersect the
+    # pieces with each other.
+    ts = sorted(
+        set(
+            getExtremaForCubic(
+                (c[0], c[1]), (c[2], c[3]), (c[4], c[5]), (c[6], c[7]), h=True, v=True
+            )
+        )
+    )
+    if not ts:
+        return []
+
+    ts = [0.0] + ts + [1.0]
+    pieces = [_sub_cubic(c, ts[i], ts[i + 1]) for i in range(len(ts) - 1)]
+    result = []
+    for i in range(len(pieces)):
+        for j in range(i + 1, len(pieces)):
+            for t1, t2 in _intersect_flat(pieces[i], pieces[j], tolerance):
+                if j == i + 1 and t1 >= 1 - _EPS and t2 <= _EPS:
+                    # The joint of consecutive pieces
+                    continue
+
+                result.append(
+                    (
+                        ts[i] + (ts[i + 1] - ts[i]) * t1,
+                        ts[j] + (ts[j + 1] - ts[j]) * t2,
+                    )
+                )
+    return sorted(result)
+
+
+def self_intersections(
+    cubic: "BaseCubic", tolerance: float = 0.001
+) -> list[tuple[float, float]]:
+    """
+    Return the points where a cubic intersects itself, i.e. where it forms a loop, as
+    pairs of t values.
+
+    Args:
+        cubic (BaseCubic): The cubic
+        tolerance (float, optional): The tolerance. Defaults to 0.001.
+
+    Returns:
+        list[tuple[float, float]]: The smaller and the larger t value of each
+            intersection
+    """
+    return _self_intersections_flat(_flat(cubic), tolerance)
+
+
+def _find_intersections(
+    keys: list[Hashable],
+    cubics: "Sequence[BaseCubic]",
+    tolerance: float,
+    groups: list[int] | None = None,
+) -> list[KeyIntersection]:
+    # Return the intersections between all cubics, or only between cubics of different
+    # groups. Candidate pairs are found by sweeping over the bounding boxes sorted by
+    # their minimum x coordinate. Shared end points of cubics are not intersections.
+    flats = [_flat(cubic) for cubic in cubics]
+    bounds = [cubic.bounds for cubic in cubics]
+    order = sorted(range(len(flats)), key=lambda i: bounds[i][0])
+    found: list[tuple[int, float, int, float]] = []
+    active: list[int] = []
+    for i in order:
+        b = bounds[i]
+        # Remove the cubics that end left of the current one
+        active = [j for j in active if bounds[j][2] >= b[0]]
+        for j in active:
+            if groups is not None and groups[i] == groups[j]:
+                continue
+
+            if bounds[j][1] > b[3] or b[1] > bounds[j][3]:
+                continue
+
+            # Keep the cubics in their original order
+            i1, i2 = (j, i) if j < i else (i, j)
+            for t1, t2 in _intersect_flat(flats[i1], flats[i2], tolerance):
+                if not _is_joint(flats[i1], flats[i2], t1, t2):
+                    found.append((i1, t1, i2, t2))
+        active.append(i)
+
+    if groups is None:
+        for i, f in enumerate(flats):
+            for t1, t2 in _self_intersections_flat(f, tolerance):
+                found.append((i, t1, i, t2))
+
+    return [((keys[i1], t1), (keys[i2], t2)) for i1, t1, i2, t2 in sorted(found)]
+
+
+def intersect_super_cubics(
+    super_cubic1: "SuperCubic", super_cubic2: "SuperCubic", tolerance: float = 0.001
+) -> list[KeyIntersection]:
+    """
+    Return the intersections of two super cubics as pairs of (index, t) on both super
+    cubics, where index is the index of the sub-cubic. End points that are shared by
+    sub-cubics of both super cubics are not intersections.
+
+    Args:
+        super_cubic1 (SuperCubic): The first super cubic
+        super_cubic2 (SuperCubic): The second super cubic
+        tolerance (float, optional): The tolerance. Defaults to 0.001.
+
+    Returns:
+        list[KeyIntersection]: The intersections, sorted by the position on the first
+            super cubic
+    """
+    n = len(super_cubic1.cubics)
+    keys: list[Hashable] = [(0, i) for i in range(n)]
+    keys.extend((1, i) for i in range(len(super_cubic2.cubics)))
+    groups = [0] * n + [1] * (len(keys) - n)
+    result = []
+    for (k1, t1), (k2, t2) in _find_intersections(
+        keys, super_cubic1.cubics + super_cubic2.cubics, tolerance, groups
+    ):
+        result.append(((k1[1], t1), (k2[1], t2)))
+    return result
+
+
+def super_cubic_self_intersections(
+    super_cubic: "SuperCubic", tolerance: float = 0.001
+) -> list[KeyIntersection]:
+    """
+    Return the points where a super cubic intersects itself, as pairs of (index, t),
+    where index is the index of the sub-cubic. The joints between consecutive
+    sub-cubics are not intersections.
+
+    Args:
+        super_cubic (SuperCubic): The super cubic
+        tolerance (float, optional): The tolerance. Defaults to 0.001.
+
+    Returns:
+        list[KeyIntersection]: The intersections, sorted by the position of their first
+            point on the super cubic
+    """
+    return _find_intersections(
+        list(range(len(super_cubic.cubics))), super_cubic.cubics, tolerance
+    )
+
+
+def cubic_segments_intersections(
+    segments: "CubicSegments", tolerance: float = 0.001
+) -> list[KeyIntersection]:
+    """
+    Return all intersections between the cubics of a glyph, including the cubics of
+    the same super cubic and loops inside a single cubic. The keys are tuples of the
+    super cubic index and the cubic index inside the super cubic, as in
+    `SegmentIndex.from_cubic_segments`.
+
+    Args:
+        segments (CubicSegments): The glyph segments, with super cubics already built
+            by `to_supercubics`
+        tolerance (float, optional): The tolerance. Defaults to 0.001.
+
+    Returns:
+        list[KeyIntersection]: The intersections, sorted by the position of their first
+            point
+    """
+    keys: list[Hashable] = []
+    cubics = []
+    for i, super_cubic in enumerate(segments.super_cubics):
+        for j, cubic in enumerate(super_cubic.cubics):
+            keys.append((i, j))
+            cubics.append(cubic)
+    return _find_intersections(keys, cubics, tolerance)
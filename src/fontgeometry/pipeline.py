@@ -0,0 +1,353 @@
+import os
+from array import array
+from collections import deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, NamedTuple
+
+from fontgeometry.cubics import Line, Quadratic, SuperCubic
+from fontgeometry.extract import CubicSegments
+
+if TYPE_CHECKING:
+    from fontgeometry.typing import PointTuple
+
+# Process the outlines of a whole font in parallel. Each outline is packed into a
+# compact, picklable payload, the payloads are sent in chunks to worker processes,
+# and each worker converts them to super cubics and analyzes them.
+#
+# On a free-threaded Python build, `process_outlines_threaded` analyzes the outlines in
+# threads instead, without packing them.
+
+
+class SegmentPayload(NamedTuple):
+    # A packed outline: The coordinates of all segment points, the number of points of
+    # each segment (2 for a Line, 3 for a Quadratic, 4 for a Cubic), the indices of the
+    # segments that start a super cubic, and the raster_length, length_tolerance and
+    # flatten_tolerance of the segments.
+    coords: array
+    sizes: bytes
+    starts: array
+    settings: tuple[float, float | None, float | None] = (0.25, None, None)
+
+
+class OutlineAnalysis(NamedTuple):
+    # The default analysis result for one outline, with one list per super cubic
+    extremum_points: "list[list[PointTuple]]"
+    inflection_points: "list[list[PointTuple]]"
+
+
+def pack_segments(segments: "Iterable[Iterable[PointTuple]]") -> SegmentPayload:
+    """
+    Pack the segments of an outline into a compact payload. A new super cubic is
+    started where a segment doesn't continue the previous one, as in
+    `CubicSegments.to_supercubics`.
+
+    Args:
+        segments (Iterable[Iterable[PointTuple]]): The segments, each a sequence of
+            points, as in `CubicSegments.segments`
+
+    Returns:
+        SegmentPayload: The packed segments
+    """
+    coords = array("d")
+    sizes = bytearray()
+    starts = array("L")
+    last_point = None
+    for segment in segments:
+        num_points = 0
+        for x, y in segment:
+            if num_points == 0 and (x, y) != last_point:
+                starts.append(len(sizes))
+            coords.append(x)
+            coords.append(y)
+            num_points += 1
+        if num_points:
+            last_point = (x, y)
+        sizes.append(num_points)
+    return SegmentPayload(coords, bytes(sizes), starts)
+
+
+def pack_super_cubics(super_cubics: "Iterable[SuperCubic]") -> SegmentPayload:
+    """
+    Pack the super cubics of an outline into a compact payload, keeping the super
+    cubics and the types of their segments. The settings are taken from the first
+    segment.
+
+    Args:
+        super_cubics (Iterable[SuperCubic]): The super cubics
+
+    Returns:
+        SegmentPayload: The packed super cubics
+    """
+    coords = array("d")
+    sizes = bytearray()
+    starts = array("L")
+    settings = None
+    for sc in super_cubics:
+        if not sc.cubics:
+            continue
+        starts.append(len(sizes))
+        for cubic in sc.cubics:
+            if settings is None:
+                settings = (
+                    cubic.raster_length,
+                    cubic.length_tolerance,
+                    cubic.flatten_tolerance,
+                )
+            if isinstance(cubic, (Line, Quadratic)):
+                points = cubic.points
+            else:
+                points = (cubic.pt1, cubic.pt2, cubic.pt3, cubic.pt4)
+            for x, y in points:
+                coords.append(x)
+                coords.append(y)
+            sizes.append(len(points))
+    if settings is None:
+        return SegmentPayload(coords, bytes(sizes), starts)
+    return SegmentPayload(coords, bytes(sizes), starts, settings)
+
+
+def unpack_segments(payload: SegmentPayload) -> "list[list[PointTuple]]":
+    """
+    Unpack the segments of an outline from a payload.
+
+    Args:
+        payload (SegmentPayload): The packed segments
+
+    Returns:
+        list[list[PointTuple]]: The segments
+    """
+    coords, sizes = payload.coords, payload.sizes
+    segments = []
+    i = 0
+    for num_points in sizes:
+        segments.append(
+            [(coords[j], coords[j + 1]) for j in range(i, i + num_points * 2, 2)]
+        )
+        i += num_points * 2
+    return segments
+
+
+def unpack_super_cubics(payload: SegmentPayload) -> list[SuperCubic]:
+    """
+    Build the super cubics of an outline from a payload, with the same segment types
+    and settings as the packed outline.
+
+    Args:
+        payload (SegmentPayload): The packed outline
+
+    Returns:
+        list[SuperCubic]: The super cubics
+    """
+    raster_length, length_tolerance, flatten_tolerance = payload.settings
+    starts = set(payload.starts)
+    super_cubics: list[SuperCubic] = []
+    sc = None
+    for index, segment in enumerate(unpack_segments(payload)):
+        if sc is None or index in starts:
+            sc = SuperCubic()
+            super_cubics.append(sc)
+        sc.add_cubic_from_point_tuple(
+            segment, raster_length, length_tolerance, flatten_tolerance
+        )
+    return super_cubics
+
+
+def _payload_to_cubic_segments(payload: SegmentPayload) -> CubicSegments:
+    segments = CubicSegments(layer=None)
+    segments.segments = unpack_segments(payload)
+    segments.super_cubics = unpack_super_cubics(payload)
+    return segments
+
+
+def analyze_outline(segments: CubicSegments) -> OutlineAnalysis:
+    """
+    The default analysis: Return the extremum and inflection points of each super
+    cubic of the outline.
+
+    Args:
+        segments (CubicSegments): The outline, with super cubics already built
+
+    Returns:
+        OutlineAnalysis: The analysis result
+    """
+    return OutlineAnalysis(
+        [sc.extremum_points for sc in segments.super_cubics],
+        [sc.inflection_points for sc in segments.super_cubics],
+    )
+
+
+def _to_payload(outline: Any) -> SegmentPayload:
+    # Accept CubicSegments objects (extracting them if needed), payloads, and plain
+    # sequences of segments
+    if isinstance(outline, CubicSegments):
+        if not outline.segments:
+            outline.extract_segments()
+        if not outline.segments and hasattr(outline, "super_cubics"):
+            # Extracted directly to super cubics, e.g. by PenCubicSegments
+            return pack_super_cubics(outline.super_cubics)
+        return pack_segments(outline.segments)
+    if isinstance(outline, SegmentPayload):
+        return outline
+    return pack_segments(outline)
+
+
+def _process_chunk(
+    analyze: Callable[[CubicSegments], Any],
+    chunk: list[tuple[int, SegmentPayload]],
+) -> list[tuple[int, Any]]:
+    # Run in the worker process
+    results = []
+    for index, payload in chunk:
+        results.append((index, analyze(_payload_to_cubic_segments(payload))))
+    return results
+
+
+def _chunks(
+    outlines: Iterable[Any], chunk_size: int
+) -> Iterator[list[tuple[int, SegmentPayload]]]:
+    it = enumerate(outlines)
+    while True:
+        chunk = [
+            (index, _to_payload(outline)) for index, outline in islice(it, chunk_size)
+        ]
+        if not chunk:
+            return
+        yield chunk
+
+
+def process_outlines(
+    outlines: Iterable[Any],
+    analyze: Callable[[CubicSegments], Any] = analyze_outline,
+    max_workers: int | None = None,
+    chunk_size: int = 16,
+    ordered: bool = True,
+) -> Iterator[tuple[int, Any]]:
+    """
+    Analyze many outlines, e.g. all glyph layers of a font, in parallel processes.
+
+    The outlines are read lazily and packed in the calling process, so layer objects
+    don't need to be picklable, but the analyze function must be, i.e. it must be
+    defined at module level.
+
+    Args:
+        outlines (Iterable[Any]): The outlines. Each can be a `CubicSegments` object
+            (its segments are extracted if they are empty), a sequence of segments, or
+            a payload from `pack_segments` or `pack_super_cubics`. The super cubics
+            of a `PenCubicSegments` object are packed as they are.
+        analyze (Callable[[CubicSegments], Any], optional): The function that is
+            called with each outline after its super cubics have been built. Defaults
+            to `analyze_outline`.
+        max_workers (int | None, optional): The number of worker processes. None uses
+            the number of CPUs, 0 processes everything in the calling process.
+            Defaults to None.
+        chunk_size (int, optional): The number of outlines sent to a worker at once.
+            Defaults to 16.
+        ordered (bool, optional): Yield the results in the order of the outlines. If
+            False, results are yielded as soon as they are ready. Defaults to True.
+
+    Yields:
+        tuple[int, Any]: The index of the outline and the result of analyze
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+
+    chunks = _chunks(outlines, chunk_size)
+    if max_workers == 0:
+        for chunk in chunks:
+            yield from _process_chunk(analyze, chunk)
+        return
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    # Limit the number of chunks in flight, so the outlines are consumed lazily
+    max_pending = 2 * max_workers
+    with ProcessPoolExecutor(max_workers) as executor:
+        if ordered:
+            queue: deque[Future] = deque()
+            for chunk in chunks:
+                queue.append(executor.submit(_process_chunk, analyze, chunk))
+                if len(queue) >= max_pending:
+                    yield from queue.popleft().result()
+            while queue:
+                yield from queue.popleft().result()
+        else:
+            pending: set[Future] = set()
+            for chunk in chunks:
+                pending.add(executor.submit(_process_chunk, analyze, chunk))
+                if len(pending) >= max_pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield from future.result()
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield from future.result()
+
+
+def _to_cubic_segments(outline: Any) -> CubicSegments:
+    # Build the super cubics of an outline in the calling thread, reusing a
+    # CubicSegments object if possible
+    if isinstance(outline, CubicSegments):
+        if not hasattr(outline, "super_cubics"):
+            if not outline.segments:
+                outline.extract_segments()
+            if not hasattr(outline, "super_cubics"):
+                outline.to_supercubics()
+        return outline
+
+    if isinstance(outline, SegmentPayload):
+        return _payload_to_cubic_segments(outline)
+
+    segments = CubicSegments(layer=None)
+    segments.segments = [list(segment) for segment in outline]
+    segments.to_supercubics()
+    return segments
+
+
+def process_outlines_threaded(
+    outlines: Iterable[Any],
+    analyze: Callable[[CubicSegments], Any] = analyze_outline,
+    max_workers: int | None = None,
+) -> Iterator[tuple[int, Any]]:
+    """
+    Analyze many outlines in parallel threads. This only runs in parallel on a
+    free-threaded Python build; with the GIL, `process_outlines` is usually faster.
+
+    Each outline is only used by one thread, and the analyze function doesn't need to
+    be picklable. Analysis functions that query the same super cubic from several
+    threads must use the cursor methods, e.g. `SuperCubic.split_at_pt_from`, instead
+    of `SuperCubic.split_at_pt`.
+
+    Args:
+        outlines (Iterable[Any]): The outlines, as for `process_outlines`. The super
+            cubics of `CubicSegments` objects are built in place if they are missing.
+        analyze (Callable[[CubicSegments], Any], optional): The function that is
+            called with each outline after its super cubics have been built. Defaults
+            to `analyze_outline`.
+        max_workers (int | None, optional): The number of threads. None uses the
+            number of CPUs, 0 processes everything in the calling thread. Defaults to
+            None.
+
+    Yields:
+        tuple[int, Any]: The index of the outline and the result of analyze, in the
+            order of the outlines
+    """
+
+    def process(outline: Any) -> Any:
+        return analyze(_to_cubic_segments(outline))
+
+    if max_workers == 0:
+        yield from enumerate(map(process, outlines))
+        return
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    with ThreadPoolExecutor(max_workers) as executor:
+        yield from enumerate(executor.map(process, outlines))
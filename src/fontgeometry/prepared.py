@@ -0,0 +1,155 @@
+from typing import TYPE_CHECKING, Iterable
+
+from fontgeometry.ftbeziertools import calcCubicParameters
+
+if TYPE_CHECKING:
+    from fontgeometry.typing import PointTuple
+
+# Evaluation of a cubic curve from its polynomial parameters, which are calculated
+# only once. The polynomials are evaluated in Horner form, e.g.
+#   x(t) = ((ax * t + bx) * t + cx) * t + dx
+
+
+class PreparedCubic:
+    """
+    A cubic curve with precomputed polynomial parameters, for fast repeated evaluation
+    of points and derivatives.
+    """
+
+    __slots__ = ("ax", "ay", "bx", "by", "cx", "cy", "dx", "dy", "pt1", "pt4")
+
+    def __init__(
+        self,
+        pt1: "PointTuple",
+        pt2: "PointTuple",
+        pt3: "PointTuple",
+        pt4: "PointTuple",
+        params: "tuple[PointTuple, PointTuple, PointTuple, PointTuple] | None" = None,
+    ) -> None:
+        if params is None:
+            params = calcCubicParameters(pt1, pt2, pt3, pt4)
+        a, b, c, d = params
+        self.ax, self.ay = a
+        self.bx, self.by = b
+        self.cx, self.cy = c
+        self.dx, self.dy = d
+
+        # The end points are returned exactly for t = 0 and t = 1
+        self.pt1 = pt1
+        self.pt4 = pt4
+
+    def __repr__(self) -> str:
+        return "<PreparedCubic pt1=%s, pt4=%s>" % (self.pt1, self.pt4)
+
+    @property
+    def params(self) -> "tuple[PointTuple, PointTuple, PointTuple, PointTuple]":
+        return (
+            (self.ax, self.ay),
+            (self.bx, self.by),
+            (self.cx, self.cy),
+            (self.dx, self.dy),
+        )
+
+    def point(self, t: float) -> "PointTuple":
+        """
+        Return the point at t.
+
+        Args:
+            t (float): The t value
+
+        Returns:
+            PointTuple: The point
+        """
+        if t == 0:
+            return self.pt1
+        if t == 1:
+            return self.pt4
+        return (
+            ((self.ax * t + self.bx) * t + self.cx) * t + self.dx,
+            ((self.ay * t + self.by) * t + self.cy) * t + self.dy,
+        )
+
+    def points(self, ts: Iterable[float]) -> "list[PointTuple]":
+        """
+        Return the points at the t values.
+
+        Args:
+            ts (Iterable[float]): The t values
+
+        Returns:
+            list[PointTuple]: The points
+        """
+        (ax, ay), (bx, by), (cx, cy), (dx, dy) = self.params
+        points: "list[PointTuple]" = []
+        for t in ts:
+            if t == 0:
+                points.append(self.pt1)
+            elif t == 1:
+                points.append(self.pt4)
+            else:
+                points.append(
+                    (
+                        ((ax * t + bx) * t + cx) * t + dx,
+                        ((ay * t + by) * t + cy) * t + dy,
+                    )
+                )
+        return points
+
+    def derivative(self, t: float) -> "PointTuple":
+        """
+        Return the first derivative at t, the tangent vector.
+
+        Args:
+            t (float): The t value
+
+        Returns:
+            PointTuple: The derivative
+        """
+        return (
+            (3.0 * self.ax * t + 2.0 * self.bx) * t + self.cx,
+            (3.0 * self.ay * t + 2.0 * self.by) * t + self.cy,
+        )
+
+    def second_derivative(self, t: float) -> "PointTuple":
+        """
+        Return the second derivative at t.
+
+        Args:
+            t (float): The t value
+
+        Returns:
+            PointTuple: The second derivative
+        """
+        return 6.0 * self.ax * t + 2.0 * self.bx, 6.0 * self.ay * t + 2.0 * self.by
+
+    def speed(self, t: float) -> float:
+        """
+        Return the length of the first derivative at t, i.e. the rate of change of the
+        arc length.
+
+        Args:
+            t (float): The t value
+
+        Returns:
+            float: The speed
+        """
+        x1, y1 = self.derivative(t)
+        return (x1 * x1 + y1 * y1) ** 0.5
+
+    def curvature(self, t: float) -> float:
+        """
+        Return the signed curvature at t, the inverse of the radius of the osculating
+        circle. It is positive when the curve turns counter-clockwise.
+
+        Args:
+            t (float): The t value
+
+        Returns:
+            float: The curvature, 0.0 where the first derivative is zero
+        """
+        x1, y1 = self.derivative(t)
+        x2, y2 = self.second_derivative(t)
+        speed2 = x1 * x1 + y1 * y1
+        if speed2 == 0:
+            return 0.0
+        return (x1 * y2 - y1 * x2) / speed2**1.5
@@ -0,0 +1,260 @@
+from typing import TYPE_CHECKING, Callable, Iterable, Sequence
+
+if TYPE_CHECKING:
+    from fontgeometry.cubics import Cubic
+    from fontgeometry.typing import PointTuple
+
+# Nearest point projection onto cubic curves. The curve is sampled coarsely to find
+# candidate intervals for the closest point, then each candidate is refined by Newton
+# iterations on the derivative of the squared distance. If Newton doesn't converge
+# inside the interval, a golden section search is used instead.
+
+
+def project_point_on_cubic_parameters(
+    params: "tuple[PointTuple, PointTuple, PointTuple, PointTuple]",
+    pt: "PointTuple",
+    samples: int = 10,
+    tolerance: float = 1e-9,
+    max_iterations: int = 16,
+    t_min: float = 0.0,
+) -> tuple[float, float]:
+    """
+    Return the t value of the point on the cubic that is closest to pt, and the
+    distance between both points.
+
+    Args:
+        params (tuple[PointTuple, PointTuple, PointTuple, PointTuple]): The parameters
+            of the cubic as returned by `calcCubicParameters`
+        pt (PointTuple): The point to project onto the cubic
+        samples (int, optional): The number of intervals for the coarse sampling.
+            Defaults to 10.
+        tolerance (float, optional): Stop the Newton iterations when t changes by less
+            than the tolerance. Defaults to 1e-9.
+        max_iterations (int, optional): The maximum number of Newton iterations per
+            candidate. Defaults to 16.
+        t_min (float, optional): Only consider the points from this t value on. The
+            closest point in the range from t_min to 1.0 is returned. Defaults to 0.0.
+
+    Returns:
+        tuple[float, float]: The t value, t_min to 1.0, and the distance
+    """
+    (ax, ay), (bx, by), (cx, cy), (dx, dy) = params
+    # Move the point to the origin
+    dx -= pt[0]
+    dy -= pt[1]
+
+    def dist2(t: float) -> float:
+        x = ((ax * t + bx) * t + cx) * t + dx
+        y = ((ay * t + by) * t + cy) * t + dy
+        return x * x + y * y
+
+    # Coarse sampling of the squared distance
+    t_min = min(max(t_min, 0.0), 1.0)
+    step = (1.0 - t_min) / samples
+    ts = [t_min + i * step for i in range(samples)] + [1.0]
+    ds = [dist2(t) for t in ts]
+
+    best_t = t_min
+    best_d = ds[0]
+    for i in range(samples + 1):
+        d = ds[i]
+        if (i > 0 and ds[i - 1] < d) or (i < samples and ds[i + 1] < d):
+            # Not a local minimum of the samples
+            continue
+
+        # Refine with Newton iterations on f(t) = (B(t) - pt) . B'(t), inside the
+        # interval between the neighbouring samples
+        lo = ts[i - 1] if i > 0 else ts[0]
+        hi = ts[i + 1] if i < samples else ts[samples]
+        t = ts[i]
+        converged = False
+        for _ in range(max_iterations):
+            x = ((ax * t + bx) * t + cx) * t + dx
+            y = ((ay * t + by) * t + cy) * t + dy
+            x1 = (3.0 * ax * t + 2.0 * bx) * t + cx
+            y1 = (3.0 * ay * t + 2.0 * by) * t + cy
+            x2 = 6.0 * ax * t + 2.0 * bx
+            y2 = 6.0 * ay * t + 2.0 * by
+            f = x * x1 + y * y1
+            df = x1 * x1 + y1 * y1 + x * x2 + y * y2
+            if df <= 0.0:
+                # Not converging towards a minimum
+                break
+            t_new = min(max(t - f / df, lo), hi)
+            if abs(t_new - t) < tolerance:
+                t = t_new
+                converged = True
+                break
+            t = t_new
+        d = dist2(t)
+        if not converged or d > ds[i]:
+            # Newton failed, fall back to the slower golden section search
+            t = _golden_section(dist2, lo, hi, tolerance)
+            d = dist2(t)
+            if d > ds[i]:
+                t = ts[i]
+                d = ds[i]
+        if d < best_d:
+            best_t = t
+            best_d = d
+    return best_t, best_d**0.5
+
+
+def _golden_section(
+    f: Callable[[float], float], lo: float, hi: float, tolerance: float
+) -> float:
+    # Return the t value of a local minimum of f between lo and hi
+    ratio = 0.6180339887498949
+    t1 = hi - ratio * (hi - lo)
+    t2 = lo + ratio * (hi - lo)
+    f1 = f(t1)
+    f2 = f(t2)
+    while hi - lo > tolerance:
+        if f1 < f2:
+            hi = t2
+            t2 = t1
+            f2 = f1
+            t1 = hi - ratio * (hi - lo)
+            f1 = f(t1)
+        else:
+            lo = t1
+            t1 = t2
+            f1 = f2
+            t2 = lo + ratio * (hi - lo)
+            f2 = f(t2)
+    return (lo + hi) * 0.5
+
+
+def _bounds_distance(cubic: "Cubic", pt: "PointTuple") -> float:
+    # Return the distance from pt to the bounding box of the cubic, which is a lower
+    # bound of the distance from pt to the cubic.
+    x, y = pt
+    xMin, yMin, xMax, yMax = cubic.bounds
+    dx = max(xMin - x, 0.0, x - xMax)
+    dy = max(yMin - y, 0.0, y - yMax)
+    return (dx * dx + dy * dy) ** 0.5
+
+
+def project_point_on_cubics(
+    cubics: "Sequence[Cubic]",
+    pt: "PointTuple",
+    start_index: int = 0,
+    samples: int = 10,
+    tolerance: float = 1e-9,
+    start_t: float = 0.0,
+) -> tuple[int, float, float] | None:
+    """
+    Return the index of the cubic with the point closest to pt, the t value of that
+    point, and the distance between both points. Cubics whose bounding boxes are
+    farther away than the best distance found so far are skipped.
+
+    Args:
+        cubics (Sequence[Cubic]): The cubics
+        pt (PointTuple): The point to project onto the cubics
+        start_index (int, optional): Only consider the cubics from this index on.
+            Defaults to 0.
+        samples (int, optional): The number of intervals for the coarse sampling.
+            Defaults to 10.
+        tolerance (float, optional): The tolerance of t. Defaults to 1e-9.
+        start_t (float, optional): Only consider the points from this t value on in
+            the cubic at start_index. Defaults to 0.0.
+
+    Returns:
+        tuple[int, float, float] | None: The cubics index, t and the distance, or None
+            if there are no cubics to consider
+    """
+    best: tuple[int, float, float] | None = None
+    for index in range(start_index, len(cubics)):
+        cubic = cubics[index]
+        if best is not None and _bounds_distance(cubic, pt) >= best[2]:
+            continue
+        if index == start_index and start_t > 0.0:
+            t, d = _project_after(cubic, pt, start_t, samples, tolerance)
+        else:
+            t, d = project_point_on_cubic_parameters(
+                cubic.params, pt, samples, tolerance
+            )
+        if best is None or d < best[2]:
+            best = (index, t, d)
+    return best
+
+
+def _project_after(
+    cubic: "Cubic",
+    pt: "PointTuple",
+    t_min: float,
+    samples: int = 10,
+    tolerance: float = 1e-9,
+) -> tuple[float, float]:
+    # Project the point onto the part of the cubic from t_min on
+    return project_point_on_cubic_parameters(
+        cubic.params, pt, samples, tolerance, t_min=t_min
+    )
+
+
+def project_points_on_cubics(
+    cubics: "Sequence[Cubic]",
+    points: "Iterable[PointTuple]",
+    tolerance: float = 1.0,
+    samples: int = 10,
+) -> list[tuple[int, float, float]]:
+    """
+    Project points that are ordered along the cubics in one forward pass. Each point
+    is searched from the position of the previous point on, so the results are
+    ordered too. The search stops at the first cubic with a point closer than the
+    tolerance, so for points on the curve the cost is linear in the number of cubics
+    plus the number of points. Points farther away are projected onto all remaining
+    cubics.
+
+    Args:
+        cubics (Sequence[Cubic]): The cubics
+        points (Iterable[PointTuple]): The points, in the order of the cubics
+        tolerance (float, optional): The distance at which a point is considered to
+            be on a cubic. Defaults to 1.0.
+        samples (int, optional): The number of intervals for the coarse sampling.
+            Defaults to 10.
+
+    Returns:
+        list[tuple[int, float, float]]: The cubics index, t and the distance for each
+            point
+    """
+    results: list[tuple[int, float, float]] = []
+    num_cubics = len(cubics)
+    if num_cubics == 0:
+        return results
+
+    # The position of the previous point
+    cursor_index = 0
+    cursor_t = 0.0
+    for pt in points:
+        x, y = pt
+        found: tuple[int, float, float] | None = None
+        for index in range(cursor_index, num_cubics):
+            cubic = cubics[index]
+            xMin, yMin, xMax, yMax = cubic.bounds
+            if (
+                x < xMin - tolerance
+                or x > xMax + tolerance
+                or y < yMin - tolerance
+                or y > yMax + tolerance
+            ):
+                continue
+            t_min = cursor_t if index == cursor_index else 0.0
+            t, d = _project_after(cubic, pt, t_min, samples)
+            if d <= tolerance:
+                found = (index, t, d)
+                break
+
+        if found is None:
+            # Not on the curve, take the closest point after the cursor
+            best = project_point_on_cubics(cubics, pt, cursor_index, samples)
+            assert best is not None
+            index = best[0]
+            if index == cursor_index:
+                t, d = _project_after(cubics[index], pt, cursor_t, samples)
+                best = (index, t, d)
+            found = best
+
+        results.append(found)
+        cursor_index, cursor_t = found[0], found[1]
+    return results
@@ -1,8 +1,46 @@
-from decimal import ROUND_HALF_UP, Decimal, DefaultContext, setcontext
+from decimal import Decimal
+from math import ceil, floor
+from typing import TYPE_CHECKING, Iterable
 
-DefaultContext.rounding = ROUND_HALF_UP
-setcontext(DefaultContext)
+if TYPE_CHECKING:
+    from fontgeometry.typing import PointTuple
 
 
 def round_hup(value: float) -> int:
-    return int(round(Decimal(str(value)), 0))
+    """
+    Round half up, i.e. round to the nearest integer and round halves away from zero,
+    the way humans do it. The result is the same as rounding the shortest decimal
+    representation of the value with `decimal.ROUND_HALF_UP`, but only uses float
+    operations.
+
+    Args:
+        value (float): The value to round
+
+    Returns:
+        int: The rounded value
+    """
+    # The fractional part is calculated exactly, so this never suffers from the
+    # x + 0.5 error, e.g. for 0.49999999999999994.
+    if not -4503599627370496.0 < value < 4503599627370496.0:
+        # From 2 ** 52 on, all floats are integers, but their shortest decimal
+        # representation may differ from the exact value.
+        return int(Decimal(str(value)))
+    if value >= 0:
+        i = floor(value)
+        return i + 1 if value - i >= 0.5 else i
+    i = ceil(value)
+    return i - 1 if i - value >= 0.5 else i
+
+
+def round_points(points: "Iterable[PointTuple]") -> "list[PointTuple]":
+    """
+    Round the coordinates of all points half up.
+
+    Args:
+        points (Iterable[PointTuple]): The points
+
+    Returns:
+        list[PointTuple]: The rounded points
+    """
+    r = round_hup
+    return [(r(x), r(y)) for x, y in points]
@@ -0,0 +1,263 @@
+from math import floor
+from typing import TYPE_CHECKING, Any, Hashable
+
+from fontgeometry.projection import project_point_on_cubic_parameters
+
+if TYPE_CHECKING:
+    from fontgeometry.cubics import Cubic, SuperCubic
+    from fontgeometry.extract import CubicSegments
+    from fontgeometry.typing import BoundsTuple, PointTuple
+
+
+def _rect_distance(rect: "BoundsTuple", pt: "PointTuple") -> float:
+    # Return the distance from pt to the rectangle, 0 if it is inside
+    x, y = pt
+    dx = max(rect[0] - x, 0.0, x - rect[2])
+    dy = max(rect[1] - y, 0.0, y - rect[3])
+    return (dx * dx + dy * dy) ** 0.5
+
+
+class SegmentIndex:
+    """
+    A uniform grid index over the bounding boxes of cubics, for point, rectangle and
+    nearest segment queries that only need to look at nearby cubics.
+
+    Each cubic is added with a key that is returned by the queries, e.g. its index in
+    a `SuperCubic`.
+    """
+
+    def __init__(self, cell_size: float | None = None) -> None:
+        # The size of the grid cells. If None, it is derived from the average size of
+        # the cubics when the grid is built.
+        self.cell_size = cell_size
+
+        self.keys: list[Hashable] = []
+        self.cubics: "list[Cubic]" = []
+        self.bounds: "list[BoundsTuple]" = []
+
+        # The grid, mapping cell coordinates to item indices. Built on the first query.
+        self._grid: dict[tuple[int, int], list[int]] | None = None
+        self._cell_size = 1.0
+        self._cell_range = (0, 0, 0, 0)
+
+    def __len__(self) -> int:
+        return len(self.cubics)
+
+    def __repr__(self) -> str:
+        return "<SegmentIndex len=%i>" % len(self.cubics)
+
+    @classmethod
+    def from_super_cubic(
+        cls, super_cubic: "SuperCubic", cell_size: float | None = None
+    ) -> "SegmentIndex":
+        """
+        Build an index of the sub-cubics of a super cubic. The keys are the indices of
+        the sub-cubics.
+
+        Args:
+            super_cubic (SuperCubic): The super cubic
+            cell_size (float | None, optional): The grid cell size. Defaults to None.
+
+        Returns:
+            SegmentIndex: The index
+        """
+        index = cls(cell_size)
+        for i, cubic in enumerate(super_cubic.cubics):
+            index.add(i, cubic)
+        return index
+
+    @classmethod
+    def from_cubic_segments(
+        cls, segments: "CubicSegments", cell_size: float | None = None
+    ) -> "SegmentIndex":
+        """
+        Build an index of all cubics of the super cubics of a glyph. The keys are
+        tuples of the super cubic index and the cubic index inside the super cubic.
+
+        Args:
+            segments (CubicSegments): The glyph segments, with super cubics already
+                built by `to_supercubics`
+            cell_size (float | None, optional): The grid cell size. Defaults to None.
+
+        Returns:
+            SegmentIndex: The index
+        """
+        index = cls(cell_size)
+        for i, super_cubic in enumerate(segments.super_cubics):
+            for j, cubic in enumerate(super_cubic.cubics):
+                index.add((i, j), cubic)
+        return index
+
+    def add(self, key: Hashable, cubic: "Cubic") -> None:
+        """
+        Add a cubic to the index.
+
+        Args:
+            key (Hashable): The key that is returned for the cubic by queries
+            cubic (Cubic): The cubic
+        """
+        self.keys.append(key)
+        self.cubics.append(cubic)
+        self.bounds.append(cubic.bounds)
+        # The grid must be rebuilt
+        self._grid = None
+
+    def _build(self) -> dict[tuple[int, int], list[int]]:
+        cell_size = self.cell_size
+        if cell_size is None:
+            # Use the average cubic size
+            sizes = [max(b[2] - b[0], b[3] - b[1]) for b in self.bounds]
+            cell_size = sum(sizes) / len(sizes) if sizes else 1.0
+            if cell_size <= 0:
+                cell_size = 1.0
+        self._cell_size = cell_size
+
+        grid: dict[tuple[int, int], list[int]] = {}
+        x0 = y0 = x1 = y1 = 0
+        for i, rect in enumerate(self.bounds):
+            cx0, cy0, cx1, cy1 = self._cells(rect)
+            if i == 0:
+                x0, y0, x1, y1 = cx0, cy0, cx1, cy1
+            else:
+                x0 = min(x0, cx0)
+                y0 = min(y0, cy0)
+                x1 = max(x1, cx1)
+                y1 = max(y1, cy1)
+            for cx in range(cx0, cx1 + 1):
+                for cy in range(cy0, cy1 + 1):
+                    grid.setdefault((cx, cy), []).append(i)
+        self._cell_range = (x0, y0, x1, y1)
+        self._grid = grid
+        return grid
+
+    def _cells(self, rect: "BoundsTuple") -> tuple[int, int, int, int]:
+        # Return the range of cells covered by the rectangle
+        cs = self._cell_size
+        return (
+            floor(rect[0] / cs),
+            floor(rect[1] / cs),
+            floor(rect[2] / cs),
+            floor(rect[3] / cs),
+        )
+
+    def _candidates(self, rect: "BoundsTuple") -> list[int]:
+        # Return the sorted indices of items whose bounds intersect the rectangle
+        grid = self._grid if self._grid is not None else self._build()
+        cx0, cy0, cx1, cy1 = self._cells(rect)
+        gx0, gy0, gx1, gy1 = self._cell_range
+        found: set[int] = set()
+        for cx in range(max(cx0, gx0), min(cx1, gx1) + 1):
+            for cy in range(max(cy0, gy0), min(cy1, gy1) + 1):
+                items = grid.get((cx, cy))
+                if items:
+                    found.update(items)
+        xMin, yMin, xMax, yMax = rect
+        return sorted(
+            i
+            for i in found
+            if self.bounds[i][0] <= xMax
+            and self.bounds[i][2] >= xMin
+            and self.bounds[i][1] <= yMax
+            and self.bounds[i][3] >= yMin
+        )
+
+    def query_point(self, pt: "PointTuple", tolerance: float = 0.0) -> list[Any]:
+        """
+        Return the keys of the cubics whose bounding boxes contain the point.
+
+        Args:
+            pt (PointTuple): The point
+            tolerance (float, optional): Enlarge the bounding boxes by this amount.
+                Defaults to 0.0.
+
+        Returns:
+            list[Any]: The keys, in the order the cubics were added
+        """
+        x, y = pt
+        rect = (x - tolerance, y - tolerance, x + tolerance, y + tolerance)
+        return [self.keys[i] for i in self._candidates(rect)]
+
+    def query_rect(self, rect: "BoundsTuple") -> list[Any]:
+        """
+        Return the keys of the cubics whose bounding boxes intersect the rectangle.
+
+        Args:
+            rect (BoundsTuple): The rectangle as (xMin, yMin, xMax, yMax)
+
+        Returns:
+            list[Any]: The keys, in the order the cubics were added
+        """
+        return [self.keys[i] for i in self._candidates(rect)]
+
+    def nearest(self, pt: "PointTuple") -> tuple[Any, float, float] | None:
+        """
+        Return the key of the cubic that is closest to the point, the t value of the
+        closest point on it, and the distance. The grid is searched in rings around
+        the point until no closer cubic can be found.
+
+        Args:
+            pt (PointTuple): The point
+
+        Returns:
+            tuple[Any, float, float] | None: The key, t and the distance, or None if
+                the index is empty
+        """
+        if not self.cubics:
+            return None
+
+        grid = self._grid if self._grid is not None else self._build()
+        cs = self._cell_size
+        px = floor(pt[0] / cs)
+        py = floor(pt[1] / cs)
+        gx0, gy0, gx1, gy1 = self._cell_range
+        # Rings closer to the point than the grid are empty, and the last ring covers
+        # the whole grid
+        first_ring = max(gx0 - px, px - gx1, gy0 - py, py - gy1, 0)
+        last_ring = max(px - gx0, gx1 - px, py - gy0, gy1 - py)
+
+        seen: set[int] = set()
+        best: tuple[int, float, float] | None = None
+        for ring in range(first_ring, last_ring + 1):
+            if best is not None and (ring - 1) * cs > best[2]:
+                # All cubics in this and further rings are farther away
+                break
+
+            for cell in self._ring_cells(px, py, ring):
+                for i in grid.get(cell, ()):
+                    if i in seen:
+                        continue
+
+                    seen.add(i)
+                    if (
+                        best is not None
+                        and _rect_distance(self.bounds[i], pt) >= best[2]
+                    ):
+                        continue
+
+                    t, d = project_point_on_cubic_parameters(self.cubics[i].params, pt)
+                    if best is None or d < best[2] or (d == best[2] and i < best[0]):
+                        best = (i, t, d)
+        if best is None:
+            return None
+
+        i, t, d = best
+        return self.keys[i], t, d
+
+    def _ring_cells(self, px: int, py: int, ring: int) -> list[tuple[int, int]]:
+        # Return the cells of the grid at a Chebyshev distance of ring from (px, py)
+        if ring == 0:
+            return [(px, py)]
+
+        gx0, gy0, gx1, gy1 = self._cell_range
+        cells = []
+        x0 = max(px - ring, gx0)
+        x1 = min(px + ring, gx1)
+        for cy in (py - ring, py + ring):
+            if gy0 <= cy <= gy1:
+                cells.extend((cx, cy) for cx in range(x0, x1 + 1))
+        y0 = max(py - ring + 1, gy0)
+        y1 = min(py + ring - 1, gy1)
+        for cx in (px - ring, px + ring):
+            if gx0 <= cx <= gx1:
+                cells.extend((cx, cy) for cy in range(y0, y1 + 1))
+        return cells
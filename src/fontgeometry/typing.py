@@ -1 +1,2 @@
 PointTuple = tuple[float, float]
+BoundsTuple = tuple[float, float, float, float]
@@ -0,0 +1,267 @@
+from bisect import bisect_left, bisect_right
+from typing import TYPE_CHECKING, Iterable
+
+from fontgeometry.beziertools import getExtremaForCubic, splitCubicAtTs
+from fontgeometry.ftbeziertools import calcCubicParameters, solveCubic
+
+if TYPE_CHECKING:
+    from fontgeometry.cubics import Cubic, SuperCubic
+    from fontgeometry.extract import CubicSegments
+    from fontgeometry.typing import PointTuple
+
+# Winding numbers of points for closed outlines. The cubics are split at their
+# extrema in both directions into pieces that are monotonic in x and y. A ray from the
+# query point in positive x direction crosses each piece at most once, so each piece
+# that spans the y of the point needs at most one root solve. Pieces that lie
+# completely on one side of the point don't need any.
+#
+# The pieces are sorted into horizontal bands between the y values of their end
+# points, so a query only looks at the pieces of one band.
+
+# The tolerance for roots outside of the piece
+_ROOT_TOLERANCE = 1e-9
+
+FILL_RULES = ("nonzero", "evenodd")
+
+
+class _Piece:
+    # A piece of a cubic that is monotonic in x and y
+
+    __slots__ = ("y_min", "y_max", "x_min", "x_max", "direction", "params")
+
+    def __init__(
+        self,
+        pt1: "PointTuple",
+        pt2: "PointTuple",
+        pt3: "PointTuple",
+        pt4: "PointTuple",
+    ) -> None:
+        (x1, y1), (x4, y4) = pt1, pt4
+        self.y_min = min(y1, y4)
+        self.y_max = max(y1, y4)
+        self.x_min = min(x1, x4)
+        self.x_max = max(x1, x4)
+
+        # +1 if the piece goes up, -1 if it goes down
+        self.direction = 1 if y4 > y1 else -1
+
+        # The polynomial parameters (ax, bx, cx, dx, ay, by, cy, dy)
+        (ax, ay), (bx, by), (cx, cy), (dx, dy) = calcCubicParameters(pt1, pt2, pt3, pt4)
+        self.params = (ax, bx, cx, dx, ay, by, cy, dy)
+
+    def x_at_y(self, y: float) -> float:
+        # Return the x coordinate at which the piece crosses y, which must be inside
+        # the y range of the piece
+        ax, bx, cx, dx, ay, by, cy, dy = self.params
+        t = None
+        for root in solveCubic(ay, by, cy, dy - y):
+            if -_ROOT_TOLERANCE <= root <= 1.0 + _ROOT_TOLERANCE:
+                t = min(1.0, max(0.0, root))
+                break
+        if t is None:
+            # No root was found for numerical reasons, bisect the monotonic piece
+            t0 = 0.0
+            t1 = 1.0
+            up = self.direction > 0
+            for _ in range(60):
+                t = (t0 + t1) * 0.5
+                if (((ay * t + by) * t + cy) * t + dy < y) == up:
+                    t0 = t
+                else:
+                    t1 = t
+        return ((ax * t + bx) * t + cx) * t + dx
+
+
+def _winding_in_band(pieces: "list[_Piece]", x: float, y: float) -> int:
+    # Return the winding number of the point for the pieces of its band
+    winding = 0
+    for piece in pieces:
+        if piece.x_max < x:
+            # The piece is left of the point
+            continue
+        if piece.x_min > x or piece.x_at_y(y) > x:
+            winding += piece.direction
+    return winding
+
+
+class WindingIndex:
+    """
+    An index of the monotonic pieces of a closed outline, for point in outline tests
+    and winding numbers.
+
+    The winding number is positive for points inside counter-clockwise contours. The
+    result for points exactly on the outline is undefined.
+    """
+
+    def __init__(self) -> None:
+        self.pieces: list[_Piece] = []
+
+        # The sorted y values of the band edges, and the pieces in each band. Built
+        # on the first query.
+        self._edges: list[float] | None = None
+        self._bands: list[list[_Piece]] = []
+
+    def __len__(self) -> int:
+        return len(self.pieces)
+
+    def __repr__(self) -> str:
+        return "<WindingIndex len=%i>" % len(self.pieces)
+
+    @classmethod
+    def from_super_cubics(cls, super_cubics: "Iterable[SuperCubic]") -> "WindingIndex":
+        """
+        Build an index of the cubics of several super cubics, which together must form
+        closed contours.
+
+        Args:
+            super_cubics (Iterable[SuperCubic]): The super cubics
+
+        Returns:
+            WindingIndex: The index
+        """
+        index = cls()
+        for super_cubic in super_cubics:
+            for cubic in super_cubic.cubics:
+                index.add(cubic)
+        return index
+
+    @classmethod
+    def from_cubic_segments(cls, segments: "CubicSegments") -> "WindingIndex":
+        """
+        Build an index of all cubics of the super cubics of a glyph. The lines of the
+        glyph must be included, so the contours are closed.
+
+        Args:
+            segments (CubicSegments): The glyph segments, with super cubics already
+                built by `to_supercubics`
+
+        Returns:
+            WindingIndex: The index
+        """
+        return cls.from_super_cubics(segments.super_cubics)
+
+    def add(self, cubic: "Cubic") -> None:
+        """
+        Add a cubic to the index, split into monotonic pieces.
+
+        Args:
+            cubic (Cubic): The cubic, line or quadratic
+        """
+        pt1, pt2, pt3, pt4 = cubic.pt1, cubic.pt2, cubic.pt3, cubic.pt4
+        ts = sorted(set(getExtremaForCubic(pt1, pt2, pt3, pt4, h=True, v=True)))
+        for piece in splitCubicAtTs(pt1, pt2, pt3, pt4, ts):
+            if piece[0][1] != piece[3][1]:
+                # Horizontal pieces are never crossed by the ray
+                self.pieces.append(_Piece(*piece))
+        # The bands must be rebuilt
+        self._edges = None
+
+    def _build(self) -> list[float]:
+        edges = sorted({y for piece in self.pieces for y in (piece.y_min, piece.y_max)})
+        bands: list[list[_Piece]] = [[] for _ in range(max(0, len(edges) - 1))]
+        for piece in self.pieces:
+            # The band i spans edges[i] <= y < edges[i + 1]
+            for i in range(
+                bisect_left(edges, piece.y_min), bisect_left(edges, piece.y_max)
+            ):
+                bands[i].append(piece)
+        self._bands = bands
+        self._edges = edges
+        return edges
+
+    def _band(self, y: float) -> int:
+        # Return the index of the band that contains y, or -1
+        edges = self._edges if self._edges is not None else self._build()
+        i = bisect_right(edges, y) - 1
+        if i < 0 or i >= len(self._bands):
+            return -1
+        return i
+
+    def winding_number(self, pt: "PointTuple") -> int:
+        """
+        Return the winding number of the outline around the point.
+
+        Args:
+            pt (PointTuple): The point
+
+        Returns:
+            int: The winding number, 0 for points outside of the outline
+        """
+        x, y = pt
+        i = self._band(y)
+        if i < 0:
+            return 0
+        return _winding_in_band(self._bands[i], x, y)
+
+    def winding_numbers(self, points: "Iterable[PointTuple]") -> list[int]:
+        """
+        Return the winding numbers of the outline around many points. The points are
+        grouped by band, so each band is only looked up once.
+
+        Args:
+            points (Iterable[PointTuple]): The points
+
+        Returns:
+            list[int]: The winding numbers, in the order of the points
+        """
+        points = list(points)
+        results = [0] * len(points)
+        by_band: dict[int, list[int]] = {}
+        for j, (_x, y) in enumerate(points):
+            i = self._band(y)
+            if i >= 0:
+                by_band.setdefault(i, []).append(j)
+        for i, indices in by_band.items():
+            pieces = self._bands[i]
+            for j in indices:
+                x, y = points[j]
+                results[j] = _winding_in_band(pieces, x, y)
+        return results
+
+    def contains(self, pt: "PointTuple", fill_rule: str = "nonzero") -> bool:
+        """
+        Return whether the point is inside the outline.
+
+        Args:
+            pt (PointTuple): The point
+            fill_rule (str, optional): "nonzero" or "evenodd". Defaults to "nonzero".
+
+        Raises:
+            ValueError: If the fill rule is unknown
+
+        Returns:
+            bool: True if the point is inside
+        """
+        return _is_inside(self.winding_number(pt), _check_fill_rule(fill_rule))
+
+    def contains_points(
+        self, points: "Iterable[PointTuple]", fill_rule: str = "nonzero"
+    ) -> list[bool]:
+        """
+        Return whether each of the points is inside the outline, see `contains`.
+
+        Args:
+            points (Iterable[PointTuple]): The points
+            fill_rule (str, optional): "nonzero" or "evenodd". Defaults to "nonzero".
+
+        Raises:
+            ValueError: If the fill rule is unknown
+
+        Returns:
+            list[bool]: True for each point that is inside
+        """
+        evenodd = _check_fill_rule(fill_rule)
+        return [_is_inside(w, evenodd) for w in self.winding_numbers(points)]
+
+
+def _check_fill_rule(fill_rule: str) -> bool:
+    # Return True for the even-odd rule
+    if fill_rule not in FILL_RULES:
+        raise ValueError("Unknown fill rule: %s" % fill_rule)
+    return fill_rule == "evenodd"
+
+
+def _is_inside(winding: int, evenodd: bool) -> bool:
+    if evenodd:
+        return winding % 2 == 1
+    return winding != 0
@@ -0,0 +1,315 @@
+import unittest
+from random import Random
+
+import pytest
+
+from fontgeometry.beziertools import (
+    getBoundsForCubic,
+    getExtremaForCubic,
+    getInflectionsForCubic,
+    getMomentsForCubicParameters,
+    getPointListForCubic,
+    getPointListForQuadratic,
+    getPointOnCubic,
+    solveLinear,
+    splitCubicAtTs,
+)
+from fontgeometry.ftbeziertools import calcCubicParameters, solveCubic, solveQuadratic
+from fontgeometry.geometry import intersect, same_direction
+from fontgeometry.rounding import round_points as round_points_scalar
+
+np = pytest.importorskip("numpy")
+
+from fontgeometry.batch import (  # noqa: E402
+    bounds_for_cubics,
+    evaluate_cubics,
+    evaluate_quadratics,
+    extrema_for_cubics,
+    handle_intersections,
+    inflections_for_cubics,
+    intersect_many,
+    moments_for_cubics,
+    round_points,
+    same_direction_many,
+    solve_cubics,
+    solve_linears,
+    solve_quadratics,
+    split_cubics,
+)
+
+
+def random_curves(num_curves: int, num_points: int, seed: int = 0) -> list:
+    rnd = Random(seed)
+    return [
+        [
+            ((rnd.random() - 0.5) * 16384, (rnd.random() - 0.5) * 16384)
+            for _ in range(num_points)
+        ]
+        for _ in range(num_curves)
+    ]
+
+
+class BatchEvaluationTests(unittest.TestCase):
+    def test_evaluate_cubics_shape(self) -> None:
+        result = evaluate_cubics(random_curves(5, 4), [0.0, 0.25, 0.5, 1.0])
+        assert result.shape == (5, 4, 2)
+
+    def test_evaluate_cubics_simple(self) -> None:
+        result = evaluate_cubics([((0, 0), (1, 1), (3, 1), (4, 0))], [0, 0.5, 1])
+        assert result.tolist() == [[[0, 0], [2.0, 0.75], [4, 0]]]
+
+    def test_evaluate_cubics_matches_scalar(self) -> None:
+        curves = random_curves(200, 4)
+        ts = [i / 37 for i in range(38)] + [0.5]
+        result = evaluate_cubics(curves, ts)
+        for curve, points in zip(curves, result):
+            expected = getPointListForCubic(ts, *curve)
+            assert np.allclose(points, expected, rtol=0, atol=1e-9)
+            for t, point in zip(ts, points):
+                assert np.allclose(point, getPointOnCubic(t, *curve), rtol=0, atol=1e-9)
+
+    def test_evaluate_quadratics_matches_scalar(self) -> None:
+        curves = random_curves(200, 3, seed=1)
+        ts = [i / 37 for i in range(38)]
+        result = evaluate_quadratics(curves, ts)
+        assert result.shape == (200, 38, 2)
+        for curve, points in zip(curves, result):
+            expected = getPointListForQuadratic(ts, *curve)
+            assert np.allclose(points, expected, rtol=0, atol=1e-9)
+
+    def test_evaluate_cubics_bad_shape(self) -> None:
+        with pytest.raises(ValueError):
+            evaluate_cubics([((0, 0), (1, 1), (3, 1))], [0.5])
+        with pytest.raises(ValueError):
+            evaluate_cubics([((0, 0), (1, 1), (3, 1), (4, 0))], [[0.5]])
+
+
+class BatchBoundsTests(unittest.TestCase):
+    def test_bounds_for_cubics(self) -> None:
+        result = bounds_for_cubics(
+            [((0, 0), (1, 1), (3, 1), (4, 0)), ((0, 0), (1, 0), (2, 0), (3, 0))]
+        )
+        assert result.tolist() == [[0, 0, 4, 0.75], [0, 0, 3, 0]]
+
+    def test_bounds_for_cubics_matches_scalar(self) -> None:
+        curves = random_curves(500, 4, seed=2)
+        # Include some degenerate curves: Straight lines and quadratic-like
+        # derivatives
+        curves.append([(0, 0), (0, 0), (0, 0), (0, 0)])
+        curves.append([(0, 0), (1, 2), (2, 4), (3, 6)])
+        curves.append([(0, 0), (1, 3), (2, 3), (3, 0)])
+        result = bounds_for_cubics(curves)
+        assert result.shape == (len(curves), 4)
+        for curve, bounds in zip(curves, result):
+            assert np.allclose(bounds, getBoundsForCubic(*curve), rtol=0, atol=1e-6)
+
+
+class BatchMomentsTests(unittest.TestCase):
+    def test_moments_for_cubics_matches_scalar(self) -> None:
+        curves = random_curves(200, 4, seed=5)
+        curves.append([(0, 0), (0, 0), (0, 0), (0, 0)])
+        result = moments_for_cubics(curves)
+        assert result.shape == (len(curves), 3)
+        for curve, moments in zip(curves, result):
+            expected = getMomentsForCubicParameters(calcCubicParameters(*curve))
+            assert np.allclose(moments, expected, rtol=1e-9, atol=1e-6)
+
+    def test_moments_for_cubics_square(self) -> None:
+        # A counter-clockwise unit square of straight cubics
+        square = [
+            ((0, 0), (1 / 3, 0), (2 / 3, 0), (1, 0)),
+            ((1, 0), (1, 1 / 3), (1, 2 / 3), (1, 1)),
+            ((1, 1), (2 / 3, 1), (1 / 3, 1), (0, 1)),
+            ((0, 1), (0, 2 / 3), (0, 1 / 3), (0, 0)),
+        ]
+        area, moment_x, moment_y = moments_for_cubics(square).sum(axis=0)
+        assert area == pytest.approx(1)
+        assert (moment_x, moment_y) == pytest.approx((0.5, 0.5))
+
+
+def random_coefficients(num: int, seed: int = 0) -> list[list[float]]:
+    # Random coefficients, including some zeros and repeated values
+    rnd = Random(seed)
+    choices = [0.0, 0.0, 1.0, -1.0, 2.0, 1e-13]
+    return [
+        [
+            rnd.choice(choices) if rnd.random() < 0.2 else rnd.uniform(-100, 100)
+            for _ in range(4)
+        ]
+        for _ in range(num)
+    ]
+
+
+class BatchSolverTests(unittest.TestCase):
+    def assert_roots(self, result, expected, unit_interval: bool = False) -> None:
+        roots, counts = result
+        for row, count, exp in zip(roots, counts, expected):
+            if unit_interval:
+                if any(abs(t) < 1e-9 or abs(t - 1) < 1e-9 for t in exp):
+                    # Rounding errors may move the root out of the interval
+                    continue
+                exp = [t for t in exp if 0 <= t <= 1]
+            assert count == len(exp)
+            assert np.isnan(row[count:]).all()
+            assert np.allclose(row[:count], sorted(exp), rtol=1e-9, atol=1e-9)
+
+    def test_solve_linears(self) -> None:
+        coeffs = random_coefficients(300)
+        a, b = np.array(coeffs)[:, :2].T
+        expected = [solveLinear(*c[:2]) for c in coeffs]
+        self.assert_roots(solve_linears(a, b), expected)
+        self.assert_roots(solve_linears(a, b, True), expected, True)
+
+    def test_solve_quadratics(self) -> None:
+        coeffs = random_coefficients(300, seed=1)
+        a, b, c = np.array(coeffs)[:, :3].T
+        expected = [solveQuadratic(*c[:3]) for c in coeffs]
+        self.assert_roots(solve_quadratics(a, b, c), expected)
+        self.assert_roots(solve_quadratics(a, b, c, True), expected, True)
+
+    def test_solve_cubics(self) -> None:
+        coeffs = random_coefficients(300, seed=2)
+        a, b, c, d = np.array(coeffs).T
+        expected = [solveCubic(*c) for c in coeffs]
+        self.assert_roots(solve_cubics(a, b, c, d), expected)
+        self.assert_roots(solve_cubics(a, b, c, d, True), expected, True)
+
+    def test_solve_cubics_simple(self) -> None:
+        # (x - 1)(x - 2)(x - 3), x^3, and x^3 + x + 1 with one real root
+        roots, counts = solve_cubics([1, 1, 1], [-6, 0, 0], [11, 0, 1], [-6, 0, 1])
+        assert counts.tolist() == [3, 1, 1]
+        assert np.allclose(roots[0], [1, 2, 3])
+        assert roots[1, 0] == 0
+        assert roots[2, 0] == pytest.approx(-0.6823278038280193)
+
+    def test_solve_bad_shape(self) -> None:
+        with pytest.raises(ValueError):
+            solve_quadratics([[1]], [[2]], [[3]])
+
+    def test_extrema_for_cubics(self) -> None:
+        curves = random_curves(200, 4, seed=3)
+        curves.append([(0, 0), (1, 1), (3, 1), (4, 0)])
+        for h, v, include_start_end in (
+            (True, False, False),
+            (False, True, False),
+            (True, True, True),
+        ):
+            expected = [
+                getExtremaForCubic(
+                    *curve, h=h, v=v, include_start_end=include_start_end
+                )
+                for curve in curves
+            ]
+            self.assert_roots(
+                extrema_for_cubics(curves, h, v, include_start_end), expected
+            )
+
+    def test_inflections_for_cubics(self) -> None:
+        curves = random_curves(200, 4, seed=4)
+        curves.append([(0, 0), (1, 1), (3, 1), (4, 0)])
+        curves.append([(4, 0), (5, 1), (7, 0), (8, 0)])
+        expected = [getInflectionsForCubic(*curve) for curve in curves]
+        self.assert_roots(inflections_for_cubics(curves), expected)
+
+
+class BatchSplitTests(unittest.TestCase):
+    def test_split_cubics(self) -> None:
+        pieces, counts = split_cubics(
+            [((0, 0), (1, 1), (3, 1), (4, 0))] * 2, [[0.5, np.nan], [0.5, 1.0]]
+        )
+        assert pieces.shape == (2, 3, 4, 2)
+        assert counts.tolist() == [2, 2]
+        expected = [
+            [[0, 0], [0.5, 0.5], [1.25, 0.75], [2.0, 0.75]],
+            [[2.0, 0.75], [2.75, 0.75], [3.5, 0.5], [4, 0]],
+        ]
+        for i in range(2):
+            assert pieces[i, :2].tolist() == expected
+            assert np.isnan(pieces[i, 2]).all()
+
+    def test_split_cubics_matches_scalar(self) -> None:
+        curves = random_curves(200, 4, seed=5)
+        extrema, _ = extrema_for_cubics(curves, True, True)
+        inflections, _ = inflections_for_cubics(curves)
+        ts = np.concatenate([extrema, inflections], axis=1)
+        pieces, counts = split_cubics(curves, ts)
+        for curve, curve_ts, curve_pieces, count in zip(curves, ts, pieces, counts):
+            expected = splitCubicAtTs(*curve, sorted(curve_ts[~np.isnan(curve_ts)]))
+            assert count == len(expected)
+            assert np.allclose(curve_pieces[:count], expected, rtol=0, atol=1e-9)
+            assert np.isnan(curve_pieces[count:]).all()
+            assert curve_pieces[count - 1, 3].tolist() == list(curve[3])
+
+    def test_split_cubics_shared_ts(self) -> None:
+        pieces, counts = split_cubics(random_curves(3, 4), [0.25, 0.5, 0.75])
+        assert pieces.shape == (3, 4, 4, 2)
+        assert counts.tolist() == [4, 4, 4]
+
+
+class BatchLineTests(unittest.TestCase):
+    def test_intersect_many(self) -> None:
+        lines = [
+            ((0, 0), (0, 10), (-1, 5), (1, 5)),
+            ((0, 0), (0, 10), (-1, 3), (1, 5)),
+            # Parallel lines
+            ((0, 0), (0, 10), (-1, 10), (-1, 11)),
+            # Point with line
+            ((2, 2), (2, 2), (1, 1), (2, 1)),
+        ]
+        points, mask = intersect_many(*np.array(lines).transpose(1, 0, 2))
+        assert mask.tolist() == [True, True, False, False]
+        assert points[:2].tolist() == [[0.0, 5.0], [0.0, 4.0]]
+        assert np.isnan(points[2:]).all()
+
+    def test_intersect_many_matches_scalar(self) -> None:
+        curves = random_curves(1000, 4, seed=6)
+        points, mask = intersect_many(*np.array(curves).transpose(1, 0, 2))
+        for curve, point, valid in zip(curves, points, mask):
+            expected = intersect(*curve)
+            assert valid == (expected is not None)
+            assert tuple(point) == expected
+
+    def test_same_direction_many(self) -> None:
+        curves = random_curves(1000, 4, seed=7)
+        p0, p1, p2, p3 = np.array(curves).transpose(1, 0, 2)
+        points, _mask = intersect_many(p0, p1, p2, p3)
+        result = same_direction_many(p0, p1, p2, p3, points)
+        for curve, point, valid in zip(curves, points, result):
+            assert valid == same_direction(*curve, tuple(point))
+
+        points, mask = handle_intersections(curves)
+        assert (mask == result).all()
+
+    def test_same_direction_many_degenerate(self) -> None:
+        p = [(0, 0)]
+        assert same_direction_many(p, p, [(1, 1)], [(2, 0)], [(1, 0)]).tolist() == [
+            False
+        ]
+        assert same_direction_many(
+            p, [(1, 0)], [(1, 1)], [(2, 0)], [(np.nan, np.nan)]
+        ).tolist() == [False]
+
+
+class BatchRoundingTests(unittest.TestCase):
+    def test_round_points(self) -> None:
+        result = round_points([(0.5, -0.5), (1.4, 2.5), (0.49999999999999994, -2.5)])
+        assert result.tolist() == [[1, -1], [1, 3], [0, -3]]
+        assert result.dtype == np.int64
+
+    def test_round_points_overflow(self) -> None:
+        assert round_points([(2.0**62, -(2.0**62))]).tolist() == [[2**62, -(2**62)]]
+        with pytest.raises(OverflowError):
+            round_points([(0, 2.0**63)])
+        with pytest.raises(OverflowError):
+            round_points([(-1e300, 0)])
+
+    def test_round_points_matches_scalar(self) -> None:
+        rnd = Random(0)
+        points = []
+        for _ in range(10000):
+            half = rnd.randint(-20000, 20000) + 0.5
+            points.append((rnd.uniform(-20000, 20000), half))
+            points.append((half + 1e-12, half - 1e-12))
+        assert round_points(points).tolist() == [
+            list(pt) for pt in round_points_scalar(points)
+        ]
@@ -1,6 +1,22 @@
 import unittest
+from math import hypot, pi
 
-from fontgeometry.beziertools import getPointListForCubic
+import pytest
+
+from fontgeometry.beziertools import (
+    calculateCubicCurveLength,
+    estimateCubicCurveLength,
+    getArcLengthForCubicParameters,
+    getArcLengthForQuadratic,
+    getAreaForCubicParameters,
+    getBoundsForCubic,
+    getBoundsForQuadratic,
+    getFlattenedPointsForCubic,
+    getMomentsForCubicParameters,
+    getPointListForCubic,
+    splitCubicAtTs,
+)
+from fontgeometry.ftbeziertools import calcCubicParameters
 
 intersect_lines = (
     ([0.0, 1.0], ((0, 0), (0, 10), (-1, 5), (1, 5)), [(0, 0), (1, 5)]),
@@ -14,3 +30,159 @@ class BeziertoolsTests(unittest.TestCase):
             p0, p1, p2, p3 = curve
             result = getPointListForCubic(ts, p0, p1, p2, p3)
             assert result == results
+
+    def test_calculateCubicCurveLength_line(self):
+        assert calculateCubicCurveLength((0, 0), (1, 0), (2, 0), (3, 0)) == (
+            pytest.approx(3.0, abs=1e-12)
+        )
+
+    def test_calculateCubicCurveLength_circle(self):
+        # Quarter circle approximation with radius 1000
+        k = 552.2847498
+        length = calculateCubicCurveLength(
+            (1000, 0), (1000, k), (k, 1000), (0, 1000), tolerance=1e-6
+        )
+        # The approximation deviates from the circle by 0.027 %
+        assert length == pytest.approx(500 * pi, rel=3e-4)
+
+    def test_calculateCubicCurveLength_tight(self):
+        # A tight curve where the polyline estimate is inaccurate
+        curve = ((0, 0), (1000, 1000), (-1000, 1000), (10, 0))
+        points = getPointListForCubic([i / 100000 for i in range(100001)], *curve)
+        reference = sum(
+            hypot(b[0] - a[0], b[1] - a[1]) for a, b in zip(points, points[1:])
+        )
+        length = calculateCubicCurveLength(*curve, tolerance=0.001)
+        assert abs(length - reference) < 0.01
+        assert abs(estimateCubicCurveLength(*curve) - reference) > 1
+
+    def test_getArcLengthForCubicParameters_partial(self):
+        params = calcCubicParameters((0, 0), (1, 1), (3, 1), (4, 0))
+        whole = getArcLengthForCubicParameters(params, tolerance=1e-9)
+        first = getArcLengthForCubicParameters(params, 0.0, 0.3, tolerance=1e-9)
+        second = getArcLengthForCubicParameters(params, 0.3, 1.0, tolerance=1e-9)
+        assert first + second == pytest.approx(whole, abs=1e-8)
+        # Symmetric curve
+        half = getArcLengthForCubicParameters(params, 0.0, 0.5, tolerance=1e-9)
+        assert half == pytest.approx(whole / 2, abs=1e-8)
+
+    def test_getBoundsForCubic(self):
+        assert getBoundsForCubic((0, 0), (1, 1), (3, 1), (4, 0)) == (0, 0, 4, 0.75)
+        assert getBoundsForCubic((0, 0), (1, 1), (2, 2), (3, 3)) == (0, 0, 3, 3)
+        xMin, yMin, xMax, yMax = getBoundsForCubic((0, 0), (-1, 1), (4, 2), (3, 0))
+        assert xMin < 0 and xMax > 3
+        assert yMin == 0 and 0 < yMax < 2
+
+    def test_getArcLengthForQuadratic(self):
+        # Compare to the equivalent cubic
+        quadratic = ((0, 0), (2, 3), (5, 1))
+        cubic = ((0, 0), (4 / 3, 2), (3, 7 / 3), (5, 1))
+        params = calcCubicParameters(*cubic)
+        for t0, t1 in ((0, 1), (0.2, 0.7), (0.5, 1)):
+            assert getArcLengthForQuadratic(*quadratic, t0, t1) == pytest.approx(
+                getArcLengthForCubicParameters(params, t0, t1, tolerance=1e-9)
+            )
+
+    def test_getArcLengthForQuadratic_degenerate(self):
+        # A line
+        assert getArcLengthForQuadratic((0, 0), (1.5, 2), (3, 4)) == pytest.approx(5)
+        # A line that turns back at x = 25 / 9
+        assert getArcLengthForQuadratic((0, 0), (5, 0), (1, 0)) == pytest.approx(
+            2 * 25 / 9 - 1
+        )
+        assert getArcLengthForQuadratic((1, 1), (1, 1), (1, 1)) == 0
+
+    def test_getBoundsForQuadratic(self):
+        assert getBoundsForQuadratic((0, 0), (2, 2), (4, 0)) == (0, 0, 4, 1.0)
+        assert getBoundsForQuadratic((0, 0), (1, 1), (2, 2)) == (0, 0, 2, 2)
+
+    def test_getFlattenedPointsForCubic(self):
+        curve = ((1000, 0), (1000, 552.2847498), (552.2847498, 1000), (0, 1000))
+        ts, points = getFlattenedPointsForCubic(*curve, tolerance=0.1)
+        assert ts[0] == 0.0
+        assert ts[-1] == 1.0
+        assert points[0] == curve[0]
+        assert points[-1] == curve[3]
+        assert ts == sorted(ts)
+        for (x0, y0), (x1, y1) in zip(points, getPointListForCubic(ts, *curve)):
+            assert hypot(x1 - x0, y1 - y0) < 1e-9
+        # The midpoints of the polyline edges are close to the curve
+        for i in range(len(ts) - 1):
+            t0, t1 = ts[i], ts[i + 1]
+            (x0, y0), (x1, y1) = points[i], points[i + 1]
+            ((x, y),) = getPointListForCubic([(t0 + t1) / 2], *curve)
+            assert hypot(x - (x0 + x1) / 2, y - (y0 + y1) / 2) <= 0.1
+        # A finer tolerance gives more points
+        assert len(getFlattenedPointsForCubic(*curve, tolerance=0.01)[0]) > len(ts)
+
+    def test_getFlattenedPointsForCubic_line(self):
+        ts, points = getFlattenedPointsForCubic((0, 0), (1, 0), (2, 0), (3, 0))
+        assert ts == [0.0, 1.0]
+        assert points == [(0, 0), (3, 0)]
+
+    def test_splitCubicAtTs(self):
+        curve = ((0, 0), (1, 1), (3, 1), (4, 0))
+        pieces = splitCubicAtTs(*curve, [0.0, 0.25, 0.5, 1.0])
+        assert len(pieces) == 3
+        assert pieces[0][0] == (0, 0)
+        assert pieces[-1][3] == (4, 0)
+        assert pieces[1] == (
+            (0.90625, 0.5625),
+            (1.25, 0.6875),
+            (1.625, 0.75),
+            (2.0, 0.75),
+        )
+        # The pieces are connected and follow the curve
+        for (a, b, c, d), (t0, t1) in zip(pieces, ((0, 0.25), (0.25, 0.5), (0.5, 1))):
+            for u in (0.25, 0.5, 0.75):
+                ((x, y),) = getPointListForCubic([u], a, b, c, d)
+                ((ex, ey),) = getPointListForCubic([t0 + u * (t1 - t0)], *curve)
+                assert hypot(ex - x, ey - y) < 1e-12
+        for first, second in zip(pieces, pieces[1:]):
+            assert first[3] == second[0]
+
+    def test_splitCubicAtTs_no_split(self):
+        curve = ((0, 0), (1, 1), (3, 1), (4, 0))
+        assert splitCubicAtTs(*curve, []) == [curve]
+        assert splitCubicAtTs(*curve, [0, 1]) == [curve]
+
+    def test_splitCubicAtTs_unsorted(self):
+        with pytest.raises(ValueError):
+            splitCubicAtTs((0, 0), (1, 1), (3, 1), (4, 0), [0.5, 0.25])
+
+    def test_getMomentsForCubicParameters(self):
+        # A circle with radius 1 around (3, 2), approximated by 4 cubics
+        k = 0.5522847498
+        circle = [
+            ((4, 2), (4, 2 + k), (3 + k, 3), (3, 3)),
+            ((3, 3), (3 - k, 3), (2, 2 + k), (2, 2)),
+            ((2, 2), (2, 2 - k), (3 - k, 1), (3, 1)),
+            ((3, 1), (3 + k, 1), (4, 2 - k), (4, 2)),
+        ]
+        area = moment_x = moment_y = 0.0
+        for curve in circle:
+            params = calcCubicParameters(*curve)
+            a, mx, my = getMomentsForCubicParameters(params)
+            assert a == pytest.approx(getAreaForCubicParameters(params))
+            area += a
+            moment_x += mx
+            moment_y += my
+        assert area == pytest.approx(pi, rel=1e-3)
+        assert moment_x / area == pytest.approx(3)
+        assert moment_y / area == pytest.approx(2)
+
+    def test_getMomentsForCubicParameters_polygon(self):
+        # The same as the shoelace formula for the flattened curve, closed by a line
+        # along the x axis
+        curve = ((0, 0), (1, 1), (3, 1), (4, 0))
+        points = getPointListForCubic([i / 1000 for i in range(1001)], *curve)
+        area = 0.5 * sum(
+            x0 * y1 - x1 * y0 for (x0, y0), (x1, y1) in zip(points, points[1:])
+        )
+        moments = getMomentsForCubicParameters(calcCubicParameters(*curve))
+        assert moments[0] == pytest.approx(area, rel=1e-5)
+        assert moments[0] < 0
+        reversed_moments = getMomentsForCubicParameters(
+            calcCubicParameters(*curve[::-1])
+        )
+        assert reversed_moments == pytest.approx([-m for m in moments])
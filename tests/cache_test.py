@@ -0,0 +1,293 @@
+import os
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from fontgeometry.cache import (
+    AnalysisCache,
+    CacheInfo,
+    MappedStore,
+    PointCache,
+    get_analysis_cache,
+    set_analysis_cache,
+)
+from fontgeometry.cubicarray import CubicArray
+from fontgeometry.cubics import LENGTH_TABLE_STEPS, Cubic, SuperCubic
+
+
+class PointCacheTests(unittest.TestCase):
+    def test_get_put(self) -> None:
+        cache = PointCache()
+        assert cache.get((1, 2)) is None
+        cache.put((1, 2), "a")
+        assert cache.get((1, 2)) == "a"
+        assert (1, 2) in cache
+        assert cache.info() == CacheInfo(hits=1, misses=1, maxsize=4096, currsize=1)
+
+    def test_quantized(self) -> None:
+        cache = PointCache(grid=0.5)
+        cache.put((1.1, 2.1), "a")
+        assert cache.get((1.4, 2.0)) == "a"
+        assert cache.get((1.6, 2.0)) is None
+
+    def test_exact(self) -> None:
+        cache = PointCache(grid=None)
+        cache.put((1.1, 2.1), "a")
+        assert cache.get((1.1, 2.1)) == "a"
+        assert cache.get((1.1000001, 2.1)) is None
+
+    def test_lru(self) -> None:
+        cache = PointCache(maxsize=2, grid=None)
+        cache.put((0, 0), 0)
+        cache.put((1, 1), 1)
+        # Mark (0, 0) as recently used
+        cache.get((0, 0))
+        cache.put((2, 2), 2)
+        assert len(cache) == 2
+        assert (0, 0) in cache
+        assert (1, 1) not in cache
+        assert (2, 2) in cache
+
+    def test_clear(self) -> None:
+        cache = PointCache()
+        cache.put((0, 0), 0)
+        cache.get((0, 0))
+        cache.clear()
+        assert cache.info() == CacheInfo(0, 0, 4096, 0)
+
+    def test_threads(self) -> None:
+        cache = PointCache(maxsize=64, grid=None)
+
+        def use(i: int) -> None:
+            for j in range(200):
+                cache.put((i, j), j)
+                cache.get((i, j - 1))
+
+        with ThreadPoolExecutor(4) as executor:
+            list(executor.map(use, range(8)))
+        info = cache.info()
+        assert info.hits + info.misses == 1600
+        assert info.currsize == 64
+
+    def test_invalid(self) -> None:
+        with pytest.raises(ValueError):
+            PointCache(maxsize=0)
+        with pytest.raises(ValueError):
+            PointCache(grid=0)
+
+
+class SuperCubicCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.sc = SuperCubic()
+        self.sc.add_cubic_from_points((0, 0), (1, 1), (3, 1), (4, 0))
+        self.sc.add_cubic_from_points((4, 0), (5, 1), (7, 0), (8, 0))
+
+    def test_t_for_point_cached(self) -> None:
+        sc = self.sc
+        result = sc.t_for_point((6, 0.5))
+        assert result is not None
+        assert sc.t_cache.info().misses == 1
+        cursor = (sc._split_index, sc._t_step)
+
+        sc.reset_split()
+        assert sc.t_for_point((6, 0.5)) == result
+        assert sc.t_cache.info().hits == 1
+        # The search position was moved as without the cache
+        assert (sc._split_index, sc._t_step) == cursor
+
+    def test_t_for_point_cached_behind_cursor(self) -> None:
+        sc = self.sc
+        first = sc.t_for_point((2, 0.75))
+        second = sc.t_for_point((6, 0.5))
+        assert first is not None and second is not None
+        assert first < second
+        # The first point lies before the current position, it is searched again
+        # instead of moving the position back
+        sc.t_for_point((2, 0.75))
+        assert sc._split_index == 1
+
+    def test_t_for_point_cached_exact(self) -> None:
+        sc = self.sc
+        sc.t_for_point((2, 0.75))
+        sc.reset_split()
+        sc.t_for_point((2.004, 0.75))
+        # Nearby points don't share an entry by default
+        assert sc.t_cache.info().hits == 0
+        assert len(sc.t_cache) == 2
+
+    def test_t_for_point_cached_later_search(self) -> None:
+        sc = self.sc
+        # The point lies on both cubics, the search from the second finds the second
+        sc.t_for_point((6, 0.5))
+        later = sc.t_for_point((4, 0))
+        assert later is not None and later[0] == 1
+        # The cached result was found from a later position, it is searched again
+        sc.reset_split()
+        assert sc.t_for_point((4, 0)) == (0, 1.0)
+
+    def test_add_cubic_clears_cache(self) -> None:
+        sc = self.sc
+        sc.t_for_point((6, 0.5))
+        assert len(sc.t_cache) == 1
+        sc.add_cubic_from_points((8, 0), (9, 1), (11, 0), (12, 0))
+        assert len(sc.t_cache) == 0
+
+
+class AnalysisCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.cache = AnalysisCache()
+        self.previous = set_analysis_cache(self.cache)
+
+    def tearDown(self) -> None:
+        set_analysis_cache(self.previous)
+
+    def test_enabled(self) -> None:
+        assert get_analysis_cache() is self.cache
+
+    def test_shared_results(self) -> None:
+        c1 = Cubic((0, 0), (1, 1), (3, 1), (4, 0))
+        c2 = Cubic((0, 0), (1, 1), (3, 1), (4, 0))
+        assert c1.extrema == [0.5]
+        assert self.cache.misses == 1
+        assert c2.extrema == [0.5]
+        assert self.cache.hits == 1
+        # The lists are not shared
+        assert c1.extrema is not c2.extrema
+
+    def test_same_results(self) -> None:
+        points = ((0, 0), (1, 1), (3, 0), (4, 2))
+        cached = Cubic(*points)
+        set_analysis_cache(None)
+        uncached = Cubic(*points)
+        for name in (
+            "bounds",
+            "extrema",
+            "inflections",
+            "length",
+            "length_table",
+            "params",
+        ):
+            assert getattr(cached, name) == getattr(uncached, name)
+
+    def test_length_tolerance(self) -> None:
+        points = ((0, 0), (1, 1), (3, 0), (4, 2))
+        default = Cubic(*points).length
+        Cubic(*points, length_tolerance=1e-9).length
+        # The lengths and length tables for both tolerances are cached separately
+        assert len(self.cache) == 4
+        assert Cubic(*points).length == default
+        assert self.cache.hits == 1
+
+    def test_normalize(self) -> None:
+        cache = AnalysisCache(normalize=True)
+        set_analysis_cache(cache)
+        c1 = Cubic((0, 0), (1, 1), (3, 1), (4, 0))
+        c2 = Cubic((10, 10), (11, 11), (13, 11), (14, 10))
+        assert c1.extrema == c2.extrema
+        assert c1.length == c2.length
+        assert cache.hits == 2
+        # Bounds depend on the position
+        assert c1.bounds != c2.bounds
+
+    def test_eviction(self) -> None:
+        cache = AnalysisCache(maxsize=2)
+        set_analysis_cache(cache)
+        for x in range(3):
+            Cubic((x, 0), (1, 1), (3, 1), (4, 0)).extrema
+        assert len(cache) == 2
+        Cubic((0, 0), (1, 1), (3, 1), (4, 0)).extrema
+        assert cache.hits == 0
+
+    def test_eviction_values(self) -> None:
+        cache = AnalysisCache(maxvalues=2 * (LENGTH_TABLE_STEPS + 1))
+        set_analysis_cache(cache)
+        for x in range(3):
+            Cubic((x, 0), (1, 1), (3, 1), (4, 0)).length_table
+        assert len(cache) == 2
+        cache.clear()
+        for x in range(3):
+            Cubic((x, 0), (1, 1), (3, 1), (4, 0)).length
+        assert len(cache) == 3
+
+    def test_cheap_kinds_not_cached(self) -> None:
+        c = Cubic((0, 0), (1, 1), (3, 1), (4, 0))
+        c.params
+        c.bounds
+        c.moments
+        assert len(self.cache) == 0
+        assert self.cache.misses == 0
+
+    def test_threads(self) -> None:
+        def extrema(x: int) -> list[float]:
+            return Cubic((x % 4, 0), (1, 1), (3, 1), (4, 0)).extrema
+
+        with ThreadPoolExecutor(4) as executor:
+            results = list(executor.map(extrema, range(200)))
+        assert results[4:] == results[:-4]
+        assert self.cache.hits + self.cache.misses == 200
+        assert len(self.cache) == 4
+
+    def test_cubic_array(self) -> None:
+        Cubic((0, 0), (1, 1), (3, 1), (4, 0)).extrema
+        ca = CubicArray([((0, 0), (1, 1), (3, 1), (4, 0))])
+        assert ca[0].extrema == [0.5]
+        assert self.cache.hits == 1
+
+
+class MappedStoreTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "analysis.store")
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def test_get_put(self) -> None:
+        with MappedStore(self.path, capacity=16) as store:
+            digest = bytes(range(1, 17))
+            assert store.get(digest) is None
+            store.put(digest, (1.0, 2.0))
+            assert store.get(digest) == (1.0, 2.0)
+            store.put(digest, ())
+            assert store.get(digest) == ()
+            with pytest.raises(ValueError):
+                store.put(digest, (0.0,) * 6)
+
+    def test_full(self) -> None:
+        with MappedStore(self.path, capacity=2) as store:
+            digests = [bytes([i]) * 16 for i in range(1, 5)]
+            for i, digest in enumerate(digests):
+                store.put(digest, (float(i),))
+            # Old entries were replaced
+            assert store.get(digests[-1]) == (3.0,)
+            assert sum(store.get(d) is not None for d in digests) == 2
+
+    def test_persistent(self) -> None:
+        points = ((0, 0), (1, 1), (3, 0), (4, 2))
+        with MappedStore(self.path) as store:
+            previous = set_analysis_cache(AnalysisCache(store=store))
+            try:
+                expected = Cubic(*points).extrema
+                length = Cubic(*points).length
+            finally:
+                set_analysis_cache(previous)
+
+        # A new run
+        with MappedStore(self.path, capacity=1) as store:
+            assert store.capacity == 65536
+            cache = AnalysisCache(store=store)
+            previous = set_analysis_cache(cache)
+            try:
+                assert Cubic(*points).extrema == expected
+                assert Cubic(*points).length == length
+            finally:
+                set_analysis_cache(previous)
+            assert cache.store_hits == 2
+
+    def test_invalid_file(self) -> None:
+        with open(self.path, "wb") as f:
+            f.write(b"Not a store")
+        with pytest.raises(ValueError):
+            MappedStore(self.path)
@@ -0,0 +1,127 @@
+import unittest
+
+import pytest
+
+from fontgeometry.cubicarray import CubicArray, CubicView
+from fontgeometry.cubics import Cubic, SuperCubic
+
+curves = [
+    ((0, 0), (1, 1), (3, 1), (4, 0)),
+    ((4, 0), (5, 1), (7, 0), (8, 0)),
+    ((0, 0), (1, 1), (3, 0), (4, 0)),
+]
+
+
+class CubicArrayTests(unittest.TestCase):
+    def test_instantiation(self) -> None:
+        ca = CubicArray(curves)
+        assert len(ca) == 3
+        assert len(ca.coords) == 24
+
+    def test_append(self) -> None:
+        ca = CubicArray()
+        ca.append((0, 0), (1, 1), (3, 1), (4, 0))
+        assert len(ca) == 1
+        assert ca[0].pt3 == (3, 1)
+
+    def test_getitem(self) -> None:
+        ca = CubicArray(curves)
+        assert isinstance(ca[0], CubicView)
+        assert ca[-1].pt1 == (0, 0)
+        assert ca[1].pt4 == (8, 0)
+        with pytest.raises(IndexError):
+            ca[3]
+
+    def test_view_slots(self) -> None:
+        view = CubicArray(curves)[0]
+        assert not hasattr(view, "__dict__")
+
+    def test_view_api(self) -> None:
+        ca = CubicArray(curves, raster_length=1)
+        for view, curve in zip(ca, curves):
+            c = Cubic(*curve, raster_length=1)
+            assert (view.pt1, view.pt2, view.pt3, view.pt4) == curve
+            assert view.params == c.params
+            assert view.moments == c.moments
+            assert view.extrema == c.extrema
+            assert view.extremum_points == c.extremum_points
+            assert view.inflections == c.inflections
+            assert view.inflection_points == c.inflection_points
+            assert view.length == c.length
+            assert view.length_table == c.length_table
+            assert view.raster_steps == c.raster_steps
+            assert view.cubic_points == c.cubic_points
+            assert view.num_cubic_points == c.num_cubic_points
+            assert view.t_at_length(1.0) == c.t_at_length(1.0)
+            assert view.project_point((2, 2)) == c.project_point((2, 2))
+            assert view.split_at_t(0.5) == c.split_at_t(0.5)
+            assert view.split_at_t(1.0) == c.split_at_t(1.0)
+
+    def test_cached_values(self) -> None:
+        ca = CubicArray(curves)
+        assert ca._flags[1] == 0
+        ca[1].params
+        ca[1].length
+        assert ca._flags[1] == 3
+        assert ca[1].params == Cubic(*curves[1]).params
+        assert ca[1].bounds == Cubic(*curves[1]).bounds
+        assert ca._flags[1] == 7
+
+    def test_from_cubics(self) -> None:
+        sc = SuperCubic()
+        for curve in curves[:2]:
+            sc.add_cubic_from_points(*curve)
+        ca = CubicArray.from_cubics(sc.cubics, length_tolerance=0.01)
+        assert len(ca) == 2
+        assert ca.length_tolerance == 0.01
+        assert ca[1].pt2 == (5, 1)
+
+    def test_super_cubic_with_views(self) -> None:
+        sc = SuperCubic()
+        sc.cubics.extend(CubicArray(curves[:2]))
+        assert sc.t_for_point((4.5, 1)) == (0, 1.0)
+        assert sc.extremum_points == [
+            (2.0, 0.75),
+            (8, 0),
+            (5.2592592592592595, 0.4444444444444444),
+        ]
+
+    def test_to_numpy(self) -> None:
+        pytest.importorskip("numpy")
+        arr = CubicArray(curves).to_numpy()
+        assert arr.shape == (3, 4, 2)
+        assert arr[1, 2].tolist() == [7, 0]
+        # The array is a copy, so cubics can still be appended
+        ca = CubicArray(curves)
+        arr = ca.to_numpy()
+        ca.append(*curves[0])
+        assert len(ca) == 4
+        assert arr.shape == (3, 4, 2)
+
+    def test_split_state(self) -> None:
+        # The split position is kept in the array, as for a Cubic
+        ca = CubicArray(curves)
+        c = Cubic(*curves[1])
+        assert ca[1].split_at_t(0.5) == c.split_at_t(0.5)
+        assert ca[1].split_at_t(1.0) == c.split_at_t(1.0)
+        assert ca[0]._t == 0
+        ca[1].reset_split()
+        assert ca[1]._t == 0
+
+    def test_polyline_storage(self) -> None:
+        ca = CubicArray(curves, raster_length=0.5)
+        view = ca[2]
+        c = Cubic(*curves[2], raster_length=0.5)
+        assert view.polyline == c.polyline
+        assert view.num_cubic_points == c.num_cubic_points
+        # The polylines are stored in the flat arrays only
+        assert len(ca._polyline_ts) == len(c.cubic_ts)
+        assert list(ca._polyline_spans) == [-1, 0, -1, 0, 0, len(c.cubic_ts)]
+        assert ca[0].cubic_points == Cubic(*curves[0], raster_length=0.5).cubic_points
+        for pt in ((0, 0), (2, 1), (3.5, 0.25), (5, -1)):
+            for start in (0, 3):
+                assert view.find_step(pt, start) == c.find_step(pt, start)
+        for step in (0, 1, c.num_cubic_points):
+            assert view.step_t(step) == c.step_t(step)
+        for t in (0.0, 0.3, view.cubic_ts[4], 1.0):
+            assert view.t_step(t) == c.t_step(t)
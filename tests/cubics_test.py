@@ -1,6 +1,19 @@
 import unittest
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
+from random import Random
 
-from fontgeometry.cubics import Cubic, SuperCubic
+import pytest
+
+from fontgeometry.cubics import (
+    LENGTH_TOLERANCE,
+    BaseCubic,
+    Cubic,
+    Line,
+    Quadratic,
+    SplitCursor,
+    SuperCubic,
+)
 
 
 class CubicTests(unittest.TestCase):
@@ -16,6 +29,18 @@ class CubicTests(unittest.TestCase):
         c = Cubic((0, 0), (1, 1), (3, 1), (4, 0))
         assert c.extrema == [0.5]
 
+    def test_bounds(self):
+        c = Cubic((0, 0), (1, 1), (3, 1), (4, 0))
+        assert c.bounds == (0, 0, 4, 0.75)
+        # Extrema in both directions
+        c = Cubic((0, 0), (-1, 2), (5, 2), (4, 0))
+        assert c.bounds == (
+            pytest.approx(-0.11288563682129144),
+            0,
+            pytest.approx(4.112885636821291),
+            1.5,
+        )
+
     def test_extremum_points(self):
         c = Cubic((0, 0), (1, 1), (3, 1), (4, 0))
         assert c.extremum_points == [(2.0, 0.75)]
@@ -42,7 +67,55 @@ class CubicTests(unittest.TestCase):
 
     def test_length(self):
         c = Cubic((0, 0), (1, 1), (3, 1), (4, 0))
-        assert c.length == 4.376310298502258
+        assert c.length == pytest.approx(4.38086023, abs=LENGTH_TOLERANCE)
+        assert c.length == c.length_table[-1]
+
+    def test_length_consistent(self):
+        c = Cubic((0, 0), (1000, 1000), (0, 1000), (1000, 0))
+        assert c.length_at_t(1.0) == c.length
+        assert c.t_at_length(c.length) == 1.0
+        assert c.t_at_length(c.length / 2) == pytest.approx(0.5, abs=1e-6)
+        sc = SuperCubic()
+        sc.add_cubic_from_points((0, 0), (1000, 1000), (0, 1000), (1000, 0))
+        sc.add_quadratic_from_points((1000, 0), (1500, 500), (2000, 0))
+        sc.add_line_from_points((2000, 0), (0, 0))
+        assert sc.length == sum(c.length for c in sc.cubics)
+        for cubic in sc.cubics:
+            assert cubic.t_at_length(cubic.length) == 1.0
+
+    def test_length_tolerance(self):
+        c = Cubic((0, 0), (1, 1), (3, 1), (4, 0), length_tolerance=1e-9)
+        assert abs(c.length - 4.38086023) < 1e-8
+
+    def test_length_table(self):
+        c = Cubic((0, 0), (1, 1), (3, 1), (4, 0))
+        assert len(c.length_table) == 17
+        assert c.length_table[0] == 0.0
+        assert c.length_table[-1] == pytest.approx(4.38086023, abs=0.001)
+        # Symmetric curve
+        assert c.length_table[8] == pytest.approx(c.length_table[-1] / 2, abs=0.001)
+
+    def test_length_at_t(self):
+        c = Cubic((0, 0), (1, 1), (3, 1), (4, 0))
+        assert c.length_at_t(0) == 0.0
+        assert c.length_at_t(1) == c.length_table[-1]
+        assert c.length_at_t(0.5) == pytest.approx(2.19043011, abs=0.001)
+
+    def test_t_at_length(self):
+        c = Cubic((0, 0), (1, 1), (3, 1), (4, 0))
+        assert c.t_at_length(-1) == 0.0
+        assert c.t_at_length(100) == 1.0
+        assert c.t_at_length(c.length_table[-1] / 2) == pytest.approx(0.5, abs=1e-4)
+        for t in (0.01, 0.1, 0.33, 0.7, 0.99):
+            assert c.length_at_t(c.t_at_length(c.length_at_t(t))) == pytest.approx(
+                c.length_at_t(t), abs=0.001
+            )
+
+    def test_t_at_length_line(self):
+        c = Cubic((0, 0), (0, 0), (10, 0), (10, 0))
+        for length in (0.5, 2.5, 5, 9.9):
+            t = c.t_at_length(length)
+            assert c.get_cubic_point(t)[0] == pytest.approx(length, abs=0.001)
 
     def test_params(self):
         c = Cubic((0, 0), (1, 1), (3, 1), (4, 0))
@@ -66,8 +139,121 @@ class CubicTests(unittest.TestCase):
     def test_cubic_points_2(self):
         c = Cubic((0, 0), (1, 1), (3, 1), (4, 0), raster_length=2)
         assert c.cubic_points == [(0, 0), (2.0, 0.75), (4, 0)]
+        assert c.cubic_ts == [0.0, 0.5, 1.0]
         assert c.num_cubic_points == 2
 
+    def test_split_at_ts(self):
+        c = Cubic((0, 0), (1, 1), (3, 1), (4, 0))
+        c.split_at_t(0.25)
+        assert c.split_at_ts([0.5]) == [
+            ((0, 0), (0.5, 0.5), (1.25, 0.75), (2.0, 0.75)),
+            ((2.0, 0.75), (2.75, 0.75), (3.5, 0.5), (4, 0)),
+        ]
+        # The split position of split_at_t is not changed
+        assert c.split_at_t(0.5)[0] == (0.90625, 0.5625)
+
+    def test_cubic_points_adaptive(self):
+        c = Cubic((0, 0), (1, 1), (3, 1), (4, 0), flatten_tolerance=0.01)
+        assert c.cubic_ts[0] == 0.0
+        assert c.cubic_ts[-1] == 1.0
+        assert c.cubic_points == [c.get_cubic_point(t) for t in c.cubic_ts]
+        assert c.num_cubic_points == len(c.cubic_ts) - 1
+        assert c.num_cubic_points < c.raster_steps
+
+
+class LineTests(unittest.TestCase):
+    def test_instantiation(self):
+        c = Line((0, 0), (3, 0))
+        assert isinstance(c, Cubic)
+        assert c.points == ((0, 0), (3, 0))
+        assert (c.pt1, c.pt2, c.pt3, c.pt4) == ((0, 0), (1, 0), (2, 0), (3, 0))
+
+    def test_analysis(self):
+        c = Line((0, 0), (3, 4))
+        assert c.bounds == (0, 0, 3, 4)
+        assert c.extrema == []
+        assert c.inflections == []
+        assert c.length == 5
+        assert c.length_at_t(0.5) == 2.5
+        assert c.t_at_length(1) == 0.2
+        assert c.get_cubic_point(0.5) == (1.5, 2)
+
+    def test_cubic_points(self):
+        c = Line((0, 0), (3, 4), raster_length=1)
+        assert c.num_cubic_points == 5
+        assert c.cubic_ts == [0, 0.2, 0.4, 0.6, 0.8, 1]
+        assert c.cubic_points[-1] == (3, 4)
+        assert Line((0, 0), (3, 4), flatten_tolerance=0.1).cubic_ts == [0, 1]
+
+    def test_find_step(self):
+        # The same steps as walking the points
+        rnd = Random(0)
+        c = Line((10, 20), (50, -10), raster_length=1)
+        for _ in range(200):
+            pt = (rnd.uniform(0, 60), rnd.uniform(-20, 30))
+            start = rnd.randrange(c.num_cubic_points + 1)
+            assert c.find_step(pt, start) == BaseCubic.find_step(c, pt, start)
+        assert Line((1, 1), (1, 1)).find_step((0, 0)) is None
+
+    def test_t_step(self):
+        c = Line((0, 0), (3, 4), raster_length=0.3)
+        for t in (0.0, 0.1, 1 / 17, c.cubic_ts[5], 0.99, 1.0):
+            assert c.t_step(t) == bisect_left(c.cubic_ts, t)
+
+    def test_moments(self):
+        c = Line((1, 2), (4, -3))
+        cubic = Cubic(c.pt1, c.pt2, c.pt3, c.pt4)
+        assert c.moments == pytest.approx(cubic.moments)
+
+    def test_project_point(self):
+        c = Line((0, 0), (4, 0))
+        assert c.project_point((1, 1)) == (0.25, 1)
+        assert c.project_point((-3, 4)) == (0, 5)
+
+    def test_split_at_t(self):
+        c = Line((0, 0), (3, 6))
+        cubic = Cubic(c.pt1, c.pt2, c.pt3, c.pt4)
+        for t in (1 / 3, 0.5, 1):
+            for pt, expected in zip(c.split_at_t(t), cubic.split_at_t(t)):
+                assert pt == pytest.approx(expected)
+
+
+class QuadraticTests(unittest.TestCase):
+    def test_instantiation(self):
+        c = Quadratic((0, 0), (3, 3), (6, 0))
+        assert isinstance(c, Cubic)
+        assert c.points == ((0, 0), (3, 3), (6, 0))
+        assert (c.pt1, c.pt2, c.pt3, c.pt4) == ((0, 0), (2, 2), (4, 2), (6, 0))
+
+    def test_analysis(self):
+        c = Quadratic((0, 0), (2, 2), (4, 0))
+        cubic = Cubic(c.pt1, c.pt2, c.pt3, c.pt4, length_tolerance=1e-9)
+        assert c.bounds == (0, 0, 4, 1)
+        assert c.extrema == [0.5]
+        assert c.extremum_points == [(2, 1)]
+        assert c.inflections == []
+        assert c.length == pytest.approx(cubic.length)
+        assert c.length_at_t(0.3) == pytest.approx(cubic.length_at_t(0.3))
+        assert c.t_at_length(1) == pytest.approx(cubic.t_at_length(1))
+
+    def test_extrema_end_points(self):
+        # As for the equivalent cubics
+        assert Quadratic((0, 0), (4, 0), (4, 4)).extrema == [0]
+        assert Quadratic((0, 0), (0, 4), (4, 4)).extrema == [1]
+        assert Quadratic((0, 0), (2, 0), (4, 0)).extrema == []
+
+    def test_moments(self):
+        c = Quadratic((0, 0), (2, 2), (4, 0))
+        # The area between the parabola and the x axis is 2/3 * 4 * 1, clockwise
+        assert c.moments[0] == pytest.approx(-8 / 3)
+
+    def test_cubic_points(self):
+        c = Quadratic((0, 0), (2, 2), (4, 0), raster_length=1)
+        cubic = Cubic(c.pt1, c.pt2, c.pt3, c.pt4, raster_length=1)
+        assert c.cubic_ts == cubic.cubic_ts
+        for pt, expected in zip(c.cubic_points, cubic.cubic_points):
+            assert pt == pytest.approx(expected)
+
 
 class SuperCubicTests(unittest.TestCase):
     def test_instantiation(self):
@@ -83,6 +269,29 @@ class SuperCubicTests(unittest.TestCase):
         assert c.pt3 == (2, 0)
         assert c.pt4 == (3, 0)
 
+    def test_add_segments(self):
+        sc = SuperCubic()
+        sc.add_cubic_from_point_tuple([(0, 0), (3, 0)])
+        sc.add_cubic_from_point_tuple([(3, 0), (4, 1), (5, 0)])
+        sc.add_cubic_from_point_tuple([(5, 0), (6, 1), (8, 1), (9, 0)])
+        assert [type(c) for c in sc.cubics] == [Line, Quadratic, Cubic]
+        with pytest.raises(ValueError):
+            sc.add_cubic_from_point_tuple([(9, 0)])
+
+    def test_mixed_segments(self):
+        sc = SuperCubic()
+        sc.add_line_from_points((0, 0), (4, 0))
+        sc.add_quadratic_from_points((4, 0), (6, 4), (8, 0))
+        assert sc.bounds == (0, 0, 8, 2)
+        assert sc.extremum_points == [(6, 2)]
+        assert sc.length == pytest.approx(4 + sc.cubics[1].length)
+        index, t = sc.t_for_point((2, 0.5))
+        assert index == 0
+        assert t == pytest.approx(0.5, abs=0.1)
+        segment = sc.split_at_pt((6, 2))
+        assert segment[0] == (4, 0)
+        assert segment[3] == pytest.approx((6, 2), abs=0.25)
+
     def test_extremum_points(self):
         sc = SuperCubic()
         sc.add_cubic_from_points((0, 0), (1, 1), (3, 1), (4, 0))
@@ -93,6 +302,14 @@ class SuperCubicTests(unittest.TestCase):
             (5.2592592592592595, 0.4444444444444444),
         ]
 
+    def test_bounds(self):
+        sc = SuperCubic()
+        assert sc.bounds is None
+        sc = SuperCubic()
+        sc.add_cubic_from_points((0, 0), (1, 1), (3, 1), (4, 0))
+        sc.add_cubic_from_points((4, 0), (5, -1), (7, 0), (8, 0))
+        assert sc.bounds == (0, pytest.approx(-0.4444444444444444), 8, 0.75)
+
     def test_inflection_points(self):
         sc = SuperCubic()
         sc.add_cubic_from_points((0, 0), (1, 1), (3, 1), (4, 0))
@@ -101,12 +318,52 @@ class SuperCubicTests(unittest.TestCase):
             (6.872166581031861, 0.19175012845220896),
         ]
 
+    def test_length(self):
+        sc = SuperCubic()
+        sc.add_cubic_from_points((0, 0), (1, 1), (3, 1), (4, 0))
+        sc.add_cubic_from_points((4, 0), (5, 1), (7, 0), (8, 0))
+        assert sc.length_offsets[0] == 0.0
+        assert sc.length_offsets[1] == sc.cubics[0].length_table[-1]
+        assert sc.length == pytest.approx(
+            sc.cubics[0].length_table[-1] + sc.cubics[1].length_table[-1]
+        )
+
+    def test_t_at_length(self):
+        sc = SuperCubic()
+        sc.add_cubic_from_points((0, 0), (1, 1), (3, 1), (4, 0))
+        sc.add_cubic_from_points((4, 0), (5, 1), (7, 0), (8, 0))
+        assert sc.t_at_length(0) == (0, 0.0)
+        assert sc.t_at_length(sc.length) == (1, 1.0)
+        index, t = sc.t_at_length(sc.length_offsets[1] + 0.5)
+        assert index == 1
+        assert sc.length_at_t(index, t) == pytest.approx(
+            sc.length_offsets[1] + 0.5, abs=0.001
+        )
+        index, t = sc.t_at_length(1.0)
+        assert index == 0
+        assert sc.length_at_t(index, t) == pytest.approx(1.0, abs=0.001)
+
     def test_f_for_point(self):
         sc = SuperCubic()
         sc.add_cubic_from_points((0, 0), (1, 1), (3, 1), (4, 0))
         sc.add_cubic_from_points((4, 0), (5, 1), (7, 0), (8, 0))
         assert sc.t_for_point((4.5, 1)) == (0, 1.0)
 
+    def test_t_for_point_adaptive(self):
+        sc = SuperCubic()
+        sc.add_cubic_from_points(
+            (0, 0), (1, 1), (3, 1), (4, 0), flatten_tolerance=0.001
+        )
+        sc.add_cubic_from_points(
+            (4, 0), (5, 1), (7, 0), (8, 0), flatten_tolerance=0.001
+        )
+        index, t = sc.t_for_point((2.0, 0.75))
+        assert index == 0
+        # The t value of the first vertex after the closest one
+        ts = sc.cubics[0].cubic_ts
+        assert t in ts
+        assert ts[ts.index(t) - 1] <= 0.5 < t
+
     def test_split_at_pt(self):
         sc = SuperCubic()
         sc.add_cubic_from_points((0, 0), (1, 1), (3, 1), (4, 0))
@@ -114,6 +371,213 @@ class SuperCubicTests(unittest.TestCase):
         assert sc.split_at_pt((4.5, 1)) == (((0, 0), (1, 1), (3, 1), (4, 0)))
         assert sc.split_at_pt((4, 0)) == (((4, 0), (4, 0), (4, 0), (4, 0)))
 
+    def test_project_point(self):
+        sc = SuperCubic()
+        sc.add_cubic_from_points((0, 0), (1, 1), (3, 1), (4, 0))
+        sc.add_cubic_from_points((4, 0), (5, 1), (7, 0), (8, 0))
+        index, t = sc.project_point((2.0, 5.0))
+        assert index == 0
+        assert t == pytest.approx(0.5)
+        index, t = sc.project_point((4.5, 1))
+        assert index == 1
+        assert 0 < t < 0.5
+
+    def test_bounds_after_add(self):
+        sc = SuperCubic()
+        sc.add_cubic_from_points((0, 0), (1, 1), (3, 1), (4, 0))
+        assert sc.bounds == (0, 0, 4, 0.75)
+        sc.add_cubic_from_points((4, 0), (5, 1), (7, 0), (8, 0))
+        assert sc.bounds[2] == 8
+
+    def test_area(self):
+        sc = SuperCubic()
+        assert sc.area == 0
+        assert sc.centroid is None
+        assert sc.direction == 0
+        sc.add_line_from_points((1, 0), (5, 0))
+        sc.add_line_from_points((5, 0), (5, 2))
+        sc.add_line_from_points((5, 2), (1, 2))
+        # The area of the open contour is measured against the origin
+        assert sc.area == 9
+        sc.add_line_from_points((1, 2), (1, 0))
+        assert sc.area == 8
+        assert sc.centroid == pytest.approx((3, 1))
+        assert sc.direction == 1
+
+    def test_area_mixed_segments(self):
+        # A clockwise half disk with radius 2, closed by a line
+        k = 0.5522847498 * 2
+        sc = SuperCubic()
+        sc.add_line_from_points((2, 0), (-2, 0))
+        sc.add_cubic_from_points((-2, 0), (-2, k), (-k, 2), (0, 2))
+        sc.add_cubic_from_points((0, 2), (k, 2), (2, k), (2, 0))
+        assert sc.direction == -1
+        assert sc.area == pytest.approx(-2 * 3.14159265, rel=1e-3)
+        x, y = sc.centroid
+        assert x == pytest.approx(0)
+        assert y == pytest.approx(8 / 3 / 3.14159265, rel=1e-3)
+
+    def test_t_for_point_from(self):
+        sc = SuperCubic()
+        sc.add_cubic_from_points((0, 0), (1, 1), (3, 1), (4, 0))
+        sc.add_cubic_from_points((4, 0), (5, 1), (7, 0), (8, 0))
+        index_t, cursor = sc.t_for_point_from((4.5, 1))
+        assert index_t == (0, 1.0)
+        assert cursor.index == 0
+        assert cursor.step == sc.cubics[0].num_cubic_points
+        # The state of the super cubic is not changed
+        assert sc._split_index == 0
+        assert sc._t_step == 0
+
+    def test_split_at_pt_from(self):
+        sc = SuperCubic()
+        sc.add_cubic_from_points((0, 0), (1, 1), (3, 1), (4, 0))
+        sc.add_cubic_from_points((4, 0), (5, 1), (7, 0), (8, 0))
+        points = [(1, 0.5), (2.0, 0.75), (5.2, 0.45), (6.5, 0.3)]
+
+        cursor = None
+        segments = []
+        for pt in points:
+            segment, cursor = sc.split_at_pt_from(pt, cursor)
+            segments.append(segment)
+        segments.append(sc.split_remainder_from(cursor))
+        assert isinstance(cursor, SplitCursor)
+        assert sc._split_index == 0
+        assert sc.cubics[0]._t == 0.0
+
+        expected = [sc.split_at_pt(pt) for pt in points]
+        expected.append(sc.split_remainder())
+        assert segments == expected
+
+    def test_split_at_pt_from_project(self):
+        sc = SuperCubic()
+        sc.add_cubic_from_points((0, 0), (1, 1), (3, 1), (4, 0))
+        sc.add_cubic_from_points((4, 0), (5, 1), (7, 0), (8, 0))
+        first, cursor = sc.split_at_pt_from((2.0, 0.75), project=True)
+        second, cursor = sc.split_at_pt_from((4, 0), cursor, project=True)
+        assert second[0] == pytest.approx((2.0, 0.75))
+        assert second[3] == pytest.approx((4, 0))
+        with pytest.raises(ValueError):
+            sc.split_at_pt_from((100, 100), cursor)
+
+    def test_split_at_pt_from_project_cursor(self):
+        sc = SuperCubic()
+        sc.add_cubic_from_points((0, 0), (20, 80), (80, 80), (100, 0))
+        first, cursor = sc.split_at_pt_from((80, 60), project=True)
+        t = cursor.split_t
+        # The raster search continues at the step of the projected t
+        assert cursor.step == sc.cubics[0].t_step(t)
+        second, cursor = sc.split_at_pt_from((90, 35), cursor)
+        assert second[0] == pytest.approx(first[3])
+        # A point before the previous split is rejected
+        _, cursor = sc.split_at_pt_from((80, 60), project=True)
+        with pytest.raises(ValueError):
+            sc.split_at_pt_from((20, 60), cursor, project=True)
+        # A point at the previous split gives an empty segment
+        segment, _ = sc.split_at_pt_from(first[3], cursor, project=True)
+        assert segment[0] == pytest.approx(segment[3])
+
+    def test_split_at_pt_from_threads(self):
+        sc = SuperCubic()
+        sc.add_cubic_from_points((0, 0), (1, 1), (3, 1), (4, 0))
+        sc.add_cubic_from_points((4, 0), (5, 1), (7, 0), (8, 0))
+        points = [(1, 0.5), (2.0, 0.75), (5.2, 0.45), (6.5, 0.3)]
+
+        def split(_):
+            cursor = None
+            segments = []
+            for pt in points:
+                segment, cursor = sc.split_at_pt_from(pt, cursor)
+                segments.append(segment)
+            return segments
+
+        with ThreadPoolExecutor(4) as executor:
+            results = list(executor.map(split, range(32)))
+        assert all(result == results[0] for result in results)
+
+    def test_split_at_pt_project(self):
+        sc = SuperCubic()
+        sc.add_cubic_from_points((0, 0), (1, 1), (3, 1), (4, 0))
+        sc.add_cubic_from_points((4, 0), (5, 1), (7, 0), (8, 0))
+        first = sc.split_at_pt((2.0, 0.75), project=True)
+        assert first[0] == (0, 0)
+        assert first[3] == pytest.approx((2.0, 0.75))
+        second = sc.split_at_pt((4, 0), project=True)
+        assert second[0] == pytest.approx((2.0, 0.75))
+        assert second[3] == pytest.approx((4, 0))
+
+    def test_split_at_pt_project_backward(self):
+        sc = SuperCubic()
+        sc.add_cubic_from_points((0, 0), (20, 80), (80, 80), (100, 0))
+        first = sc.split_at_pt((80, 60), project=True)
+        assert sc._t_step == sc.cubics[0].t_step(sc.cubics[0]._t)
+        with pytest.raises(ValueError):
+            sc.split_at_pt((20, 60), project=True)
+        # The split position is unchanged
+        second = sc.split_at_pt((90, 35), project=True)
+        assert second[0] == pytest.approx(first[3])
+
+    def test_split_at_pt_project_self_intersection(self):
+        sc = SuperCubic()
+        sc.add_cubic_from_points((0, 0), (300, 300), (-200, 300), (100, 0))
+        sc.add_cubic_from_points((100, 0), (200, -100), (300, 100), (400, 0))
+        # The loop crosses itself at t = 0.067 and t = 0.933
+        crossing = (50, sc.cubics[0].get_cubic_point(0.0669880938047216)[1])
+        points = [crossing, (50, 225), crossing]
+
+        cursor = None
+        for pt in points:
+            segment, cursor = sc.split_at_pt_from(pt, cursor, project=True)
+        assert segment[0] == pytest.approx((50, 225))
+        assert segment[3] == pytest.approx(crossing, abs=1e-3)
+        assert cursor.split_index == 0
+        assert cursor.split_t == pytest.approx(0.933, abs=1e-3)
+
+        for pt in points:
+            segment = sc.split_at_pt(pt, project=True)
+        assert segment[0] == pytest.approx((50, 225))
+        assert segment[3] == pytest.approx(crossing, abs=1e-3)
+        assert sc._split_index == 0
+        assert sc.cubics[0]._t == pytest.approx(0.933, abs=1e-3)
+        # The crossing is on the curve at the split position, not before it
+        segment = sc.split_at_pt(crossing, project=True)
+        assert segment[0] == pytest.approx(segment[3])
+
+    def test_split_at_points(self):
+        sc = SuperCubic()
+        sc.add_cubic_from_points((0, 0), (1, 1), (3, 1), (4, 0))
+        sc.add_cubic_from_points((4, 0), (5, 1), (7, 0), (8, 0))
+        pieces = sc.split_at_points([(2.0, 0.75), (2.0, 0.75)])
+        assert pieces == [
+            [((0, 0), (0.5, 0.5), (1.25, 0.75), (2.0, 0.75))],
+            [],
+            [
+                ((2.0, 0.75), (2.75, 0.75), (3.5, 0.5), (4, 0)),
+                ((4, 0), (5, 1), (7, 0), (8, 0)),
+            ],
+        ]
+        # Splitting at the joint
+        pieces = sc.split_at_points([(4, 0)])
+        assert pieces == [
+            [((0, 0), (1, 1), (3, 1), (4, 0))],
+            [((4, 0), (5, 1), (7, 0), (8, 0))],
+        ]
+        assert sc.split_at_points([]) == [
+            [((0, 0), (1, 1), (3, 1), (4, 0)), ((4, 0), (5, 1), (7, 0), (8, 0))]
+        ]
+
+    def test_split_at_points_self_intersection(self):
+        sc = SuperCubic()
+        sc.add_cubic_from_points((0, 0), (300, 300), (-200, 300), (100, 0))
+        sc.add_cubic_from_points((100, 0), (200, -100), (300, 100), (400, 0))
+        crossing = (50, sc.cubics[0].get_cubic_point(0.0669880938047216)[1])
+        pieces = sc.split_at_points([crossing, (50, 225), crossing])
+        # The second visit of the crossing is found after the top of the loop
+        assert len(pieces) == 4
+        assert all(pieces)
+        assert pieces[2][0][3] == pytest.approx(crossing, abs=1e-3)
+        assert len(pieces[3]) == 2
+
     def test_split_at_pt_fast(self):
         sc = SuperCubic()
         sc.add_cubic_from_points((0, 0), (1, 1), (3, 1), (4, 0))
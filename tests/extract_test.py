@@ -2,7 +2,8 @@ import unittest
 
 import pytest
 
-from fontgeometry.extract import CubicSegments
+from fontgeometry.cubics import Line, Quadratic
+from fontgeometry.extract import CubicSegments, PenCubicSegments, SuperCubicPen
 
 
 class CubicSegmentsTests(unittest.TestCase):
@@ -20,3 +21,187 @@ class CubicSegmentsTests(unittest.TestCase):
         cs = CubicSegments(layer=None)
         cs.to_supercubics()
         assert cs.super_cubics == []
+
+    def test_to_supercubics_continuation(self) -> None:
+        cs = CubicSegments(layer=None)
+        cs.segments = [
+            [(0, 0), (1, 1), (3, 1), (4, 0)],
+            [(4, 0), (5, 1), (7, 0), (8, 0)],
+            [(10, 0), (11, 1), (13, 1), (14, 0)],
+        ]
+        cs.to_supercubics()
+        assert [len(sc.cubics) for sc in cs.super_cubics] == [2, 1]
+
+    def test_bounds(self) -> None:
+        cs = CubicSegments(layer=None)
+        assert cs.bounds is None
+        cs.segments = [
+            [(0, 0), (1, 1), (3, 1), (4, 0)],
+            [(10, 0), (20, 0)],
+        ]
+        cs.to_supercubics()
+        assert cs.bounds == (0, 0, 20, 0.75)
+
+    def test_area(self) -> None:
+        cs = CubicSegments(layer=None)
+        assert cs.area == 0
+        assert cs.centroid is None
+        # A counter-clockwise square with a clockwise hole
+        cs.segments = [
+            [(0, 0), (10, 0)],
+            [(10, 0), (10, 10)],
+            [(10, 10), (0, 10)],
+            [(0, 10), (0, 0)],
+            [(2, 2), (2, 4)],
+            [(2, 4), (4, 4)],
+            [(4, 4), (4, 2)],
+            [(4, 2), (2, 2)],
+        ]
+        cs.to_supercubics()
+        assert cs.area == 96
+        assert [sc.direction for sc in cs.super_cubics] == [1, -1]
+        x, y = cs.centroid
+        assert x == pytest.approx((100 * 5 - 4 * 3) / 96)
+        assert y == pytest.approx(x)
+
+
+class RecordedGlyph:
+    # A minimal glyph that replays pen calls
+    def __init__(self, calls: list) -> None:
+        self.calls = calls
+
+    def draw(self, pen) -> None:
+        for method, args in self.calls:
+            getattr(pen, method)(*args)
+
+
+square_with_curve = [
+    ("moveTo", ((0, 0),)),
+    ("lineTo", ((100, 0),)),
+    ("curveTo", ((150, 0), (150, 100), (100, 100))),
+    ("lineTo", ((0, 100),)),
+    ("closePath", ()),
+]
+
+
+class PenCubicSegmentsTests(unittest.TestCase):
+    def test_extract(self) -> None:
+        cs = PenCubicSegments(RecordedGlyph(square_with_curve))
+        cs.to_supercubics()
+        assert len(cs.super_cubics) == 1
+        cubics = cs.super_cubics[0].cubics
+        # The closing line is implied
+        assert len(cubics) == 4
+        assert cubics[1].pt1 == (100, 0)
+        assert cubics[1].pt4 == (100, 100)
+        assert cubics[3].pt1 == (0, 100)
+        assert cubics[3].pt4 == (0, 0)
+
+    def test_extract_without_lines(self) -> None:
+        cs = PenCubicSegments(RecordedGlyph(square_with_curve), include_lines=False)
+        cs.extract_segments()
+        assert len(cs.super_cubics) == 1
+        assert len(cs.super_cubics[0].cubics) == 1
+
+    def test_wrap_around_start_point(self) -> None:
+        # The start point is in the middle of a run of curves, the curves before and
+        # after it must be joined into one super cubic.
+        glyph = RecordedGlyph(
+            [
+                ("moveTo", ((0, 100),)),
+                ("curveTo", ((50, 100), (100, 50), (100, 0))),
+                ("lineTo", ((-100, 0),)),
+                ("curveTo", ((-100, 50), (-50, 100), (0, 100))),
+                ("closePath", ()),
+            ]
+        )
+        cs = PenCubicSegments(glyph, include_lines=False)
+        cs.extract_segments()
+        assert len(cs.super_cubics) == 1
+        cubics = cs.super_cubics[0].cubics
+        assert [(c.pt1, c.pt4) for c in cubics] == [
+            ((-100, 0), (0, 100)),
+            ((0, 100), (100, 0)),
+        ]
+
+    def test_wrap_around_cached_values(self) -> None:
+        # Values cached on the last super cubic before the contour is closed are
+        # recalculated after the join
+        super_cubics = []
+        pen = SuperCubicPen(super_cubics, include_lines=False)
+        pen.moveTo((0, 100))
+        pen.curveTo((50, 100), (100, 50), (100, 0))
+        pen.lineTo((-100, 0))
+        pen.curveTo((-100, 50), (-50, 100), (0, 100))
+        last = pen._contour[-1]
+        assert last.bounds == (-100, 0, 0, 100)
+        assert last.t_for_point((-50, 87.5)) is not None
+        pen.closePath()
+        assert super_cubics == [last]
+        assert last.bounds == (-100, 0, 100, 100)
+        assert last.length == sum(c.length_table[-1] for c in last.cubics)
+        assert len(last.t_cache) == 0
+
+    def test_qcurve(self) -> None:
+        glyph = RecordedGlyph(
+            [
+                ("moveTo", ((0, 0),)),
+                ("qCurveTo", ((0, 30), (30, 30), (30, 0))),
+                ("closePath", ()),
+            ]
+        )
+        cs = PenCubicSegments(glyph)
+        cs.extract_segments()
+        cubics = cs.super_cubics[0].cubics
+        assert len(cubics) == 3
+        assert cubics[0].pt1 == (0, 0)
+        assert cubics[0].pt2 == (0, 20)
+        assert cubics[0].pt3 == (5, 30)
+        assert cubics[0].pt4 == (15, 30)
+        assert cubics[1].pt4 == (30, 0)
+
+    def test_qcurve_native(self) -> None:
+        glyph = RecordedGlyph(
+            [
+                ("moveTo", ((0, 0),)),
+                ("qCurveTo", ((0, 30), (30, 30), (30, 0))),
+                ("closePath", ()),
+            ]
+        )
+        cs = PenCubicSegments(glyph, convert_quadratics=False)
+        cs.extract_segments()
+        cubics = cs.super_cubics[0].cubics
+        assert [type(c) for c in cubics] == [Quadratic, Quadratic, Line]
+        assert cubics[0].points == ((0, 0), (0, 30), (15, 30))
+        assert cubics[0].pt2 == (0, 20)
+        assert cubics[0].pt3 == (5, 30)
+
+    def test_qcurve_without_oncurves(self) -> None:
+        glyph = RecordedGlyph(
+            [
+                ("qCurveTo", ((0, 10), (10, 10), (10, 0), (0, 0), None)),
+                ("closePath", ()),
+            ]
+        )
+        cs = PenCubicSegments(glyph)
+        cs.extract_segments()
+        cubics = cs.super_cubics[0].cubics
+        assert len(cubics) == 4
+        assert cubics[0].pt1 == (0, 5)
+        assert cubics[-1].pt4 == (0, 5)
+
+    def test_open_contours(self) -> None:
+        glyph = RecordedGlyph(
+            [
+                ("moveTo", ((0, 0),)),
+                ("curveTo", ((1, 1), (3, 1), (4, 0))),
+                ("endPath", ()),
+                ("moveTo", ((10, 0),)),
+                ("curveTo", ((11, 1), (13, 1), (14, 0))),
+                ("endPath", ()),
+                ("addComponent", ("a", (1, 0, 0, 1, 0, 0))),
+            ]
+        )
+        cs = PenCubicSegments(glyph)
+        cs.extract_segments()
+        assert [len(sc.cubics) for sc in cs.super_cubics] == [1, 1]
@@ -0,0 +1,141 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from fontgeometry import instrument
+from fontgeometry.cache import AnalysisCache, set_analysis_cache
+from fontgeometry.cubics import Cubic, SuperCubic
+from fontgeometry.instrument import Stats, get_stats, instrumented, timed
+
+
+def make_super_cubic() -> SuperCubic:
+    sc = SuperCubic()
+    sc.add_cubic_from_points((0, 0), (1, 1), (3, 1), (4, 0))
+    sc.add_cubic_from_points((4, 0), (5, 1), (7, 0), (8, 0))
+    return sc
+
+
+class InstrumentTests(unittest.TestCase):
+    def test_disabled(self) -> None:
+        assert get_stats() is None
+        sc = make_super_cubic()
+        sc.split_at_pt((4.5, 1))
+        instrument.count("test")
+        assert get_stats() is None
+
+    def test_instrumented(self) -> None:
+        with instrumented() as stats:
+            assert get_stats() is stats
+            sc = make_super_cubic()
+            sc.split_at_pt((2.0, 0.75))
+            sc.reset_split()
+            sc.split_at_pt((2.0, 0.75))
+        assert get_stats() is None
+
+        assert stats.calls["SuperCubic.split_at_pt"] == 2
+        assert stats.calls["SuperCubic.calculate_t_for_point"] == 1
+        assert stats.calls["BaseCubic.split_at_t"] == 2
+        assert stats.times["SuperCubic.split_at_pt"] > 0
+        assert stats.counters["SuperCubic.calculate_t_for_point.found"] == 1
+        assert stats.counters["SuperCubic.calculate_t_for_point.steps"] > 1
+        assert stats.counters["SuperCubic.t_cache.hits"] == 1
+        assert stats.counters["SuperCubic.t_cache.misses"] == 1
+        assert (
+            stats.ratio("SuperCubic.t_cache.hits", "SuperCubic.t_cache.misses") == 0.5
+        )
+
+    def test_split_at_pt_fast(self) -> None:
+        sc = SuperCubic()
+        sc.add_cubic_from_points((0, 0), (1, 2), (3, 3), (4, 4))
+        with instrumented() as stats:
+            # One solution in both directions
+            sc.split_at_pt_fast(sc.cubics[0].get_cubic_point(0.5))
+            # Not on the curve
+            sc.split_at_pt_fast((4, 0))
+        result = stats.to_dict()
+        assert result["counters"]["SuperCubic.split_at_pt_fast.fast_path"] == 1
+        assert result["counters"]["SuperCubic.split_at_pt_fast.fallback"] == 1
+        assert result["ratios"]["SuperCubic.split_at_pt_fast.fast_path_rate"] == 0.5
+
+    def test_lines(self) -> None:
+        with instrumented() as stats:
+            sc = SuperCubic()
+            sc.add_cubic_from_point_tuple([(0, 0), (3, 0)])
+        assert stats.counters["SuperCubic.add_cubic_from_point_tuple.lines"] == 1
+
+    def test_callback(self) -> None:
+        results = []
+        with instrumented(callback=results.append) as stats:
+            with instrumented() as inner:
+                Cubic((0, 0), (1, 1), (3, 1), (4, 0), raster_length=1).cubic_points
+            assert get_stats() is stats
+        assert results == [stats]
+        assert inner.calls["BaseCubic.calculate_polyline"] == 1
+        assert "BaseCubic.calculate_polyline" not in stats.calls
+
+    def test_to_json(self) -> None:
+        previous = set_analysis_cache(AnalysisCache())
+        try:
+            with instrumented() as stats:
+                Cubic((0, 0), (1, 1), (3, 1), (4, 0)).extrema
+                Cubic((0, 0), (1, 1), (3, 1), (4, 0)).extrema
+            assert stats.to_dict()["analysis_cache"]["hit_rate"] == 0.5
+        finally:
+            set_analysis_cache(previous)
+        stats.count("test", 2)
+        result = json.loads(stats.to_json())
+        assert result["counters"] == {"test": 2}
+        assert result["functions"] == {}
+        assert result["ratios"]["SuperCubic.t_cache.hit_rate"] is None
+        assert "analysis_cache" not in result
+
+        stats.clear()
+        assert stats.to_dict()["counters"] == {}
+
+    def test_timed(self) -> None:
+        @timed("square")
+        def square(x: int) -> int:
+            return x * x
+
+        assert square(3) == 9
+        stats = instrument.enable(Stats())
+        try:
+            assert square(4) == 16
+        finally:
+            instrument.disable()
+        assert stats.calls == {"square": 1}
+        assert square.__name__ == "square"
+
+    def test_threads(self) -> None:
+        def work(_: int) -> None:
+            for _ in range(1000):
+                instrument.count("test")
+                Cubic((0, 0), (1, 1), (3, 1), (4, 0)).split_at_t(0.5)
+
+        with instrumented() as stats:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                list(executor.map(work, range(8)))
+        assert stats.counters["test"] == 8000
+        assert stats.calls["BaseCubic.split_at_t"] == 8000
+
+    def test_environment(self) -> None:
+        code = (
+            "from fontgeometry.cubics import SuperCubic\n"
+            "sc = SuperCubic()\n"
+            "sc.add_cubic_from_points((0, 0), (1, 1), (3, 1), (4, 0))\n"
+            "sc.split_at_pt((2.0, 0.75))\n"
+        )
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        path = os.path.join(tmp.name, "stats.json")
+        env = dict(os.environ)
+        env[instrument.ENV_ENABLE] = "1"
+        env[instrument.ENV_FILE] = path
+        subprocess.run([sys.executable, "-c", code], env=env, check=True)
+        with open(path, encoding="utf-8") as f:
+            result = json.load(f)
+        assert result["functions"]["SuperCubic.split_at_pt"]["calls"] == 1
@@ -0,0 +1,171 @@
+import unittest
+from math import hypot
+from random import Random
+
+import pytest
+
+from fontgeometry.cubics import Cubic, SuperCubic
+from fontgeometry.extract import CubicSegments
+from fontgeometry.intersections import (
+    cubic_segments_intersections,
+    intersect_cubic_line,
+    intersect_cubics,
+    intersect_super_cubics,
+    self_intersections,
+    super_cubic_self_intersections,
+)
+
+TOLERANCE = 0.001
+
+
+def make_super_cubic(*cubics) -> SuperCubic:
+    sc = SuperCubic()
+    for points in cubics:
+        sc.add_cubic_from_points(*points)
+    return sc
+
+
+class IntersectionsTests(unittest.TestCase):
+    def assert_same_point(self, c1: Cubic, t1: float, c2: Cubic, t2: float) -> None:
+        x1, y1 = c1.get_cubic_point(t1)
+        x2, y2 = c2.get_cubic_point(t2)
+        assert hypot(x2 - x1, y2 - y1) <= 2 * TOLERANCE
+
+    def test_intersect_cubics(self) -> None:
+        c1 = Cubic((0, 0), (100, 200), (200, -100), (300, 100))
+        c2 = Cubic((0, 100), (100, -100), (200, 200), (300, 0))
+        result = intersect_cubics(c1, c2)
+        assert len(result) == 3
+        assert result[1] == (pytest.approx(0.5), pytest.approx(0.5))
+        for t1, t2 in result:
+            self.assert_same_point(c1, t1, c2, t2)
+
+    def test_intersect_cubics_disjoint(self) -> None:
+        c1 = Cubic((0, 0), (0, 100), (100, 100), (100, 0))
+        c2 = Cubic((0, 200), (0, 300), (100, 300), (100, 200))
+        assert intersect_cubics(c1, c2) == []
+
+    def test_intersect_cubics_shared_end_point(self) -> None:
+        c1 = Cubic((0, 0), (0, 100), (100, 100), (100, 0))
+        c2 = Cubic((100, 0), (100, -100), (200, -100), (200, 0))
+        assert intersect_cubics(c1, c2) == [(1.0, 0.0)]
+
+    def test_intersect_cubics_shallow(self) -> None:
+        c1 = Cubic((0, 0), (300, 400), (700, 400), (1000, 0))
+        for offset in (50, 20, 2, 0.5):
+            c2 = Cubic((0, offset), (300, 400), (700, 400), (1000, -offset))
+            assert intersect_cubics(c1, c2) == [(0.5, 0.5)]
+        c2 = Cubic((0, 0.5), (300, 400), (700, 401), (1000, -0.5))
+        result = intersect_cubics(c1, c2)
+        assert len(result) == 1
+        self.assert_same_point(c1, result[0][0], c2, result[0][1])
+
+    def test_intersect_cubics_coincident(self) -> None:
+        c1 = Cubic((0, 0), (100, 200), (200, -100), (300, 100))
+        c2 = Cubic((0, 0), (100, 200), (200, -100), (300, 100))
+        assert intersect_cubics(c1, c2) == [(0.0, 0.0), (1.0, 1.0)]
+
+    def test_intersect_cubics_random(self) -> None:
+        rnd = Random(0)
+
+        def random_cubic() -> Cubic:
+            return Cubic(
+                *[(rnd.uniform(0, 1000), rnd.uniform(0, 1000)) for _ in "1234"]
+            )
+
+        for _ in range(50):
+            c1 = random_cubic()
+            c2 = random_cubic()
+            result = intersect_cubics(c1, c2)
+            assert len(result) <= 9
+            for t1, t2 in result:
+                assert 0 <= t1 <= 1
+                assert 0 <= t2 <= 1
+                self.assert_same_point(c1, t1, c2, t2)
+
+            # The same intersections with swapped cubics
+            swapped = sorted((t2, t1) for t1, t2 in intersect_cubics(c2, c1))
+            assert len(swapped) == len(result)
+
+    def test_intersect_cubic_line(self) -> None:
+        c = Cubic((0, 0), (100, 200), (200, -100), (300, 100))
+        result = intersect_cubic_line(c, (0, 50), (300, 50))
+        assert len(result) == 3
+        for (t, u), expected in zip(result, (0.1127016653792583, 0.5, 0.8872983346)):
+            assert t == pytest.approx(expected)
+            x, y = c.get_cubic_point(t)
+            assert y == pytest.approx(50)
+            assert x == pytest.approx(u * 300)
+
+    def test_intersect_cubic_line_segment(self) -> None:
+        c = Cubic((0, 0), (100, 200), (200, -100), (300, 100))
+        assert len(intersect_cubic_line(c, (0, 50), (100, 50))) == 1
+        result = intersect_cubic_line(c, (0, 50), (100, 50), segment=False)
+        assert len(result) == 3
+        assert result[2][1] == pytest.approx(2.661895)
+
+    def test_intersect_cubic_line_degenerate(self) -> None:
+        c = Cubic((0, 0), (100, 200), (200, -100), (300, 100))
+        assert intersect_cubic_line(c, (0, 50), (0, 50)) == []
+        straight = Cubic((0, 0), (100, 0), (200, 0), (300, 0))
+        assert intersect_cubic_line(straight, (0, 0), (300, 0)) == []
+        assert intersect_cubic_line(straight, (0, 10), (300, 10)) == []
+
+    def test_self_intersections(self) -> None:
+        loop = Cubic((0, 0), (300, 300), (-100, 300), (200, 0))
+        result = self_intersections(loop)
+        assert len(result) == 1
+        t1, t2 = result[0]
+        assert t1 < t2
+        self.assert_same_point(loop, t1, loop, t2)
+        assert self_intersections(Cubic((0, 0), (0, 100), (100, 100), (100, 0))) == []
+
+    def test_super_cubic_self_intersections(self) -> None:
+        # A closed contour, the joints are not intersections
+        sc = make_super_cubic(
+            ((0, 0), (0, 100), (100, 100), (100, 0)),
+            ((100, 0), (100, -100), (0, -100), (0, 0)),
+        )
+        assert super_cubic_self_intersections(sc) == []
+
+        # A contour that crosses itself
+        sc = make_super_cubic(
+            ((0, 0), (50, 100), (150, 100), (200, 0)),
+            ((200, 0), (200, 50), (150, 150), (100, 150)),
+            ((100, 150), (100, 100), (100, 0), (100, -50)),
+        )
+        result = super_cubic_self_intersections(sc)
+        assert len(result) == 1
+        (i1, t1), (i2, t2) = result[0]
+        assert (i1, i2) == (0, 2)
+        assert t1 == pytest.approx(0.5)
+        self.assert_same_point(sc.cubics[i1], t1, sc.cubics[i2], t2)
+
+    def test_intersect_super_cubics(self) -> None:
+        sc1 = make_super_cubic(
+            ((0, 0), (0, 100), (100, 100), (100, 0)),
+            ((100, 0), (100, -100), (0, -100), (0, 0)),
+        )
+        sc2 = make_super_cubic(((50, -200), (50, -50), (50, 50), (50, 200)))
+        result = intersect_super_cubics(sc1, sc2)
+        assert [(i1, i2) for (i1, _), (i2, _) in result] == [(0, 0), (1, 0)]
+        for (i1, t1), (i2, t2) in result:
+            self.assert_same_point(sc1.cubics[i1], t1, sc2.cubics[i2], t2)
+
+    def test_cubic_segments_intersections(self) -> None:
+        segments = CubicSegments(layer=None)
+        segments.segments = [
+            ((0, 0), (0, 100), (100, 100), (100, 0)),
+            ((100, 0), (100, -100), (0, -100), (0, 0)),
+            ((50, -200), (50, -50), (50, 50), (50, 200)),
+            ((50, 200), (300, 300), (-100, 300), (200, 200)),
+        ]
+        segments.to_supercubics()
+        result = cubic_segments_intersections(segments)
+        keys = [(k1, k2) for (k1, _), (k2, _) in result]
+        # The two crossings of the vertical curve, and the loop of the last cubic
+        assert keys == [
+            ((0, 0), (1, 0)),
+            ((0, 1), (1, 0)),
+            ((1, 1), (1, 1)),
+        ]
@@ -0,0 +1,194 @@
+import unittest
+
+import pytest
+
+from fontgeometry.cubics import SuperCubic
+from fontgeometry.extract import CubicSegments, PenCubicSegments
+from fontgeometry.pipeline import (
+    OutlineAnalysis,
+    pack_segments,
+    pack_super_cubics,
+    process_outlines,
+    process_outlines_threaded,
+    unpack_segments,
+    unpack_super_cubics,
+)
+
+outline = [
+    [(0, 0), (1, 1), (3, 1), (4, 0)],
+    [(4, 0), (5, 1), (7, 0), (8, 0)],
+    [(8, 0), (0, 0)],
+]
+
+
+def count_cubics(segments: CubicSegments) -> int:
+    return sum(len(sc.cubics) for sc in segments.super_cubics)
+
+
+def describe_super_cubics(segments: CubicSegments) -> list:
+    return [
+        [
+            (type(c).__name__, c.pt1, c.pt2, c.pt3, c.pt4, c.raster_length)
+            for c in sc.cubics
+        ]
+        for sc in segments.super_cubics
+    ]
+
+
+class Glyph:
+    def draw(self, pen) -> None:
+        # A contour with a cubic, a line and a quadratic
+        pen.moveTo((0, 0))
+        pen.curveTo((10, 10), (30, 10), (40, 0))
+        pen.lineTo((40, -20))
+        pen.qCurveTo((20, -40), (0, 0))
+        pen.closePath()
+        # A contour that starts where the previous one ended
+        pen.moveTo((0, 0))
+        pen.lineTo((-10, 0))
+        pen.curveTo((-10, 10), (-5, 10), (0, 0))
+        pen.closePath()
+
+
+class ListSegments(CubicSegments):
+    def extract_segments(self) -> None:
+        self.segments = self.layer
+
+
+class PipelineTests(unittest.TestCase):
+    def test_pack_segments(self) -> None:
+        payload = pack_segments(outline)
+        assert len(payload[0]) == 20
+        assert payload[1] == bytes((4, 4, 2))
+        assert unpack_segments(payload) == outline
+
+    def test_pack_super_cubics(self) -> None:
+        segments = PenCubicSegments(Glyph(), raster_length=2, convert_quadratics=False)
+        segments.extract_segments()
+        payload = pack_super_cubics(segments.super_cubics)
+        assert payload.sizes == bytes((4, 2, 3, 2, 4))
+        assert list(payload.starts) == [0, 3]
+        assert payload.settings == (2, None, None)
+        rebuilt = CubicSegments(layer=None)
+        rebuilt.super_cubics = unpack_super_cubics(payload)
+        assert describe_super_cubics(rebuilt) == describe_super_cubics(segments)
+
+    def test_pack_super_cubics_line_settings(self) -> None:
+        sc = SuperCubic()
+        sc.add_line_from_points((0, 0), (4, 0), 2, 1e-6)
+        sc.add_cubic_from_points((4, 0), (5, 1), (7, 0), (8, 0), 2, 1e-6)
+        payload = pack_super_cubics([sc])
+        # The settings are taken from the first segment, a line
+        assert payload.settings == (2, 1e-6, None)
+        rebuilt = unpack_super_cubics(payload)[0]
+        assert rebuilt.cubics[1].length_tolerance == 1e-6
+
+    def test_in_process(self) -> None:
+        results = list(process_outlines([outline, outline[:1]], max_workers=0))
+        assert [index for index, _ in results] == [0, 1]
+        index, analysis = results[1]
+        assert isinstance(analysis, OutlineAnalysis)
+        assert analysis.extremum_points == [[(2.0, 0.75)]]
+        assert analysis.inflection_points == [[]]
+
+    def test_custom_analysis(self) -> None:
+        results = list(
+            process_outlines([outline] * 3, analyze=count_cubics, max_workers=0)
+        )
+        assert results == [(0, 3), (1, 3), (2, 3)]
+
+    def test_cubic_segments_input(self) -> None:
+        results = list(
+            process_outlines(
+                [ListSegments(outline), pack_segments(outline[:2])],
+                analyze=count_cubics,
+                max_workers=0,
+            )
+        )
+        assert results == [(0, 3), (1, 2)]
+
+    def test_pen_segments_input(self) -> None:
+        class Glyph:
+            def draw(self, pen) -> None:
+                pen.moveTo((0, 0))
+                pen.curveTo((1, 1), (3, 1), (4, 0))
+                pen.closePath()
+
+        results = list(
+            process_outlines(
+                [PenCubicSegments(Glyph())], analyze=count_cubics, max_workers=0
+            )
+        )
+        assert results == [(0, 2)]
+
+    def test_pen_segments_pipelines(self) -> None:
+        # Both pipelines build the same super cubics as the pen, also if the contours
+        # touch, and if the first and last super cubics of a contour are joined
+        def outlines(include_lines: bool) -> list:
+            return [
+                PenCubicSegments(
+                    Glyph(),
+                    include_lines=include_lines,
+                    raster_length=2,
+                    convert_quadratics=False,
+                )
+                for _ in range(3)
+            ]
+
+        expected = {}
+        for include_lines in (True, False):
+            segments = outlines(include_lines)[0]
+            segments.extract_segments()
+            expected[include_lines] = [
+                (i, describe_super_cubics(segments)) for i in range(3)
+            ]
+            assert len(segments.super_cubics) == 2
+
+        # Fork the worker processes before any threads are started
+        for process in (process_outlines, process_outlines_threaded):
+            for include_lines in (True, False):
+                for max_workers in (0, 2):
+                    results = process(
+                        outlines(include_lines),
+                        analyze=describe_super_cubics,
+                        max_workers=max_workers,
+                    )
+                    assert list(results) == expected[include_lines]
+
+    def test_parallel_ordered(self) -> None:
+        outlines = [outline[: i % 3 + 1] for i in range(50)]
+        results = list(
+            process_outlines(
+                outlines, analyze=count_cubics, max_workers=2, chunk_size=3
+            )
+        )
+        assert results == [(i, i % 3 + 1) for i in range(50)]
+
+    def test_parallel_streaming(self) -> None:
+        outlines = [outline[: i % 3 + 1] for i in range(50)]
+        results = process_outlines(
+            outlines, analyze=count_cubics, max_workers=2, chunk_size=4, ordered=False
+        )
+        assert sorted(results) == [(i, i % 3 + 1) for i in range(50)]
+
+    def test_chunk_size(self) -> None:
+        with pytest.raises(ValueError):
+            list(process_outlines([outline], chunk_size=0))
+
+    def test_threaded(self) -> None:
+        outlines = [outline[: i % 3 + 1] for i in range(50)]
+        outlines[0] = ListSegments(outline)
+        outlines[1] = pack_segments(outline[:2])
+        expected = [(i, i % 3 + 1) for i in range(50)]
+        expected[0] = (0, 3)
+        for max_workers in (0, 4):
+            results = list(
+                process_outlines_threaded(
+                    outlines, analyze=count_cubics, max_workers=max_workers
+                )
+            )
+            assert results == expected
+
+    def test_threaded_default_analysis(self) -> None:
+        results = list(process_outlines_threaded([outline, outline[:1]]))
+        assert results == list(process_outlines([outline, outline[:1]], max_workers=0))
@@ -0,0 +1,63 @@
+import unittest
+from random import Random
+
+import pytest
+
+from fontgeometry.beziertools import getPointListForCubic, getPointOnCubic
+from fontgeometry.cubics import Cubic
+from fontgeometry.ftbeziertools import calcCubicParameters
+from fontgeometry.prepared import PreparedCubic
+
+CURVE = ((0, 0), (1, 1), (3, 1), (4, 0))
+
+
+class PreparedCubicTests(unittest.TestCase):
+    def test_params(self) -> None:
+        pc = PreparedCubic(*CURVE)
+        assert pc.params == calcCubicParameters(*CURVE)
+
+    def test_point(self) -> None:
+        pc = PreparedCubic(*CURVE)
+        assert pc.point(0) == (0, 0)
+        assert pc.point(1) == (4, 0)
+        assert pc.point(0.5) == (2.0, 0.75)
+        assert pc.points([0, 0.25, 1]) == [(0, 0), (0.90625, 0.5625), (4, 0)]
+
+    def test_point_random(self) -> None:
+        rnd = Random(0)
+        ts = [rnd.random() for _ in range(20)]
+        for _ in range(50):
+            curve = [
+                (rnd.uniform(-1000, 1000), rnd.uniform(-1000, 1000)) for _ in "1234"
+            ]
+            pc = PreparedCubic(*curve)
+            for (x, y), (ex, ey) in zip(
+                pc.points(ts), getPointListForCubic(ts, *curve)
+            ):
+                assert x == pytest.approx(ex, abs=1e-9)
+                assert y == pytest.approx(ey, abs=1e-9)
+            for t in ts:
+                assert pc.point(t) == pytest.approx(getPointOnCubic(t, *curve))
+
+    def test_derivatives(self) -> None:
+        pc = PreparedCubic(*CURVE)
+        assert pc.derivative(0) == (3, 3)
+        assert pc.derivative(1) == (3, -3)
+        assert pc.derivative(0.5) == (4.5, 0.0)
+        assert pc.second_derivative(0.5) == (0.0, -6.0)
+        assert pc.speed(0) == pytest.approx(18**0.5)
+
+    def test_curvature(self) -> None:
+        pc = PreparedCubic(*CURVE)
+        # Turning clockwise
+        assert pc.curvature(0.5) == pytest.approx(-6 / 4.5**2)
+        # A straight line
+        assert PreparedCubic((0, 0), (1, 0), (2, 0), (3, 0)).curvature(0.3) == 0.0
+        # A point
+        assert PreparedCubic((1, 1), (1, 1), (1, 1), (1, 1)).curvature(0.5) == 0.0
+
+    def test_cubic_prepared(self) -> None:
+        c = Cubic(*CURVE)
+        assert c.prepared.params == c.params
+        assert c.get_cubic_speed(0.5) == 4.5
+        assert c.get_cubic_curvature(0.5) == pytest.approx(-6 / 4.5**2)
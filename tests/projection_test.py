@@ -0,0 +1,122 @@
+import unittest
+from math import hypot
+from random import Random
+
+import pytest
+
+from fontgeometry.beziertools import getPointListForCubic
+from fontgeometry.cubics import Cubic
+from fontgeometry.ftbeziertools import calcCubicParameters
+from fontgeometry.projection import (
+    project_point_on_cubic_parameters,
+    project_point_on_cubics,
+    project_points_on_cubics,
+)
+
+
+class ProjectionTests(unittest.TestCase):
+    def test_project_on_curve(self) -> None:
+        params = calcCubicParameters((0, 0), (1, 1), (3, 1), (4, 0))
+        t, d = project_point_on_cubic_parameters(params, (2.0, 0.75))
+        assert t == pytest.approx(0.5, abs=1e-9)
+        assert d == pytest.approx(0.0, abs=1e-9)
+
+    def test_project_off_curve(self) -> None:
+        params = calcCubicParameters((0, 0), (1, 1), (3, 1), (4, 0))
+        t, d = project_point_on_cubic_parameters(params, (2.0, 5.0))
+        assert t == pytest.approx(0.5, abs=1e-9)
+        assert d == pytest.approx(4.25, abs=1e-9)
+
+    def test_project_end_points(self) -> None:
+        params = calcCubicParameters((0, 0), (1, 1), (3, 1), (4, 0))
+        assert project_point_on_cubic_parameters(params, (-1, -1)) == (
+            0.0,
+            pytest.approx(2**0.5),
+        )
+        t, _d = project_point_on_cubic_parameters(params, (5, -1))
+        assert t == 1.0
+
+    def test_project_random(self) -> None:
+        # Compare with a brute force search
+        rnd = Random(0)
+        ts = [i / 20000 for i in range(20001)]
+        for _ in range(50):
+            curve = [(rnd.uniform(0, 1000), rnd.uniform(0, 1000)) for _ in range(4)]
+            pt = (rnd.uniform(0, 1000), rnd.uniform(0, 1000))
+            points = getPointListForCubic(ts, *curve)
+            reference = min(hypot(p[0] - pt[0], p[1] - pt[1]) for p in points)
+            _t, d = project_point_on_cubic_parameters(calcCubicParameters(*curve), pt)
+            assert d <= reference + 1e-6
+
+    def test_project_newton_fallback(self) -> None:
+        # Newton stops at the sample t = 0.1, where the second derivative of the
+        # squared distance is negative
+        params = calcCubicParameters(
+            (302.9, 326.5), (472.3, 101.2), (516.2, 946.9), (118.0, 967.7)
+        )
+        t, d = project_point_on_cubic_parameters(params, (342.03, 323.56))
+        assert t == pytest.approx(0.04368, abs=1e-4)
+        assert d == pytest.approx(27.1529, abs=1e-4)
+
+    def test_project_point_on_cubics(self) -> None:
+        cubics = [
+            Cubic((0, 0), (1, 1), (3, 1), (4, 0)),
+            Cubic((4, 0), (5, 1), (7, 0), (8, 0)),
+        ]
+        index, t, d = project_point_on_cubics(cubics, (6, 2))
+        assert index == 1
+        assert 0 < t < 1
+        assert d == pytest.approx(
+            hypot(*(a - b for a, b in zip(cubics[1].get_cubic_point(t), (6, 2))))
+        )
+        index, t, d = project_point_on_cubics(cubics, (2, 2), start_index=1)
+        assert index == 1
+        assert project_point_on_cubics(cubics, (2, 2), start_index=2) is None
+
+    def test_project_points_on_cubics(self) -> None:
+        # A loop, the points in the second half are also close to the first half
+        cubics = [
+            Cubic((0, 0), (300, 300), (-100, 300), (200, 0)),
+            Cubic((200, 0), (300, -100), (400, 100), (500, 0)),
+        ]
+        ts = [(0, 0.2), (0, 0.4), (0, 0.8), (0, 1.0), (1, 0.5)]
+        points = [cubics[index].get_cubic_point(t) for index, t in ts]
+        result = project_points_on_cubics(cubics, points, tolerance=0.01)
+        assert [index for index, _, _ in result] == [0, 0, 0, 0, 1]
+        for (_, t, d), (_, expected) in zip(result, ts):
+            assert t == pytest.approx(expected, abs=1e-6)
+            assert d == pytest.approx(0, abs=1e-6)
+
+    def test_project_points_on_cubics_self_intersection(self) -> None:
+        # The loop crosses itself at t = 0.067 and t = 0.933
+        cubics = [
+            Cubic((0, 0), (300, 300), (-200, 300), (100, 0)),
+            Cubic((100, 0), (200, -100), (300, 100), (400, 0)),
+        ]
+        crossing = (50, cubics[0].get_cubic_point(0.0669880938047216)[1])
+        points = [crossing, cubics[0].get_cubic_point(0.5), crossing]
+        result = project_points_on_cubics(cubics, points)
+        assert [index for index, _, _ in result] == [0, 0, 0]
+        assert result[0][1] == pytest.approx(0.067, abs=1e-3)
+        assert result[2][1] == pytest.approx(0.933, abs=1e-3)
+        assert result[2][2] == pytest.approx(0, abs=1e-3)
+
+    def test_project_t_min(self) -> None:
+        params = calcCubicParameters((0, 0), (300, 300), (-200, 300), (100, 0))
+        t, d = project_point_on_cubic_parameters(params, (100, -10), t_min=0.5)
+        assert t == 1.0
+        assert d == pytest.approx(10)
+        t, d = project_point_on_cubic_parameters(params, (50, 230), t_min=0.5)
+        assert t == 0.5
+        assert d == pytest.approx(5)
+
+    def test_project_points_on_cubics_ordered(self) -> None:
+        cubics = [
+            Cubic((0, 0), (1, 1), (3, 1), (4, 0)),
+            Cubic((4, 0), (5, 1), (7, 0), (8, 0)),
+        ]
+        # The second point is before the first one, it is moved to the first one
+        result = project_points_on_cubics(cubics, [(6, 2), (2, 2)])
+        assert result[0][0] == 1
+        assert result[1][:2] == result[0][:2]
+        assert project_points_on_cubics([], [(0, 0)]) == []
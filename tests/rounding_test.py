@@ -1,8 +1,29 @@
+import importlib
 import unittest
+from decimal import (
+    ROUND_HALF_EVEN,
+    ROUND_HALF_UP,
+    Context,
+    Decimal,
+    DefaultContext,
+    getcontext,
+    setcontext,
+)
+from random import Random
 
 import pytest
 
-from fontgeometry.rounding import round_hup
+import fontgeometry.rounding
+from fontgeometry.rounding import round_hup, round_points
+
+
+def round_hup_decimal(value: float) -> int:
+    # The reference implementation using Decimal
+    return int(
+        Context(prec=400, rounding=ROUND_HALF_UP).quantize(
+            Decimal(str(value)), Decimal(1)
+        )
+    )
 
 
 class CubicSegmentsTests(unittest.TestCase):
@@ -55,3 +76,52 @@ class CubicSegmentsTests(unittest.TestCase):
         result = round_hup(2.5)
         assert result == 3
         assert isinstance(result, int)
+
+    def test_almost_half(self) -> None:
+        assert round_hup(0.49999999999999994) == 0
+        assert round_hup(-0.49999999999999994) == 0
+        assert round_hup(2.4999999999999996) == 2
+        assert round_hup(2.5000000000000004) == 3
+
+    def test_large(self) -> None:
+        assert round_hup(4503599627370497.0) == 4503599627370497
+        assert round_hup(4.205068472749736e19) == 42050684727497360000
+        assert round_hup(-1e300) == -(10**300)
+
+    def test_int(self) -> None:
+        result = round_hup(7)
+        assert result == 7
+        assert isinstance(result, int)
+
+    def test_random_corpus(self) -> None:
+        rnd = Random(0)
+        values = []
+        for _ in range(20000):
+            values.append(rnd.uniform(-20000, 20000))
+            # Halves and their neighbours
+            half = rnd.randint(-20000, 20000) + 0.5
+            values.extend((half, half + 1e-12, half - 1e-12))
+            # Small and large magnitudes
+            values.append(rnd.uniform(-1, 1) * 10 ** rnd.randint(-20, 20))
+            # Values with few decimal places, as used in font coordinates
+            values.append(round(rnd.uniform(-2000, 2000), rnd.randint(0, 3)))
+        for value in values:
+            assert round_hup(value) == round_hup_decimal(value), value
+
+    def test_default_context(self) -> None:
+        # Importing the module must not change the decimal context
+        default_rounding = DefaultContext.rounding
+        context = getcontext().copy()
+        try:
+            DefaultContext.rounding = ROUND_HALF_EVEN
+            getcontext().rounding = ROUND_HALF_EVEN
+            importlib.reload(fontgeometry.rounding)
+            assert DefaultContext.rounding == ROUND_HALF_EVEN
+            assert getcontext().rounding == ROUND_HALF_EVEN
+        finally:
+            DefaultContext.rounding = default_rounding
+            setcontext(context)
+
+    def test_round_points(self) -> None:
+        assert round_points([(0.5, -0.5), (1.4, 2.5)]) == [(1, -1), (1, 3)]
+        assert round_points([]) == []
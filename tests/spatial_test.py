@@ -0,0 +1,79 @@
+import unittest
+from random import Random
+
+import pytest
+
+from fontgeometry.cubics import SuperCubic
+from fontgeometry.extract import CubicSegments
+from fontgeometry.projection import project_point_on_cubics
+from fontgeometry.spatial import SegmentIndex
+
+
+def make_super_cubic() -> SuperCubic:
+    sc = SuperCubic()
+    sc.add_cubic_from_points((0, 0), (1, 1), (3, 1), (4, 0))
+    sc.add_cubic_from_points((4, 0), (5, 1), (7, 0), (8, 0))
+    sc.add_cubic_from_points((8, 0), (8, -2), (4, -4), (0, 0))
+    return sc
+
+
+class SegmentIndexTests(unittest.TestCase):
+    def test_bounds(self) -> None:
+        index = SegmentIndex.from_super_cubic(make_super_cubic())
+        assert len(index) == 3
+        assert index.bounds[0] == (0, 0, 4, 0.75)
+
+    def test_query_point(self) -> None:
+        index = SegmentIndex.from_super_cubic(make_super_cubic())
+        assert index.query_point((2, 0.5)) == [0]
+        assert index.query_point((2, 1)) == []
+        assert index.query_point((2, 1), tolerance=0.5) == [0]
+        assert index.query_point((4, 0)) == [0, 1, 2]
+        assert index.query_point((100, 100)) == []
+
+    def test_query_rect(self) -> None:
+        index = SegmentIndex.from_super_cubic(make_super_cubic())
+        assert index.query_rect((5, -1, 6, 1)) == [1, 2]
+        assert index.query_rect((-10, -10, 10, 10)) == [0, 1, 2]
+
+    def test_nearest(self) -> None:
+        sc = make_super_cubic()
+        index = SegmentIndex.from_super_cubic(sc, cell_size=1)
+        key, t, d = index.nearest((2, 5))
+        assert key == 0
+        assert t == pytest.approx(0.5)
+        assert d == pytest.approx(4.25)
+        assert index.nearest((100, -100))[0] == 2
+
+    def test_nearest_random(self) -> None:
+        # Compare with a search over all cubics
+        rnd = Random(0)
+        sc = SuperCubic()
+        pt = (0.0, 0.0)
+        for _ in range(100):
+            p2, p3, p4 = [
+                (pt[0] + rnd.uniform(-50, 50), pt[1] + rnd.uniform(-50, 50))
+                for _ in range(3)
+            ]
+            sc.add_cubic_from_points(pt, p2, p3, p4)
+            pt = p4
+        index = SegmentIndex.from_super_cubic(sc)
+        for _ in range(100):
+            query = (rnd.uniform(-300, 300), rnd.uniform(-300, 300))
+            _key, _t, d = index.nearest(query)
+            assert d == pytest.approx(project_point_on_cubics(sc.cubics, query)[2])
+
+    def test_empty(self) -> None:
+        index = SegmentIndex()
+        assert index.nearest((0, 0)) is None
+        assert index.query_point((0, 0)) == []
+
+    def test_from_cubic_segments(self) -> None:
+        cs = CubicSegments(layer=None)
+        cs.segments = [
+            [(0, 0), (1, 1), (3, 1), (4, 0)],
+            [(10, 10), (11, 11), (13, 11), (14, 10)],
+        ]
+        cs.to_supercubics()
+        index = SegmentIndex.from_cubic_segments(cs)
+        assert index.query_point((12, 10.5)) == [(1, 0)]
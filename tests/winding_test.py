@@ -0,0 +1,115 @@
+import unittest
+from math import hypot
+from random import Random
+
+import pytest
+
+from fontgeometry.cubics import SuperCubic
+from fontgeometry.extract import CubicSegments
+from fontgeometry.winding import WindingIndex
+
+
+class ListSegments(CubicSegments):
+    def extract_segments(self) -> None:
+        self.segments = self.layer
+
+
+# An "o": A counter-clockwise outer contour and a clockwise inner contour
+outer = [
+    [(50, 0), (80, 0), (100, 20), (100, 50)],
+    [(100, 50), (100, 80), (80, 100), (50, 100)],
+    [(50, 100), (20, 100), (0, 80), (0, 50)],
+    [(0, 50), (0, 20), (20, 0), (50, 0)],
+]
+inner = [
+    [(50, 20), (30, 20), (20, 30), (20, 50)],
+    [(20, 50), (20, 70), (30, 80), (50, 80)],
+    [(50, 80), (70, 80)],
+    [(70, 80), (80, 80), (80, 50)],
+    [(80, 50), (80, 30), (70, 20), (50, 20)],
+]
+
+
+def make_segments(*contours) -> CubicSegments:
+    segments = ListSegments([segment for contour in contours for segment in contour])
+    segments.extract_segments()
+    segments.to_supercubics()
+    return segments
+
+
+def ray_cast(polygons, pt) -> int:
+    # The winding number of the flattened contours
+    x, y = pt
+    winding = 0
+    for points in polygons:
+        for (x0, y0), (x1, y1) in zip(points, points[1:] + points[:1]):
+            if y0 <= y < y1 or y1 <= y < y0:
+                xc = x0 + (y - y0) * (x1 - x0) / (y1 - y0)
+                if xc > x:
+                    winding += 1 if y1 > y0 else -1
+    return winding
+
+
+class WindingIndexTests(unittest.TestCase):
+    def test_pieces(self) -> None:
+        sc = SuperCubic()
+        sc.add_cubic_from_points((0, 0), (0, 10), (10, 10), (10, 0))
+        sc.add_line_from_points((10, 0), (0, 0))
+        index = WindingIndex.from_super_cubics([sc])
+        # The curve is split at its top, the horizontal line is omitted
+        assert len(index) == 2
+        assert [p.direction for p in index.pieces] == [1, -1]
+
+    def test_winding_number(self) -> None:
+        index = WindingIndex.from_cubic_segments(make_segments(outer, inner))
+        assert index.winding_number((10, 50)) == 1
+        assert index.winding_number((50, 50)) == 0
+        assert index.winding_number((50, 10)) == 1
+        assert index.winding_number((85, 85)) == 1
+        assert index.winding_number((99, 99)) == 0
+        assert index.winding_number((150, 50)) == 0
+        assert index.winding_number((50, -10)) == 0
+        # Through the extrema
+        assert index.winding_number((-10, 50)) == 0
+        assert index.winding_number((10, 80)) == 1
+
+    def test_reversed(self) -> None:
+        clockwise = [
+            [segment[3], segment[2], segment[1], segment[0]] for segment in outer[::-1]
+        ]
+        index = WindingIndex.from_cubic_segments(make_segments(clockwise))
+        assert index.winding_number((50, 50)) == -1
+        index = WindingIndex.from_cubic_segments(make_segments(outer, outer))
+        assert index.winding_number((50, 50)) == 2
+        assert index.contains((50, 50))
+        assert not index.contains((50, 50), fill_rule="evenodd")
+        with pytest.raises(ValueError):
+            index.contains((50, 50), fill_rule="winding")
+
+    def test_ray_cast(self) -> None:
+        segments = make_segments(outer, inner)
+        index = WindingIndex.from_cubic_segments(segments)
+        polygons = []
+        for sc in segments.super_cubics:
+            points = []
+            for cubic in sc.cubics:
+                points.extend(cubic.cubic_points[:-1])
+            polygons.append(points)
+        vertices = [pt for points in polygons for pt in points]
+
+        rnd = Random(0)
+        points = []
+        while len(points) < 300:
+            pt = (rnd.uniform(-10, 110), rnd.uniform(-10, 110))
+            # Skip points close to the outline
+            if min(hypot(pt[0] - x, pt[1] - y) for x, y in vertices) > 1:
+                points.append(pt)
+        expected = [ray_cast(polygons, pt) for pt in points]
+        assert [index.winding_number(pt) for pt in points] == expected
+        assert index.winding_numbers(points) == expected
+        assert index.contains_points(points) == [w != 0 for w in expected]
+
+    def test_empty(self) -> None:
+        index = WindingIndex()
+        assert index.winding_number((0, 0)) == 0
+        assert index.winding_numbers([(0, 0), (1, 1)]) == [0, 0]